@@ -59,8 +59,52 @@ DEFAULT_CONFIG = {
     "enable_dnd": 1,
     "convert_ass_comments": 0,
     "delete_converted_temp_files": 0,
+    "batched_stage_execution": 0,
+    "streaming_mode": 0,
+    "streaming_window_lines": 20000,
+    "parallel_mode": 0,
+    "parallel_workers": 0,
+    "parallel_backend": "process",
+    "intra_file_parallelism": 0,
+    "intra_file_chunk_lines": 50000,
+    "pipelined_io": 0,
+    "pipeline_prefetch_files": 4,
+    "log_rotate_mb": 0,
+    "change_journal_format": "text",
+    "prewarm_rules": 1,
+    "line_cache_entries": 20000,
+    "output_cache": 0,
+    "output_cache_dir": "",
+    "output_cache_max_mb": 1024,
+    "run_ledger": 0,
+    "resume_run": 0,
+    "compiled_line_pipeline": 1,
 }
 
+# Engine settings without a widget in the GUI; they are edited in config.json and kept on save
+ENGINE_OPTION_KEYS = (
+    "batched_stage_execution",
+    "streaming_mode",
+    "streaming_window_lines",
+    "parallel_mode",
+    "parallel_workers",
+    "parallel_backend",
+    "intra_file_parallelism",
+    "intra_file_chunk_lines",
+    "pipelined_io",
+    "pipeline_prefetch_files",
+    "log_rotate_mb",
+    "change_journal_format",
+    "prewarm_rules",
+    "line_cache_entries",
+    "output_cache",
+    "output_cache_dir",
+    "output_cache_max_mb",
+    "run_ledger",
+    "resume_run",
+    "compiled_line_pipeline",
+)
+
 # Determine configuration directory based on OS
 if sys.platform == "win32":
     CONFIG_DIR = os.path.join(os.getenv("LOCALAPPDATA", "/tmp"), APP_NAME)
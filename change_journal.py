@@ -0,0 +1,109 @@
+import os
+import sys
+import json
+import difflib
+
+# Version of the JSONL change journal layout, written in the header record of every flush
+JOURNAL_FORMAT_VERSION = 1
+# Approximate serialized size of one edit op besides its replacement text
+OP_OVERHEAD = 8
+
+
+def format_log_message(message):
+    """Renders a subtitle log message; line changes are kept as (index, option, before, after) until written."""
+    if isinstance(message, str):
+        return message
+    index, opt_name, before, after = message
+    b_clean = before.rstrip("\n")
+    c_clean = after.rstrip("\n")
+    return f"Line {index} modified | Option: {opt_name} | Before: |{b_clean}| -> After: |{c_clean}|"
+
+
+def diff_ops(before, after):
+    """
+    Returns the [start, end, replacement] edit ops turning before into after, with offsets into before.
+    The changed span between the common prefix and suffix is split into smaller ops when that is shorter,
+    e.g. for a stage that replaces scattered characters across the line.
+    """
+    prefix = len(os.path.commonprefix((before, after)))
+    max_suffix = min(len(before), len(after)) - prefix
+    suffix = len(os.path.commonprefix((before[::-1][:max_suffix], after[::-1][:max_suffix])))
+    before_end = len(before) - suffix
+    after_end = len(after) - suffix
+    ops = [[prefix, before_end, after[prefix:after_end]]]
+    if before_end - prefix > 1 and after_end - prefix > 1:
+        matcher = difflib.SequenceMatcher(None, before[prefix:before_end], after[prefix:after_end], autojunk=False)
+        split_ops = [
+            [prefix + i1, prefix + i2, after[prefix + j1 : prefix + j2]]
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+            if tag != "equal"
+        ]
+        if sum(len(op[2]) + OP_OVERHEAD for op in split_ops) < len(ops[0][2]) + OP_OVERHEAD:
+            ops = split_ops
+    return ops
+
+
+def apply_ops(text, ops):
+    for start, end, replacement in reversed(ops):
+        text = text[:start] + replacement + text[end:]
+    return text
+
+
+def journal_lines(filename, entries):
+    """
+    Yields the JSONL records for a file's (timestamp, message) log entries. A record only carries
+    the timestamp when it differs from the previous record's, and a change record only carries the
+    line text when it differs from the line's state after its previous change record; otherwise
+    the reader replays the edit ops on that state.
+    """
+    yield json.dumps({"file": filename, "format": JOURNAL_FORMAT_VERSION}, ensure_ascii=False) + "\n"
+    line_states = {}
+    last_timestamp = None
+    for timestamp, message in entries:
+        record = {}
+        if timestamp != last_timestamp:
+            record["t"] = last_timestamp = timestamp
+        if isinstance(message, str):
+            record["msg"] = message
+        else:
+            index, opt_name, before, after = message
+            before = before.rstrip("\n")
+            after = after.rstrip("\n")
+            record["line"] = index
+            record["stage"] = opt_name
+            if line_states.get(index) != before:
+                record["before"] = before
+            record["ops"] = diff_ops(before, after)
+            line_states[index] = after
+        yield json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def render_journal(journal_file):
+    """Yields the human-readable changelog lines ("[timestamp] message") for the lines of a JSONL journal."""
+    line_states = {}
+    timestamp = ""
+    for raw_line in journal_file:
+        if not raw_line.strip():
+            continue
+        record = json.loads(raw_line)
+        if "file" in record:
+            # Every flush starts over with full line text and timestamps
+            line_states = {}
+            continue
+        timestamp = record.get("t", timestamp)
+        if "msg" in record:
+            yield f"[{timestamp}] {record['msg']}"
+            continue
+        index = record["line"]
+        before = record.get("before", line_states.get(index, ""))
+        after = apply_ops(before, record["ops"])
+        line_states[index] = after
+        yield f"[{timestamp}] {format_log_message((index, record['stage'], before, after))}"
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("usage: change_journal.py FILE_changelogs.jsonl")
+    with open(sys.argv[1], "r", encoding="utf-8") as f:
+        for text_line in render_journal(f):
+            print(text_line)
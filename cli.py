@@ -0,0 +1,157 @@
+"""
+Headless command line entry point around SubtitleProcessor. It never imports the GUI modules,
+so it runs on machines without a display:
+
+    python cli.py [--config config.json] [--set key=value ...] INPUT [INPUT ...]
+
+INPUT is a subtitle file, a folder, a glob pattern or "-" to read one subtitle from stdin and
+write the processed subtitle to stdout. Per-file results are reported as JSON on stdout
+(on stderr when stdout carries the subtitle).
+"""
+
+import argparse
+import glob
+import multiprocessing
+from core import *
+
+EXIT_OK = 0
+EXIT_FILES_FAILED = 1
+EXIT_USAGE = 2
+
+SUBTITLE_EXTENSIONS = (".srt", ".txt", ".vtt", ".ass")
+
+
+class UsageError(Exception):
+    pass
+
+
+def parse_option_value(key, value):
+    """Parses a --set value as JSON (numbers, strings in quotes, ...), falling back to the raw string."""
+    if key not in DEFAULT_CONFIG:
+        raise UsageError(f"Unknown option: {key}")
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def load_options(config_path, assignments):
+    options = DEFAULT_CONFIG.copy()
+    if config_path:
+        try:
+            with open(config_path, "r", encoding="utf-8") as f:
+                options.update(json.load(f))
+        except (OSError, ValueError) as e:
+            raise UsageError(f"Could not read config {config_path}: {e}")
+    for assignment in assignments:
+        key, separator, value = assignment.partition("=")
+        if not separator:
+            raise UsageError(f"Expected KEY=VALUE, got: {assignment}")
+        options[key.strip()] = parse_option_value(key.strip(), value)
+    return options
+
+
+def collect_inputs(inputs):
+    """Splits the inputs into folders and files; globs are expanded and "-" stands for stdin."""
+    folders, files, use_stdin = [], [], False
+    for item in inputs:
+        if item == "-":
+            use_stdin = True
+        elif os.path.isdir(item):
+            folders.append(os.path.abspath(item))
+        elif glob.has_magic(item):
+            matches = sorted(glob.glob(item))
+            if not matches:
+                raise UsageError(f"No files match: {item}")
+            for match in matches:
+                if os.path.isdir(match):
+                    folders.append(os.path.abspath(match))
+                else:
+                    files.append(os.path.abspath(match))
+        else:
+            files.append(os.path.abspath(item))
+    return folders, files, use_stdin
+
+
+def run_processor(processor, report):
+    processor.run()
+    for file_path, result in processor.file_results.items():
+        report["files"].append(dict(file=file_path, **result))
+    report["lines_processed"] += processor.total_lines_processed
+    if processor.output_cache is not None:
+        output_cache_report = report.setdefault("output_cache", {"hits": 0, "misses": 0})
+        output_cache_report["hits"] += processor.output_cache_hits
+        output_cache_report["misses"] += processor.output_cache_misses
+
+
+def process_stdin(options, stdin_format, report):
+    """Processes one subtitle read from stdin in a temporary folder and writes the result to stdout."""
+    with tempfile.TemporaryDirectory() as work_dir:
+        input_path = os.path.join(work_dir, f"stdin.{stdin_format}")
+        with open(input_path, "wb") as f:
+            f.write(sys.stdin.buffer.read())
+
+        processor = SubtitleProcessor("", options=options, target_files=[input_path])
+        run_processor(processor, report)
+        result = report["files"][-1]
+        result["file"] = "-"
+        if result["status"] == "succeeded":
+            with open(result["output"], "rb") as f:
+                sys.stdout.buffer.write(f.read())
+            sys.stdout.buffer.flush()
+            result["output"] = "-"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Process subtitle files without the graphical interface.")
+    parser.add_argument("inputs", nargs="+", help="subtitle files, folders, glob patterns or - for stdin")
+    parser.add_argument("--config", help="JSON file with options, using the keys of the application config")
+    parser.add_argument(
+        "--set", dest="assignments", action="append", default=[], metavar="KEY=VALUE", help="override one option"
+    )
+    parser.add_argument(
+        "--stdin-format", choices=[ext[1:] for ext in SUBTITLE_EXTENSIONS], default="srt", help="format of stdin"
+    )
+    args = parser.parse_args(argv)
+
+    report = {"files": [], "successful": 0, "failed": 0, "lines_processed": 0, "elapsed": 0.0}
+    start_time = time.time()
+    try:
+        options = load_options(args.config, args.assignments)
+        folders, files, use_stdin = collect_inputs(args.inputs)
+    except UsageError as e:
+        parser.error(str(e))
+
+    for file_path in files:
+        if not os.path.isfile(file_path):
+            report["files"].append({"file": file_path, "status": "failed", "error": "File not found"})
+        elif not file_path.lower().endswith(SUBTITLE_EXTENSIONS):
+            report["files"].append({"file": file_path, "status": "failed", "error": "Unsupported file type"})
+    target_files = [f for f in files if os.path.isfile(f) and f.lower().endswith(SUBTITLE_EXTENSIONS)]
+
+    for folder in folders:
+        run_processor(SubtitleProcessor(folder, options=options), report)
+    if target_files:
+        run_processor(SubtitleProcessor("", options=options, target_files=target_files), report)
+    if use_stdin:
+        process_stdin(options, args.stdin_format, report)
+
+    report["successful"] = sum(1 for result in report["files"] if result["status"] == "succeeded")
+    report["failed"] = len(report["files"]) - report["successful"]
+    report["elapsed"] = round(time.time() - start_time, 3)
+    if options.get("line_cache_entries", 20000) > 0:
+        report["line_cache"] = LINE_CACHE.stats()
+
+    report_stream = sys.stderr if use_stdin else sys.stdout
+    json.dump(report, report_stream, ensure_ascii=False, indent=2)
+    report_stream.write("\n")
+
+    if not report["files"]:
+        return EXIT_USAGE
+    return EXIT_FILES_FAILED if report["failed"] else EXIT_OK
+
+
+if __name__ == "__main__":
+    # Parallel mode starts worker processes, which need this in frozen Windows builds
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -1,10 +1,26 @@
 from rules import *
 from utils import *
+import io
 
+# Process log wording and subtitle log format name for each convertible extension
+FORMAT_CONVERSION_LOGS = {
+    ".txt": ("Validated TXT and saved as SRT", "TXT"),
+    ".vtt": ("Validated VTT and converted to SRT", "VTT"),
+    ".ass": ("Validated ASS and converted to SRT", "ASS"),
+}
 
-def convert_txt_to_srt(file_path, output_path, process_logs, subtitle_logs, detailed_logs_enabled):
+
+def log_format_conversion(ext, output_path, process_logs, subtitle_logs, detailed_logs_enabled):
+    """Logs a successful conversion of a file with the given extension to SRT."""
+    process_message, format_name = FORMAT_CONVERSION_LOGS[ext]
+    process_logs.append(f"Format Conversion | {process_message}: {os.path.basename(output_path)}")
+    if detailed_logs_enabled:
+        subtitle_logs.append(f"Option: Format Conversion | Converted from {format_name} to SRT format.")
+
+
+def read_txt_as_srt(file_path):
     """
-    Validates and converts a TXT subtitle file to SRT format.
+    Validates a TXT subtitle file and returns its content as a list of SRT text chunks, or None.
     The TXT file must already follow the standard SRT block structure.
     """
     try:
@@ -12,24 +28,34 @@ def convert_txt_to_srt(file_path, output_path, process_logs, subtitle_logs, deta
         with open(file_path, "r", encoding="utf-8-sig") as f:
             content = f.read()
     except UnicodeDecodeError:
-        return False
+        return None
 
     # Validation: Check if the file contains standard SRT timecodes
     if re.search(r"\d+\s*\n\d{2}:\d{2}:\d{2},\d{3}\s*-->\s*\d{2}:\d{2}:\d{2},\d{3}", content):
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        return [content]
+
+    return None
 
-        process_logs.append(f"Format Conversion | Validated TXT and saved as SRT: {os.path.basename(output_path)}")
-        if detailed_logs_enabled:
-            subtitle_logs.append("Option: Format Conversion | Converted from TXT to SRT format.")
-        return True
 
-    return False
+def convert_txt_to_srt(file_path, output_path, process_logs, subtitle_logs, detailed_logs_enabled):
+    """
+    Validates and converts a TXT subtitle file to SRT format.
+    The TXT file must already follow the standard SRT block structure.
+    """
+    srt_chunks = read_txt_as_srt(file_path)
+    if srt_chunks is None:
+        return False
 
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.writelines(srt_chunks)
 
-def convert_vtt_to_srt(file_path, output_path, process_logs, subtitle_logs, detailed_logs_enabled):
+    log_format_conversion(".txt", output_path, process_logs, subtitle_logs, detailed_logs_enabled)
+    return True
+
+
+def read_vtt_as_srt(file_path):
     """
-    Validates and converts a VTT subtitle file to SRT format.
+    Validates a VTT subtitle file and returns its cues as a list of SRT blocks, or None.
     Removes the WEBVTT header, fixes timecode formatting, adds block indices, and cleans HTML/VTT tags.
     """
     try:
@@ -37,11 +63,11 @@ def convert_vtt_to_srt(file_path, output_path, process_logs, subtitle_logs, deta
         with open(file_path, "r", encoding="utf-8-sig") as f:
             content = f.read()
     except UnicodeDecodeError:
-        return False
+        return None
 
     # Strip spaces and manually remove any lingering BOM just in case
     if not content.strip().lstrip("\ufeff").startswith("WEBVTT"):
-        return False
+        return None
 
     blocks = content.split("\n\n")
     srt_lines = []
@@ -95,23 +121,30 @@ def convert_vtt_to_srt(file_path, output_path, process_logs, subtitle_logs, deta
         index += 1
 
     if not srt_lines:
+        return None
+
+    return srt_lines
+
+
+def convert_vtt_to_srt(file_path, output_path, process_logs, subtitle_logs, detailed_logs_enabled):
+    """
+    Validates and converts a VTT subtitle file to SRT format.
+    Removes the WEBVTT header, fixes timecode formatting, adds block indices, and cleans HTML/VTT tags.
+    """
+    srt_lines = read_vtt_as_srt(file_path)
+    if srt_lines is None:
         return False
 
     with open(output_path, "w", encoding="utf-8") as f:
         f.writelines(srt_lines)
 
-    process_logs.append(f"Format Conversion | Validated VTT and converted to SRT: {os.path.basename(output_path)}")
-    if detailed_logs_enabled:
-        subtitle_logs.append("Option: Format Conversion | Converted from VTT to SRT format.")
-
+    log_format_conversion(".vtt", output_path, process_logs, subtitle_logs, detailed_logs_enabled)
     return True
 
 
-def convert_ass_to_srt(
-    file_path, output_path, process_logs, subtitle_logs, detailed_logs_enabled, include_comments=False
-):
+def read_ass_as_srt(file_path, include_comments=False):
     """
-    Validates and converts an ASS subtitle file to SRT format.
+    Validates an ASS subtitle file and returns its events as a list of SRT blocks, or None.
     Extracts Dialogue and Comment lines, reformats timecodes, removes style brackets {}, and handles duplicate skip.
     """
     try:
@@ -119,7 +152,7 @@ def convert_ass_to_srt(
         with open(file_path, "r", encoding="utf-8-sig") as f:
             lines = f.readlines()
     except UnicodeDecodeError:
-        return False
+        return None
 
     events_started = False
     srt_lines = []
@@ -176,18 +209,57 @@ def convert_ass_to_srt(
             index += 1
 
     if not srt_lines:
+        return None
+
+    return srt_lines
+
+
+def convert_ass_to_srt(
+    file_path, output_path, process_logs, subtitle_logs, detailed_logs_enabled, include_comments=False
+):
+    """
+    Validates and converts an ASS subtitle file to SRT format.
+    Extracts Dialogue and Comment lines, reformats timecodes, removes style brackets {}, and handles duplicate skip.
+    """
+    srt_lines = read_ass_as_srt(file_path, include_comments)
+    if srt_lines is None:
         return False
 
     with open(output_path, "w", encoding="utf-8") as f:
         f.writelines(srt_lines)
 
-    process_logs.append(f"Format Conversion | Validated ASS and converted to SRT: {os.path.basename(output_path)}")
-    if detailed_logs_enabled:
-        subtitle_logs.append("Option: Format Conversion | Converted from ASS to SRT format.")
-
+    log_format_conversion(".ass", output_path, process_logs, subtitle_logs, detailed_logs_enabled)
     return True
 
 
+def convert_to_srt_lines(file_path, process_logs, subtitle_logs, detailed_logs_enabled, include_ass_comments=False):
+    """
+    In-memory counterpart of process_and_convert_if_needed: validates and converts TXT, VTT and ASS
+    files without writing anything to disk.
+    Returns the SRT lines (None for files that are already SRT) and a boolean indicating validation success.
+    The lines are split exactly as reading back a converted SRT file would split them.
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+
+    if ext == ".srt":
+        return None, True
+
+    srt_chunks = None
+    if ext == ".txt":
+        srt_chunks = read_txt_as_srt(file_path)
+    elif ext == ".vtt":
+        srt_chunks = read_vtt_as_srt(file_path)
+    elif ext == ".ass":
+        srt_chunks = read_ass_as_srt(file_path, include_ass_comments)
+
+    if srt_chunks is None:
+        return None, False
+
+    output_path = os.path.splitext(file_path)[0] + ".srt"
+    log_format_conversion(ext, output_path, process_logs, subtitle_logs, detailed_logs_enabled)
+    return io.StringIO("".join(srt_chunks)).readlines(), True
+
+
 def process_and_convert_if_needed(
     file_path, process_logs, subtitle_logs, detailed_logs_enabled, include_ass_comments=False
 ):
@@ -1,40 +1,17 @@
 from converter import *
-
-
-def _extract_required_literal(pattern):
-    """Extracts a conservative mandatory literal prefix from a regex pattern."""
-    pattern_text = getattr(pattern, "pattern", "")
-    if not pattern_text.startswith(r"\b"):
-        return None
-
-    cursor = 2
-    if cursor < len(pattern_text) and pattern_text[cursor] == "(":
-        cursor += 1
-
-    literal_chars = []
-    while cursor < len(pattern_text):
-        char = pattern_text[cursor]
-        if char in "()[]{}|*+?\\.^$":
-            break
-        literal_chars.append(char)
-        cursor += 1
-
-    literal = "".join(literal_chars)
-    return literal or None
-
-
-def _prepare_rule_fast_paths(rule_list):
-    """Adds safe literal guards to regex rules without changing rule order."""
-    prepared_rules = []
-    for rule_pattern, replace_with, is_regex in rule_list:
-        required_literal = _extract_required_literal(rule_pattern) if is_regex else rule_pattern
-        prepared_rules.append((rule_pattern, replace_with, is_regex, required_literal))
-    return prepared_rules
-
-
-# Precompute safe literal guards for the largest rule groups.
-SPACE_TO_INVISIBLE_SPACE_FAST_RULES = _prepare_rule_fast_paths(space_to_invisible_space_rules)
-HEXRE_FAST_RULES = _prepare_rule_fast_paths(hexre_rules_list)
+from rule_engine import *
+from cue_store import *
+from encoding_detector import *
+from change_journal import *
+from line_cache import *
+from output_cache import *
+from run_ledger import *
+import tempfile
+import queue
+import itertools
+import functools
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 HTML_TAG_RE = re.compile(r"<[^>]+>")
 ZERO_WIDTH_RE = re.compile(r"[\u200b\u200c\u200d\ufeff]")
@@ -46,13 +23,104 @@ ARABIC_CHAR_TRANS = str.maketrans(arabic_to_persian_chars)
 ARABIC_NUM_TRANS = str.maketrans(arabic_numerals)
 CTRL_CHAR_TRANS = str.maketrans("", "", "\u200e\u200f\u202a\u202b\u202c\u202d\u202e")
 
+# Tuples of symbols that require RTL enforcement at boundaries
+RTL_START_SYMBOLS = (
+    ".",
+    "…",
+    "-",
+    "–",
+    "—",
+    '"',
+    "'",
+    "«",
+    "»",
+    "“",
+    "”",
+    "‘",
+    "’",
+    "(",
+    "[",
+    "{",
+    "<",
+)
+RTL_END_SYMBOLS = (
+    ".",
+    "!",
+    "؟",
+    "?",
+    "،",
+    ",",
+    ":",
+    "؛",
+    ";",
+    "…",
+    '"',
+    "'",
+    "«",
+    "»",
+    "“",
+    "”",
+    "‘",
+    "’",
+    ")",
+    "]",
+    "}",
+    ">",
+)
+
+# Character classes tracked by the per-line signature, one bit per stage guard
+SIG_MISPLACED_CHARS = 1 << 0
+SIG_COMMA = 1 << 1
+SIG_EXCLAMATION = 1 << 2
+SIG_BRACKET = 1 << 3
+SIG_QUESTION_MARK = 1 << 4
+SIG_DOUBLE_QUOTE = 1 << 5
+SIG_DASH = 1 << 6
+SIG_COMMENT = 1 << 7
+SIG_DOT = 1 << 8
+SIG_WHITESPACE = 1 << 9
+SIG_LATIN_QUESTION_COMMA = 1 << 10
+SIG_ARABIC_CHAR = 1 << 11
+SIG_ARABIC_DIGIT = 1 << 12
+SIG_ENGLISH_DIGIT = 1 << 13
+SIG_HEH = 1 << 14
+SIG_TAG = 1 << 15
+SIG_BRACE = 1 << 16
+# Set on every line by the line pipeline, guarding its unconditional stages (see build_line_pipeline)
+SIG_ALWAYS = 1 << 17
+
+SIGNATURE_CHAR_CLASSES = (
+    (SIG_MISPLACED_CHARS, "*:؛!?؟.,،-»«…"),
+    (SIG_COMMA, ",،"),
+    (SIG_EXCLAMATION, "!"),
+    (SIG_BRACKET, "()[]{}"),
+    (SIG_QUESTION_MARK, "?؟"),
+    (SIG_DOUBLE_QUOTE, '"'),
+    (SIG_DASH, "-–—"),
+    (SIG_COMMENT, ":."),
+    (SIG_DOT, ".…"),
+    (SIG_WHITESPACE, " \n\t"),
+    (SIG_LATIN_QUESTION_COMMA, "?,"),
+    (SIG_ARABIC_CHAR, "يكةؤإأ"),
+    (SIG_ARABIC_DIGIT, "٠١٢٣٤٥٦٧٨٩"),
+    (SIG_ENGLISH_DIGIT, "1234567890"),
+    (SIG_HEH, "ههٔهٕ"),
+    (SIG_TAG, "<>"),
+    (SIG_BRACE, "{"),
+)
+
+SIGNATURE_CHAR_BITS = {}
+for signature_bit, signature_chars in SIGNATURE_CHAR_CLASSES:
+    for signature_char in signature_chars:
+        SIGNATURE_CHAR_BITS[signature_char] = SIGNATURE_CHAR_BITS.get(signature_char, 0) | signature_bit
+SIGNATURE_CHARS = frozenset(SIGNATURE_CHAR_BITS)
+
 
 def _log_change(index, opt_name, before, after, logs_buffer, detailed_logs_enabled):
     """Standardized logger to keep subtitle tracking uniform and DRY."""
     if detailed_logs_enabled and before != after:
-        b_clean = before.rstrip("\n")
-        c_clean = after.rstrip("\n")
-        logs_buffer.append(f"Line {index} modified | Option: {opt_name} | Before: |{b_clean}| -> After: |{c_clean}|")
+        # Formatted by format_log_message or journal_lines when the logs are flushed
+        logs_buffer.append((index, opt_name, before, after))
 
 
 def apply_rule_set(text, rules):
@@ -65,58 +133,134 @@ def apply_rule_set(text, rules):
     return text
 
 
+def line_signature(text):
+    """Returns the bitmask of SIGNATURE_CHAR_CLASSES that have at least one character in text."""
+    signature = 0
+    for char in SIGNATURE_CHARS.intersection(text):
+        signature |= SIGNATURE_CHAR_BITS[char]
+    return signature
+
+
 class TimestampedLogBuffer(list):
     def append(self, message):
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        super().append((timestamp, message))
+        super().append((log_timestamp(), message))
 
 
-def fix_misplaced_timecodes(blocks, logs_buffer, detailed_logs_enabled):
-    """Removes empty blocks and reorders blocks chronologically by start time."""
-    valid_blocks = []
-    for block in blocks:
-        # Check if block has any non-empty text lines
-        has_text = any(line.strip() for line in block.get("text_lines", []))
-        if not has_text:
-            if detailed_logs_enabled:
+class SpooledLogBuffer:
+    """
+    TimestampedLogBuffer kept in a temporary file instead of memory, for logs that grow with
+    the size of a streamed file. Iterating yields the (timestamp, message) pairs in order.
+    """
+
+    def __init__(self):
+        self._file = None
+        self._count = 0
+
+    def _write(self, timestamp, message):
+        if self._file is None:
+            self._file = tempfile.TemporaryFile("w+", encoding="utf-8")
+        self._file.write(json.dumps([timestamp, message]) + "\n")
+        self._count += 1
+
+    def append(self, message):
+        self._write(log_timestamp(), message)
+
+    def extend(self, entries):
+        for timestamp, message in entries:
+            self._write(timestamp, message)
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        if self._file is None:
+            return
+        self._file.seek(0)
+        for entry in self._file:
+            yield tuple(json.loads(entry))
+        self._file.seek(0, os.SEEK_END)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._count = 0
+
+
+class LineRecord:
+    """
+    Change flag and log buffer written by the per-line loop. Without the line cache they cover the
+    whole file; with it, _iter_uncached_lines gives every line a fresh record and folds it into the file.
+    """
+
+    __slots__ = ("changed", "logs")
+
+    def __init__(self, logs):
+        self.changed = False
+        self.logs = logs
+
+
+class StreamingFallback(Exception):
+    """Raised when a streamed file needs the whole file in memory, e.g. to reorder its blocks."""
+
+
+def iter_line_windows(line_source, window_size):
+    """
+    Yields (first_line, lines) windows of at least window_size lines from a line iterable.
+    A window only ends after a blank line: parse_srt_blocks is always between blocks on the
+    line after a blank one, so each window parses exactly like its part of the whole file.
+    """
+    lines = []
+    first_line = 1
+    for line in line_source:
+        lines.append(line)
+        if len(lines) >= window_size and not line.strip():
+            yield first_line, lines
+            first_line += len(lines)
+            lines = []
+    if lines:
+        yield first_line, lines
+
+
+def fix_misplaced_timecodes(cues, logs_buffer, detailed_logs_enabled):
+    """Removes empty cues and reorders cues chronologically by start time."""
+    empty_mask = cues.empty_mask()
+    if empty_mask.any():
+        if detailed_logs_enabled:
+            for row in np.flatnonzero(empty_mask).tolist():
                 logs_buffer.append(
-                    f"Block {block.get('index', '')} removed | Option: Fix Misplaced Timecodes | Before: |{block.get('start_str')} --> {block.get('end_str')}| -> After: |[Deleted Empty Block]|"
+                    f"Block {cues.index[row]} removed | Option: Fix Misplaced Timecodes | Before: |{cues.start_str[row]} --> {cues.end_str[row]}| -> After: |[Deleted Empty Block]|"
                 )
-        else:
-            valid_blocks.append(block)
-
-    # Check if the remaining blocks are out of chronological order
-    is_out_of_order = False
-    for i in range(1, len(valid_blocks)):
-        if valid_blocks[i]["start_ms"] < valid_blocks[i - 1]["start_ms"]:
-            is_out_of_order = True
-            break
+        cues.select(~empty_mask)
 
-    if is_out_of_order:
+    # Check if the remaining cues are out of chronological order
+    if len(cues) > 1 and (np.diff(cues.start_ms) < 0).any():
         # Stable sort based on start time
-        sorted_blocks = sorted(valid_blocks, key=lambda b: b["start_ms"])
+        cues.select(np.argsort(cues.start_ms, kind="stable"))
         if detailed_logs_enabled:
             logs_buffer.append("Option: Fix Misplaced Timecodes | Blocks were reordered chronologically.")
-        return sorted_blocks
 
-    return valid_blocks
 
+def remove_duplicate_subtitles(cues, logs_buffer, detailed_logs_enabled):
+    """Removes duplicate subtitle cues that have identical timecodes and text."""
+    # Only cues sharing both times with another cue can be duplicates
+    candidate_rows = np.flatnonzero(cues.duplicate_candidate_mask()).tolist()
+    if not candidate_rows:
+        return
 
-def remove_duplicate_subtitles(blocks, logs_buffer, detailed_logs_enabled):
-    """Removes duplicate subtitle blocks that have identical timecodes and text."""
     seen = set()
     duplicate_counts = {}
-    filtered_blocks = []
+    keep_mask = np.ones(len(cues), dtype=bool)
 
-    for block in blocks:
+    for row in candidate_rows:
         # Create a unique key using exact timecodes and text content
-        key = (block["start_str"], block["end_str"], tuple(block["text_lines"]))
+        key = (cues.start_str[row], cues.end_str[row], tuple(cues.text_lines(row)))
 
         if key in seen:
             duplicate_counts[key] = duplicate_counts.get(key, 0) + 1
+            keep_mask[row] = False
         else:
             seen.add(key)
-            filtered_blocks.append(block)
 
     if detailed_logs_enabled:
         for key, count in duplicate_counts.items():
@@ -125,36 +269,41 @@ def remove_duplicate_subtitles(blocks, logs_buffer, detailed_logs_enabled):
                 f'Duplicate subtitles removed | Option: Remove Duplicate Subtitles | Timecode: "{b_start} --> {b_end}" | {count} duplicate(s) deleted.'
             )
 
-    return filtered_blocks
+    if duplicate_counts:
+        cues.select(keep_mask)
 
 
-def fix_overlapping_timecodes(blocks, logs_buffer, detailed_logs_enabled):
-    """Fixes timecode overlaps by adjusting the end time of the preceding block."""
-    has_changes = False
+def fix_overlapping_timecodes(cues, logs_buffer, detailed_logs_enabled):
+    """Fixes timecode overlaps by adjusting the end time of the preceding cue."""
+    # End times move to 1 ms before the next start, bounded by the cue's own start time
+    rows, new_end_ms = cues.overlap_fixes()
+    if not len(rows):
+        return False
 
-    for i in range(len(blocks) - 1):
-        current_block = blocks[i]
-        next_block = blocks[i + 1]
+    old_end_strs = cues.end_str[rows]
+    new_end_strs = format_timecodes(new_end_ms)
+    cues.end_ms[rows] = new_end_ms
+    cues.end_str[rows] = new_end_strs
 
-        # Check if the end time of the current block overlaps with the start time of the next block
-        if current_block["end_ms"] >= next_block["start_ms"]:
-            old_end_str = current_block["end_str"]
+    if detailed_logs_enabled:
+        for row, old_end_str, new_end_str in zip(rows.tolist(), old_end_strs, new_end_strs):
+            logs_buffer.append(
+                f'Timecode overlap fixed | Option: Fix Overlapping Timecodes | Block {cues.index[row]} | Before: "{cues.start_str[row]} --> {old_end_str}" -> After: "{cues.start_str[row]} --> {new_end_str}"'
+            )
 
-            # Adjust the end time to be 1 ms before the next block's start time
-            # Ensure we do not create negative durations by bounding it to the block's own start time
-            new_end_ms = max(current_block["start_ms"], next_block["start_ms"] - 1)
+    return True
 
-            if current_block["end_ms"] != new_end_ms:
-                current_block["end_ms"] = new_end_ms
-                current_block["end_str"] = ms_to_timecode(new_end_ms)
-                has_changes = True
 
-                if detailed_logs_enabled:
-                    logs_buffer.append(
-                        f'Timecode overlap fixed | Option: Fix Overlapping Timecodes | Block {current_block.get("index", "")} | Before: "{current_block["start_str"]} --> {old_end_str}" -> After: "{current_block["start_str"]} --> {current_block["end_str"]}"'
-                    )
+# Characters build_flexible_regex ignores between the characters of a word: spaces, dots, zero-width
+# non-joiners (\u200c), kashida (ـ), Arabic diacritics, directional marks and dashes/underscores
+# Added _, -, \u2013 (en-dash), and \u2014 (em-dash) to catch all line stretching variations
+FLEXIBLE_IGNORED_CHARS = r"[\s\.\u200cـ\u064b-\u0652\u200b-\u200f\u202a-\u202e_\-\u2013\u2014]"
 
-    return blocks, has_changes
+# Letters build_flexible_regex treats as one, with the one they fold to
+FLEXIBLE_LETTER_VARIANTS = (("یيى", "ی"), ("کك", "ک"), ("اآأإ", "ا"), ("هة", "ه"))
+
+# Lists with fewer words are searched word by word, which is faster than a pass of the automaton
+FLEXIBLE_MATCHER_MIN_WORDS = 16
 
 
 def build_flexible_regex(word):
@@ -163,9 +312,7 @@ def build_flexible_regex(word):
     kashida (ـ), and various dashes/underscores between the characters of the provided word.
     Compiles with re.IGNORECASE to support case-insensitive English matching.
     """
-    # Consolidated ignored characters into a single variable to avoid duplication
-    # Added _, -, \u2013 (en-dash), and \u2014 (em-dash) to catch all line stretching variations
-    ignored_chars = r"[\s\.\u200cـ\u064b-\u0652\u200b-\u200f\u202a-\u202e_\-\u2013\u2014]"
+    ignored_chars = FLEXIBLE_IGNORED_CHARS
 
     clean_word = re.sub(ignored_chars, "", word)
     if not clean_word:
@@ -189,6 +336,106 @@ def build_flexible_regex(word):
     return re.compile(pattern, re.IGNORECASE)
 
 
+@functools.lru_cache(maxsize=None)
+def flexible_fold_table():
+    """
+    str.translate table that folds a text the way the patterns of build_flexible_regex compare it:
+    the ignored characters are dropped, letter variants merged and case variants mapped to one
+    character. A word's pattern can then only match a text whose folded form contains the folded word.
+    """
+    # Cased and ignored characters are all below the supplementary ideographic planes
+    characters = "".join(map(chr, range(0x20000)))
+
+    # Case variants are joined by the case-insensitive matches of the regex engine itself (e.g. "I"
+    # also matches "ı" and "İ") and by their single-character lower, upper and case-folded forms
+    cased_chars = "".join(re.findall(r"[\p{Changes_When_Casemapped}\p{Changes_When_Casefolded}]", characters))
+    case_classes = {}
+    for char in cased_chars:
+        case_class = {char}
+        if char not in case_classes:
+            case_class.update(re.findall(re.escape(char), cased_chars, flags=re.IGNORECASE))
+        for mapped in (char.lower(), char.upper(), char.casefold()):
+            if len(mapped) == 1:
+                case_class.add(mapped)
+        for member in list(case_class):
+            case_class |= case_classes.get(member, set())
+        for member in case_class:
+            case_classes[member] = case_class
+    table = {ord(char): min(case_class) for char, case_class in case_classes.items() if min(case_class) != char}
+
+    for variants, folded in FLEXIBLE_LETTER_VARIANTS:
+        for variant in variants:
+            table[ord(variant)] = folded
+    for char in re.findall(FLEXIBLE_IGNORED_CHARS, characters, flags=re.IGNORECASE):
+        table[ord(char)] = None
+    return table
+
+
+class FlexibleWordList(list):
+    """
+    The (word, regex) pairs of a bypass, remove or replace list, see build_flexible_regex. Lines are
+    folded (see flexible_fold_table) and scanned once with an Aho-Corasick automaton of the folded
+    words; only the regexes of the words it finds are run, in list order. The results are those of
+    running every regex of the list in turn.
+    """
+
+    def __init__(self, word_regexes=()):
+        super().__init__(word_regexes)
+        self.finder = None
+        if len(self) < FLEXIBLE_MATCHER_MIN_WORDS:
+            return
+
+        self.fold_table = flexible_fold_table()
+        self.key_positions = {}
+        self.unindexed_positions = []
+        for position, (word, _) in enumerate(self):
+            key = word.translate(self.fold_table)
+            if key:
+                self.key_positions.setdefault(key, []).append(position)
+            else:
+                self.unindexed_positions.append(position)
+        self.finder = AhoCorasick(self.key_positions)
+
+    def candidates(self, text):
+        """Returns the positions of the words that can match text, in list order."""
+        if self.finder is None:
+            return range(len(self))
+        positions = list(self.unindexed_positions)
+        for key in self.finder.findall(text.translate(self.fold_table)):
+            positions.extend(self.key_positions[key])
+        positions.sort()
+        return positions
+
+    def first_match(self, text):
+        """Returns the first word of the list whose regex matches text, or None."""
+        for position in self.candidates(text):
+            word, regex = self[position]
+            if regex.search(text):
+                return word
+        return None
+
+    def remove_matches(self, text, steps=None):
+        """
+        Removes the matches of every word from text in list order, each word from the text left by the
+        words before it. Appends (word, before, after) to steps for every word that changed the text.
+        """
+        candidates = self.candidates(text)
+        candidate = 0
+        while candidate < len(candidates):
+            position = candidates[candidate]
+            candidate += 1
+            word, regex = self[position]
+            after = regex.sub("", text)
+            if after != text:
+                if steps is not None:
+                    steps.append((word, text, after))
+                text = after
+                # The removal may have joined the characters of later words
+                candidates = [later for later in self.candidates(text) if later > position]
+                candidate = 0
+        return text
+
+
 def is_pure_english(text):
     """
     Checks if the given text line is purely English (contains no Persian/Arabic characters).
@@ -213,6 +460,176 @@ def trim_line_spaces(line_text):
         return stripped
 
 
+def normalize_leading_brackets(line_text):
+    """Collapses repeated opening brackets at the start of the visible text and closes an unclosed one."""
+    # Normalize repeated opening brackets at the start of the visible text.
+    # This keeps leading HTML/bidi markers intact while fixing cases like:
+    # "(‏(text" -> "(text)"
+    leading_prefix_match = re.match(
+        r"^(?:[ \t\u200b-\u200f\u202a-\u202e\u2066-\u2069\ufeff]+|<[^>]+>)*",
+        line_text,
+    )
+    leading_prefix = leading_prefix_match.group(0) if leading_prefix_match else ""
+    body = line_text[len(leading_prefix) :]
+
+    if body:
+        bracket_pairs = {
+            "(": ")",
+            "[": "]",
+            "{": "}",
+        }
+
+        first_char = body[0]
+        if first_char in bracket_pairs:
+            closing_char = bracket_pairs[first_char]
+
+            # Collapse repeated opening brackets, allowing invisible RTL marks/spaces between them.
+            body = re.sub(
+                rf"^(?:{re.escape(first_char)}(?:[ \t\u200b-\u200f\u202a-\u202e\u2066-\u2069\ufeff]*{re.escape(first_char)})+)",
+                first_char,
+                body,
+            )
+
+            # If the line has no matching closing bracket, append one at the end.
+            if closing_char not in body:
+                line_ending = ""
+
+                if body.endswith("\r\n"):
+                    line_ending = "\r\n"
+                    body = body[:-2]
+                elif body.endswith("\n"):
+                    line_ending = "\n"
+                    body = body[:-1]
+
+                body = body + closing_char + line_ending
+
+    line_text = leading_prefix + body
+
+    return line_text
+
+
+def fix_double_quote_placement(line_text):
+    """Moves a misplaced pair of double quotes back around the text and drops an unbalanced quote."""
+    # Handle misplaced opening quote at start of line
+    if line_text.count('"') == 2:
+        line_ending = ""
+
+        if line_text.endswith("\r\n"):
+            line_ending = "\r\n"
+            line_text = line_text[:-2]
+        elif line_text.endswith("\n"):
+            line_ending = "\n"
+            line_text = line_text[:-1]
+
+        # Detect leading HTML tags and common punctuation marks including RTL/LTR control marks
+        html_prefix_match = re.match(
+            r"^((?:<[^<>]+>|[\u200e\u200f\u202a-\u202e\u2066-\u2069\u061c\ufeff\u200b]|[\s\.\-–—])*)",
+            line_text,
+        )
+        html_prefix = html_prefix_match.group(1) if html_prefix_match else ""
+        remainder = line_text[len(html_prefix) :]
+
+        # Detect trailing HTML tags, spaces, and RTL/LTR control marks
+        html_suffix_match = re.search(
+            r"((?:<[^<>]+>|[\u200e\u200f\u202a-\u202e\u2066-\u2069\u061c\ufeff\u200b]|\s)+)$",
+            remainder,
+        )
+        if html_suffix_match:
+            html_suffix = html_suffix_match.group(1)
+            content_after_html = remainder[: -len(html_suffix)]
+        else:
+            html_suffix = ""
+            content_after_html = remainder
+
+        if content_after_html.count('"') == 2:
+            # Case 1: Both quotes are clustered at the start (""Text -> "Text")
+            if content_after_html.startswith('""'):
+                content_after_html = '"' + content_after_html[2:] + '"'
+
+            # Case 2: Both quotes are clustered at the end (Text"" -> "Text")
+            elif content_after_html.endswith('""'):
+                content_after_html = '"' + content_after_html[:-2] + '"'
+
+            else:
+                q1_idx = content_after_html.find('"')
+                q2_idx = content_after_html.rfind('"')
+
+                # Case 3: Misplaced closing quote pushed to the beginning of line in RTL text
+                if q1_idx == 0 and q2_idx < len(content_after_html) - 1:
+                    prev_char = content_after_html[q2_idx - 1] if q2_idx > 0 else ""
+                    next_char = (
+                        content_after_html[q2_idx + 1]
+                        if q2_idx + 1 < len(content_after_html)
+                        else ""
+                    )
+                    if (
+                        prev_char in " \t\u200c\u200e\u200f([{'«،,;:.!?-–—"
+                        and next_char not in " \t\r\n"
+                    ):
+                        content_after_html = content_after_html[1:] + '"'
+
+                # Case 4: Opening quote is misplaced at end of text while line starts with HTML tags or text
+                elif q2_idx == len(content_after_html) - 1 and q1_idx > 0:
+                    prev_char = content_after_html[q1_idx - 1] if q1_idx > 0 else ""
+                    next_char = (
+                        content_after_html[q1_idx + 1]
+                        if q1_idx + 1 < len(content_after_html)
+                        else ""
+                    )
+                    if prev_char not in " \t\r\n" and (
+                        next_char in " \t\u200c\u200e\u200f)]}'»،,;:.!?-–—"
+                        or q1_idx + 1 == len(content_after_html)
+                    ):
+                        content_after_html = '"' + content_after_html[:-1]
+
+        line_text = html_prefix + content_after_html + html_suffix + line_ending
+
+    # Handle unbalanced double quotes (odd number of quotes)
+    if line_text.count('"') % 2 != 0:
+        # Replace the quote and any surrounding spaces/tabs with a single space
+        # to avoid merging words. The unneeded_spaces rules will clean up any extra spaces.
+        line_text = re.sub(r'[ \t]*"[ \t]*', " ", line_text)
+
+    return line_text
+
+
+def _replace_eng_num(match):
+    start = match.start()
+    end = match.end()
+    text = match.string
+
+    # Expand left boundary across alphanumeric and common identifier/date delimiters
+    left = start
+    while left > 0 and re.match(r"[A-Za-z0-9@._\-+/\\:]", text[left - 1]):
+        left -= 1
+
+    # Expand right boundary across alphanumeric and common identifier/date delimiters
+    right = end
+    while right < len(text) and re.match(r"[A-Za-z0-9@._\-+/\\:]", text[right]):
+        right += 1
+
+    token = text[left:right]
+
+    # Skip emails, usernames, identifiers, filenames, dates with English month names, and mixed English tokens
+    if re.search(r"[A-Za-z]", token):
+        return match.group(0)
+
+    return "".join(english_numerals.get(char, char) for char in match.group(0))
+
+
+def convert_english_numerals(line_text):
+    """Converts isolated English numerals to Persian numerals, leaving HTML tags and identifiers untouched."""
+    # Split text by HTML tags to preserve numbers inside tags
+    parts = html_tag_split_pattern.split(line_text)
+    for i in range(len(parts)):
+        # Only process parts that are not HTML tags
+        if not parts[i].startswith("<"):
+            # Ensure numbers are not attached to English letters or identifier-like tokens
+            parts[i] = isolated_eng_num_pattern.sub(_replace_eng_num, parts[i])
+
+    return "".join(parts)
+
+
 def timecode_to_ms(tc_str):
     """Converts standard or negative SRT timecode string (HH:MM:SS,mmm or HH:MM:SS.mmm) to milliseconds."""
     tc_str = tc_str.strip()
@@ -242,10 +659,81 @@ def ms_to_timecode(ms):
     return f"{hours:02d}:{minutes:02d}:{seconds:02d},{millis:03d}"
 
 
+SRT_TIMECODE_RE = re.compile(r"^(-?\d{2}:\d{2}:\d{2}[,\.]\d{3})\s*-->\s*(-?\d{2}:\d{2}:\d{2}[,\.]\d{3})")
+
+
+def _is_canonical_timecode(tc_str):
+    """True if ms_to_timecode reproduces a parsed HH:MM:SS,mmm timecode from its milliseconds."""
+    return tc_str[0] != "-" and tc_str[8] == "," and tc_str[3] < "6" and tc_str[6] < "6"
+
+
+class Cue:
+    """
+    Compact subtitle block. Times are stored as integer milliseconds and the timecode strings
+    are formatted on access; only a timecode that does not round-trip (negative, written with
+    a "." separator or with out-of-range fields) keeps its original text.
+    Supports the mapping access of the block dictionaries it replaces.
+    """
+
+    __slots__ = ("index", "start_ms", "end_ms", "text_lines", "text_indices", "_start_str", "_end_str")
+
+    KEYS = ("index", "start_ms", "end_ms", "start_str", "end_str", "text_lines", "text_indices")
+
+    def __init__(self, index, start_ms, end_ms, text_lines, text_indices=(), start_str=None, end_str=None):
+        self.index = index
+        self.start_ms = start_ms
+        self.end_ms = end_ms
+        self.text_lines = text_lines
+        self.text_indices = text_indices
+        self._start_str = start_str if start_str is not None and not _is_canonical_timecode(start_str) else None
+        self._end_str = end_str if end_str is not None and not _is_canonical_timecode(end_str) else None
+
+    @property
+    def start_str(self):
+        return self._start_str if self._start_str is not None else ms_to_timecode(self.start_ms)
+
+    @start_str.setter
+    def start_str(self, value):
+        self._start_str = value if value != ms_to_timecode(self.start_ms) else None
+
+    @property
+    def end_str(self):
+        return self._end_str if self._end_str is not None else ms_to_timecode(self.end_ms)
+
+    @end_str.setter
+    def end_str(self, value):
+        self._end_str = value if value != ms_to_timecode(self.end_ms) else None
+
+    def __getitem__(self, key):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.KEYS
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.KEYS else default
+
+    def keys(self):
+        return self.KEYS
+
+    def copy(self):
+        cue = Cue(self.index, self.start_ms, self.end_ms, self.text_lines, self.text_indices)
+        cue._start_str = self._start_str
+        cue._end_str = self._end_str
+        return cue
+
+
 def parse_srt_blocks(lines):
-    """Parses raw lines of an SRT file into a list of block dictionaries."""
+    """Parses raw lines of an SRT file into a list of Cue blocks."""
     blocks = []
-    tc_regex = re.compile(r"^(-?\d{2}:\d{2}:\d{2}[,\.]\d{3})\s*-->\s*(-?\d{2}:\d{2}:\d{2}[,\.]\d{3})")
+    tc_regex = SRT_TIMECODE_RE
     i = 0
     n = len(lines)
 
@@ -272,7 +760,7 @@ def parse_srt_blocks(lines):
 
             i += 1
             text_lines = []
-            text_indices = []  # Added to track the original line numbers of pure subtitle texts
+            text_start = i + 1  # Tracks the original line numbers of pure subtitle texts
             while i < n:
                 curr = lines[i]
                 curr_stripped = curr.strip()
@@ -284,19 +772,11 @@ def parse_srt_blocks(lines):
                 ) and (i + 1 < n and tc_regex.match(lines[i + 1].strip())):
                     break
                 text_lines.append(curr.rstrip("\r\n"))
-                text_indices.append(i + 1)  # Storing 1-based index to match enumerate
                 i += 1
 
+            # Text lines are consecutive, so their 1-based line numbers (matching enumerate) form a range
             blocks.append(
-                {
-                    "index": index_str,
-                    "start_ms": start_ms,
-                    "end_ms": end_ms,
-                    "start_str": start_str,
-                    "end_str": end_str,
-                    "text_lines": text_lines,
-                    "text_indices": text_indices,  # Included in block dictionary
-                }
+                Cue(index_str, start_ms, end_ms, text_lines, range(text_start, i + 1), start_str, end_str)
             )
         else:
             i += 1
@@ -304,6 +784,343 @@ def parse_srt_blocks(lines):
     return blocks
 
 
+def _is_index_line(stripped):
+    return stripped.isdigit() or (stripped.startswith("\ufeff") and stripped[1:].isdigit())
+
+
+def settle_block_text(text_lines):
+    """
+    Returns the text lines parse_srt_blocks reads back for a block written with these lines,
+    or None if one of them would start a new block. A blank line ends the block and the
+    parser skips the lines after it.
+    """
+    settled_lines = []
+    for position, text_line in enumerate(text_lines):
+        stripped = text_line.strip()
+        if not stripped:
+            for skipped_line in text_lines[position + 1 :]:
+                skipped_line = skipped_line.strip()
+                if skipped_line and (_is_index_line(skipped_line) or SRT_TIMECODE_RE.match(skipped_line)):
+                    return None
+            break
+        if (
+            _is_index_line(stripped)
+            and position + 1 < len(text_lines)
+            and SRT_TIMECODE_RE.match(text_lines[position + 1].strip())
+        ):
+            return None
+        settled_lines.append(text_line)
+    return settled_lines
+
+
+def settle_blocks(blocks):
+    """Applies settle_block_text to every block; returns None if any block would parse differently."""
+    settled_blocks = []
+    for block in blocks:
+        text_lines = settle_block_text(block["text_lines"])
+        if text_lines is None:
+            return None
+        settled_block = block.copy()
+        settled_block["text_lines"] = text_lines
+        settled_blocks.append(settled_block)
+    return settled_blocks
+
+
+@functools.lru_cache(maxsize=None)
+def processing_code_version():
+    """Version of the code that produces the outputs, for the keys of the output cache."""
+    modules = ("rules", "rule_engine", "converter", "cue_store", "encoding_detector", __name__)
+    return code_version([getattr(sys.modules.get(name), "__file__", None) for name in modules], APP_VERSION)
+
+
+class PreparedFile:
+    """
+    A subtitle file read ahead of processing (see SubtitleProcessor._read_file): its log buffers,
+    its output cache entry when the output is cached and otherwise the in-memory conversion of
+    alternative formats and, outside streaming mode, its decoded lines.
+    """
+
+    __slots__ = (
+        "file_path",
+        "file_bytes",
+        "file_process_logs",
+        "file_subtitle_logs",
+        "converted_lines",
+        "validation_success",
+        "file_encoding",
+        "lines",
+        "read_error",
+        "pending_save",
+        "content_digest",
+        "cache_key",
+        "cached_entry",
+        "pending_cache_entry",
+    )
+
+    def __init__(self, file_path, file_bytes, file_process_logs, file_subtitle_logs):
+        self.file_path = file_path
+        self.file_bytes = file_bytes
+        self.file_process_logs = file_process_logs
+        self.file_subtitle_logs = file_subtitle_logs
+        self.converted_lines = None
+        self.validation_success = False
+        self.file_encoding = None
+        self.lines = []
+        self.read_error = None
+        self.pending_save = None
+        self.content_digest = None
+        self.cache_key = None
+        self.cached_entry = None
+        self.pending_cache_entry = None
+
+
+class SubtitleDocument:
+    """
+    A subtitle file parsed once at read time: its raw lines plus the blocks found in them.
+    Line stages write text lines back in place (None drops a line), and the blocks are
+    rebuilt from those lines without parsing the file again.
+    """
+
+    def __init__(self, lines, first_line=1):
+        self.lines = list(lines)
+        self.first_line = first_line
+        self.blocks = parse_srt_blocks(lines)
+        self.text_indices = set()
+        for block in self.blocks:
+            # Line numbers count from first_line when the document is a window of a larger file
+            if first_line != 1:
+                block.text_indices = range(
+                    block.text_indices.start + first_line - 1, block.text_indices.stop + first_line - 1
+                )
+            self.text_indices.update(block.text_indices)
+
+    def output_lines(self):
+        return [line for line in self.lines if line is not None]
+
+    def current_blocks(self):
+        """
+        Returns the blocks with their current text lines, as parse_srt_blocks would read them
+        from the output lines. If a rewritten line would start a new block, the output lines
+        are parsed again instead.
+        """
+        blocks = []
+        for block in self.blocks:
+            # A block always ends before a blank or index line, so its text decides how it parses back
+            text_lines = settle_block_text(
+                [
+                    self.lines[text_index - self.first_line].rstrip("\r\n")
+                    for text_index in block["text_indices"]
+                    if self.lines[text_index - self.first_line] is not None
+                ]
+            )
+            if text_lines is None:
+                return parse_srt_blocks(self.output_lines())
+            cue = block.copy()
+            cue.text_lines = text_lines
+            cue.text_indices = ()
+            blocks.append(cue)
+        return blocks
+
+
+class StreamingBlockPipeline:
+    """
+    The block-level post-process operations of run() applied to blocks as they stream in.
+    Each operation keeps only the state it needs: the previous start time for the order check,
+    the current run of equal start times for duplicates, one held-back block for overlaps and
+    the previous end time for the intro credit gap. Logs go to one spool per operation so they
+    can be emitted in the order of the buffered path.
+    Raises StreamingFallback if reordering or duplicate removal meets out-of-order blocks.
+    """
+
+    def __init__(self, options, detailed_logs_enabled, credit_lines, credit_duration_ms):
+        self.remove_negative_timecodes = options.get("remove_negative_timecodes", 1)
+        self.fix_misplaced_timecodes = options.get("fix_misplaced_timecodes", 1)
+        self.remove_duplicate_subtitles = options.get("remove_duplicate_subtitles", 1)
+        self.fix_overlapping_timecodes = options.get("fix_overlapping_timecodes", 1)
+        self.remove_empty_subtitles = options.get("remove_empty_subtitles", 1)
+        self.reformat_renumber = options.get("reformat_renumber", 1)
+        self.detailed_logs_enabled = detailed_logs_enabled
+        self.credit_lines = credit_lines if options.get("add_intro_credit", 0) else []
+        self.credit_duration_ms = credit_duration_ms
+
+        self.negative_logs = SpooledLogBuffer()
+        self.duplicate_logs = SpooledLogBuffer()
+        self.misplaced_logs = SpooledLogBuffer()
+        self.overlap_logs = SpooledLogBuffer()
+        self.empty_logs = SpooledLogBuffer()
+        self.closing_logs = SpooledLogBuffer()
+
+        self.has_changes = False
+        self.previous_start_ms = None
+        self.duplicate_start_ms = None
+        self.duplicate_seen = set()
+        self.duplicate_counts = {}
+        self.held_block = None
+        self.emitted_count = 0
+        self.previous_end_ms = None
+        self.credit_added = False
+        self.renumbered_count = 0
+        self.output_lines = []
+
+    def spools(self):
+        """The log spools in the order the buffered path writes them."""
+        return (
+            self.negative_logs,
+            self.misplaced_logs,
+            self.duplicate_logs,
+            self.overlap_logs,
+            self.empty_logs,
+            self.closing_logs,
+        )
+
+    def feed(self, blocks):
+        for block in blocks:
+            # Option: Remove Negative Timecodes
+            if self.remove_negative_timecodes and (
+                block.start_ms < 0
+                or block.end_ms < 0
+                or block.start_str.startswith("-")
+                or block.end_str.startswith("-")
+            ):
+                self.has_changes = True
+                if self.detailed_logs_enabled:
+                    self.negative_logs.append(
+                        f'Subtitle block removed | Option: Remove Negative Timecodes | Index: "{block.index}" | Timecode: "{block.start_str} --> {block.end_str}"'
+                    )
+                continue
+
+            # Option: Fix Misplaced Timecodes (reordering itself needs the buffered path)
+            if self.fix_misplaced_timecodes and not any(line.strip() for line in block.text_lines):
+                if self.detailed_logs_enabled:
+                    self.misplaced_logs.append(
+                        f"Block {block.index} removed | Option: Fix Misplaced Timecodes | Before: |{block.start_str} --> {block.end_str}| -> After: |[Deleted Empty Block]|"
+                    )
+                continue
+            if self.fix_misplaced_timecodes or self.remove_duplicate_subtitles:
+                if self.previous_start_ms is not None and block.start_ms < self.previous_start_ms:
+                    raise StreamingFallback()
+                self.previous_start_ms = block.start_ms
+
+            # Option: Remove Duplicate Subtitles
+            if self.remove_duplicate_subtitles and self._is_duplicate(block):
+                continue
+
+            # Option: Fix Overlapping Timecodes, which needs the start time of the next block
+            if self.fix_overlapping_timecodes:
+                held_block, self.held_block = self.held_block, block
+                if held_block is None:
+                    continue
+                self._fix_overlap(held_block, block.start_ms)
+                block = held_block
+
+            self._emit(block)
+
+    def finish(self):
+        if self.held_block is not None:
+            held_block, self.held_block = self.held_block, None
+            self._emit(held_block)
+        self._flush_duplicate_logs()
+
+        if self.credit_lines and not self.credit_added:
+            if not self.emitted_count:
+                self._add_credit(200, "Intro credit subtitle added")
+            else:
+                self._add_credit(self.previous_end_ms + 200, "Intro credit subtitle added at the end")
+
+        if self.reformat_renumber and self.detailed_logs_enabled:
+            self.closing_logs.append(
+                f"Reformat & Renumber completed | Total blocks renumbered: {self.renumbered_count}"
+            )
+
+    def take_output(self):
+        output_lines, self.output_lines = self.output_lines, []
+        return output_lines
+
+    def _is_duplicate(self, block):
+        # Duplicates share their start time, and start times arrive in order
+        if block.start_ms != self.duplicate_start_ms:
+            self._flush_duplicate_logs()
+            self.duplicate_start_ms = block.start_ms
+            self.duplicate_seen = set()
+
+        key = (block.start_str, block.end_str, tuple(block.text_lines))
+        if key in self.duplicate_seen:
+            self.duplicate_counts[key] = self.duplicate_counts.get(key, 0) + 1
+            self.has_changes = True
+            return True
+        self.duplicate_seen.add(key)
+        return False
+
+    def _flush_duplicate_logs(self):
+        if self.detailed_logs_enabled:
+            for key, count in self.duplicate_counts.items():
+                b_start, b_end, _ = key
+                self.duplicate_logs.append(
+                    f'Duplicate subtitles removed | Option: Remove Duplicate Subtitles | Timecode: "{b_start} --> {b_end}" | {count} duplicate(s) deleted.'
+                )
+        self.duplicate_counts = {}
+
+    def _fix_overlap(self, block, next_start_ms):
+        if block.end_ms < next_start_ms:
+            return
+        new_end_ms = max(block.start_ms, next_start_ms - 1)
+        if block.end_ms != new_end_ms:
+            old_end_str = block.end_str
+            block.end_ms = new_end_ms
+            block.end_str = ms_to_timecode(new_end_ms)
+            self.has_changes = True
+            if self.detailed_logs_enabled:
+                self.overlap_logs.append(
+                    f'Timecode overlap fixed | Option: Fix Overlapping Timecodes | Block {block.index} | Before: "{block.start_str} --> {old_end_str}" -> After: "{block.start_str} --> {block.end_str}"'
+                )
+
+    def _emit(self, block):
+        # Option: Remove Empty Subtitles
+        if self.remove_empty_subtitles and not "".join(block.text_lines).strip():
+            self.has_changes = True
+            if self.detailed_logs_enabled:
+                self.empty_logs.append(
+                    f'Subtitle block removed | Option: Remove Empty Subtitles | Index: "{block.index}" | Timecode: "{block.start_str} --> {block.end_str}"'
+                )
+            return
+
+        # Option: Add Intro Credit Subtitle, at the beginning or in the first gap wide enough
+        if self.credit_lines and not self.credit_added:
+            required_space = self.credit_duration_ms + 400
+            if not self.emitted_count:
+                if block.start_ms >= required_space:
+                    self._add_credit(200, "Intro credit subtitle added at beginning")
+            elif block.start_ms - self.previous_end_ms >= required_space:
+                self._add_credit(
+                    self.previous_end_ms + 200, f"Intro credit subtitle added at gap after block {self.emitted_count}"
+                )
+
+        self.emitted_count += 1
+        self.previous_end_ms = block.end_ms
+        self._write(block.start_ms, block.end_ms, block.text_lines)
+
+    def _add_credit(self, start_time_ms, log_prefix):
+        end_time_ms = start_time_ms + self.credit_duration_ms
+        self.credit_added = True
+        self.has_changes = True
+        if self.detailed_logs_enabled:
+            self.closing_logs.append(
+                f'{log_prefix} | Timecode: "{ms_to_timecode(start_time_ms)} --> {ms_to_timecode(end_time_ms)}"'
+            )
+        self._write(start_time_ms, end_time_ms, self.credit_lines)
+
+    def _write(self, start_ms, end_ms, text_lines):
+        # Option: Reformat & Renumber Subtitles
+        if not self.reformat_renumber:
+            return
+        self.renumbered_count += 1
+        self.output_lines.append(f"{self.renumbered_count}\n")
+        self.output_lines.append(f"{ms_to_timecode(start_ms)} --> {ms_to_timecode(end_ms)}\n")
+        for t_line in text_lines:
+            self.output_lines.append(f"{t_line}\n")
+        self.output_lines.append("\n")
+
+
 def fix_inconsistent_dialog_hyphens(blocks):
     """Removes leading dialogue hyphens from multi-line blocks unless every line starts with one."""
     dialog_prefix_pattern = re.compile(
@@ -385,6 +1202,346 @@ def fix_trailing_dialog_hyphens(blocks):
     return blocks
 
 
+# Compiled line pipelines by options fingerprint, shared by every run in the process
+LINE_PIPELINE_CACHE_SIZE = 16
+
+_line_pipelines = {}
+_line_pipelines_lock = threading.Lock()
+
+
+class LineState:
+    """
+    The line being processed by the stages of a line pipeline (see build_line_pipeline), with the
+    rule lists and the LineRecord of its file. One state is reused for every line of a file.
+    """
+
+    __slots__ = (
+        "index",
+        "original",
+        "text",
+        "signature",
+        "pure_english",
+        "bypassed",
+        "record",
+        "bypass_regexes",
+        "remove_regexes",
+        "replace_regexes",
+    )
+
+    def __init__(self, record, bypass_regexes, remove_regexes, replace_regexes):
+        self.record = record
+        self.bypass_regexes = bypass_regexes
+        self.remove_regexes = remove_regexes
+        self.replace_regexes = replace_regexes
+
+    def start(self, index, line):
+        self.index = index
+        self.original = line
+        self.text = line
+        self.signature = line_signature(line) | SIG_ALWAYS
+        self.pure_english = is_pure_english(line)
+        self.bypassed = False
+
+    def change(self, opt_name, after):
+        """Replaces the text of the line, flagging and logging the change when there is one."""
+        before = self.text
+        if after != before:
+            self.text = after
+            self.signature = line_signature(after) | SIG_ALWAYS
+            self.record.changed = True
+            self.record.logs.append((self.index, opt_name, before, after))
+
+    def log(self, opt_name, before, after):
+        if before != after:
+            self.record.logs.append((self.index, opt_name, before, after))
+
+    def note(self, message):
+        self.record.logs.append(message)
+
+
+class UnloggedLineState(LineState):
+    """LineState of runs without detailed subtitle logs: changes are flagged but never logged."""
+
+    __slots__ = ()
+
+    def change(self, opt_name, after):
+        if after != self.text:
+            self.text = after
+            self.signature = line_signature(after) | SIG_ALWAYS
+            self.record.changed = True
+
+    def log(self, opt_name, before, after):
+        pass
+
+    def note(self, message):
+        pass
+
+
+def _text_stage(opt_name, transform, detailed_logs_enabled):
+    """Returns a stage replacing the text with transform(text); the change is only logged with detailed logs."""
+    if detailed_logs_enabled:
+
+        def stage(state):
+            before = state.text
+            after = transform(before)
+            if after != before:
+                state.text = after
+                state.signature = line_signature(after) | SIG_ALWAYS
+                state.record.changed = True
+                state.record.logs.append((state.index, opt_name, before, after))
+
+    else:
+
+        def stage(state):
+            after = transform(state.text)
+            if after != state.text:
+                state.text = after
+                state.signature = line_signature(after) | SIG_ALWAYS
+                state.record.changed = True
+
+    return stage
+
+
+def _remove_alignment_tags(text):
+    if "an" in text.lower():
+        return ALIGNMENT_TAG_RE.sub("", text)
+    return text
+
+
+def _fix_misplaced_chars(text):
+    # Preserve and strip trailing newline to prevent regexes from corrupting line endings
+    line_ending = ""
+    if text.endswith("\r\n"):
+        line_ending = "\r\n"
+    elif text.endswith("\n"):
+        line_ending = "\n"
+    text = text[: len(text) - len(line_ending)]
+    if not misplaced_chars_comment_pattern.fullmatch(text):
+        text = MISPLACED_CHARS_INDEX.apply(text)
+    return text + line_ending
+
+
+def _fix_abbreviations(text):
+    # Apply general English spaced abbreviations pattern, then the imported XML abbreviation rules
+    while english_abbr_pattern.search(text):
+        text = english_abbr_pattern.sub("", text)
+    return ABBREVIATION_INDEX.apply(text)
+
+
+def _fix_parentheses(text):
+    return PARENTHESES_INDEX.apply(normalize_leading_brackets(text))
+
+
+def _fix_double_quotes(text):
+    return fix_double_quote_placement(DOUBLE_QUOTES_INDEX.apply(text))
+
+
+def _remove_standalone_dots(text):
+    # Standalone dots at the start and the end of the line, ignoring tags, zero-width chars and music symbols
+    return end_dot_pattern.sub("", start_dot_pattern.sub(r"\1\2", text))
+
+
+def _translate_arabic_chars(text):
+    return text.translate(ARABIC_CHAR_TRANS)
+
+
+def _translate_arabic_numerals(text):
+    return text.translate(ARABIC_NUM_TRANS)
+
+
+def _remove_empty_tags(text):
+    while empty_tag_pattern.search(text):
+        text = empty_tag_pattern.sub("", text)
+    return text
+
+
+def _stop_at_timecode_or_index(state):
+    # Text lines that look like a timecode or an index only get the pre-process trimming
+    return bool(timecode_pattern.match(state.original) or index_pattern.match(state.original))
+
+
+def _pre_trim_stage(trim_spaces):
+    def stage(state):
+        if trim_spaces:
+            state.text = trim_line_spaces(state.text)
+        # Logged against the original line, so it also covers the alignment tags removed before
+        if state.text != state.original:
+            state.record.changed = True
+            state.signature = line_signature(state.text) | SIG_ALWAYS
+            state.log("Pre-Process Trim Spaces", state.original, state.text)
+
+    return stage
+
+
+def _comma_fixes(state):
+    # Comma rules only apply to lines that are not purely English
+    if not state.pure_english:
+        state.change("Pre-Process Comma Fixes", COMMA_INDEX.apply(state.text))
+
+
+def _remove_unneeded_spaces(state):
+    # Skip space cleaning for subtitle comment lines with open/close markers (e.g., .: :. or ..:: ::..)
+    if not re.search(r"\.{1,2}:{1,2}.*?:{1,2}\.{1,2}", state.text):
+        unneeded_steps = []
+        after = UNNEEDED_SPACES_INDEX.apply(state.text, unneeded_steps)
+        # Log every individual rule step that modified the line
+        for step_before, step_after in unneeded_steps:
+            state.record.changed = True
+            state.log("Pre-Process Remove Unneeded Spaces", step_before, step_after)
+        if after != state.text:
+            state.text = after
+            state.signature = line_signature(after) | SIG_ALWAYS
+
+
+def _persian_question_mark_and_comma(state):
+    after = state.text.replace("?", "؟")
+    if not state.pure_english:
+        after = after.replace(",", "،")
+    state.change("Pre-Process Persian Question Mark and Comma", after)
+
+
+def _english_num_to_persian(state):
+    text = state.text
+    # Drop lines that are empty or contain only numbers, special characters and tags
+    if not text.strip() or not any(c.isalpha() or "\u0600" <= c <= "\u06ff" for c in text):
+        state.text = None
+        return True
+    state.change("Pre-Process English Numerals", convert_english_numerals(text))
+
+
+def _bypass_list(state):
+    if state.bypass_regexes:
+        word = state.bypass_regexes.first_match(state.text)
+        if word is not None:
+            state.bypassed = True
+            state.note(f'Line {state.index} bypassed | Matched "{word}" in Bypass List. No further process changes applied.')
+
+
+def _remove_list(state):
+    if state.remove_regexes and not state.bypassed:
+        word = state.remove_regexes.first_match(state.text)
+        if word is not None:
+            state.record.changed = True
+            curr_clean = state.text.rstrip("\n")
+            state.note(
+                f'Line {state.index} removed | Matched "{word}" in Remove List. Entire line deleted. The line was: "{curr_clean}"'
+            )
+            state.text = None
+            return True
+
+
+def _replace_list(state):
+    if state.replace_regexes and not state.bypassed:
+        replace_steps = []
+        state.text = state.replace_regexes.remove_matches(state.text, replace_steps)
+        # Log every word that modified the line
+        for word, before_replace, after_replace in replace_steps:
+            state.record.changed = True
+            state.log(f'Replace List (Matched "{word}")', before_replace, after_replace)
+        if replace_steps:
+            state.signature = line_signature(state.text) | SIG_ALWAYS
+
+
+def _post_trim_spaces(state):
+    if state.text:
+        state.change("Post-Process Trim Spaces", trim_line_spaces(state.text))
+
+
+def build_line_pipeline(options):
+    """
+    Compiles the line stages enabled by options into a flat tuple of (guard, stage) pairs, in the order
+    of the reference loop SubtitleProcessor._process_lines. A stage runs on a LineState whose signature
+    has a guard bit and returns True when the line is done, its text being None when the line is dropped.
+    Without detailed subtitle logs, the stages are compiled without their logging.
+    """
+    detailed = options.get("detailed_subtitle_logs", 1)
+    stages = []
+    if options.get("remove_alignment_tags", 1):
+        stages.append((SIG_BRACE, _text_stage("Pre-Process Remove Alignment Tags", _remove_alignment_tags, detailed)))
+    if options.get("remove_alignment_tags", 1) or options.get("trim_spaces", 1):
+        stages.append((SIG_ALWAYS, _pre_trim_stage(options.get("trim_spaces", 1))))
+    stages.append((SIG_ALWAYS, _stop_at_timecode_or_index))
+
+    if options.get("fix_misplaced_chars", 1):
+        stages.append(
+            (SIG_MISPLACED_CHARS, _text_stage("Pre-Process Fix Misplaced Chars", _fix_misplaced_chars, detailed))
+        )
+    if options.get("fix_abbreviations", 1):
+        stages.append((SIG_ALWAYS, _text_stage("Pre-Process Fix Abbreviations", _fix_abbreviations, detailed)))
+    if options.get("comma_fixes", 1):
+        stages.append((SIG_COMMA, _comma_fixes))
+    if options.get("exclamation_fixes", 1):
+        stages.append(
+            (SIG_EXCLAMATION, _text_stage("Pre-Process Exclamation Mark Fixes", EXCLAMATION_INDEX.apply, detailed))
+        )
+    if options.get("parentheses_fixes", 1):
+        stages.append((SIG_BRACKET, _text_stage("Pre-Process Parentheses Fixes", _fix_parentheses, detailed)))
+    if options.get("question_mark_fixes", 1):
+        stages.append(
+            (SIG_QUESTION_MARK, _text_stage("Pre-Process Question Mark Fixes", QUESTION_MARK_INDEX.apply, detailed))
+        )
+    if options.get("double_quotes_fixes", 1) == 1:
+        stages.append((SIG_DOUBLE_QUOTE, _text_stage("Pre-Process Double-Quotes Fixes", _fix_double_quotes, detailed)))
+    if options.get("dash_fixes", 1) == 1:
+        stages.append((SIG_DASH, _text_stage("Pre-Process Dash Fixes", DASH_INDEX.apply, detailed)))
+    if options.get("comments_fixes", 1) == 1:
+        stages.append((SIG_COMMENT, _text_stage("Pre-Process Comments Fixes", COMMENTS_INDEX.apply, detailed)))
+    if options.get("dialog_hyphen_fix", 1) == 1:
+        stages.append((SIG_ALWAYS, _text_stage("Pre-Process Dialog Hyphen Fix", DIALOG_HYPHEN_INDEX.apply, detailed)))
+    if options.get("remove_standalone_dots", 1):
+        stages.append((SIG_DOT, _text_stage("Pre-Process Remove Standalone Dots", _remove_standalone_dots, detailed)))
+    if options.get("remove_unneeded_spaces", 1):
+        stages.append((SIG_WHITESPACE, _remove_unneeded_spaces))
+    if options.get("persian_question_mark_and_comma", 1):
+        stages.append((SIG_LATIN_QUESTION_COMMA, _persian_question_mark_and_comma))
+    if options.get("arabic_char_to_persian", 1):
+        stages.append((SIG_ARABIC_CHAR, _text_stage("Pre-Process Arabic Chars", _translate_arabic_chars, detailed)))
+    if options.get("arabic_num_to_persian", 1):
+        stages.append(
+            (SIG_ARABIC_DIGIT, _text_stage("Pre-Process Arabic Numerals", _translate_arabic_numerals, detailed))
+        )
+    if options.get("english_num_to_persian", 1):
+        stages.append((SIG_ENGLISH_DIGIT, _english_num_to_persian))
+    if options.get("space_to_invisible_space", 1):
+        stages.append(
+            (
+                SIG_ALWAYS,
+                _text_stage("Pre-Process Space to Invisible Space", SPACE_TO_INVISIBLE_SPACE_INDEX.apply, detailed),
+            )
+        )
+    if options.get("hexre_fixes", 1):
+        stages.append((SIG_HEH, _text_stage("Pre-Process Hexre Typo Fixes", HEXRE_INDEX.apply, detailed)))
+
+    if options.get("bypass_enabled", 1):
+        stages.append((SIG_ALWAYS, _bypass_list))
+    if options.get("remove_enabled", 1):
+        stages.append((SIG_ALWAYS, _remove_list))
+    if options.get("replace_enabled", 1):
+        stages.append((SIG_ALWAYS, _replace_list))
+
+    if options.get("post_trim_spaces", 1):
+        stages.append((SIG_ALWAYS, _post_trim_spaces))
+    if options.get("remove_empty_tags", 1):
+        stages.append((SIG_TAG, _text_stage("Post-Process Remove Empty Tags", _remove_empty_tags, detailed)))
+    return tuple(stages)
+
+
+def cached_line_pipeline(options):
+    """
+    Returns build_line_pipeline(options), reusing the pipeline compiled for the same options fingerprint,
+    e.g. by an earlier run of the GUI with the same settings. At most LINE_PIPELINE_CACHE_SIZE are kept.
+    """
+    fingerprint = options_fingerprint(options, ENGINE_OPTION_KEYS)
+    with _line_pipelines_lock:
+        stages = _line_pipelines.pop(fingerprint, None)
+        if stages is None:
+            stages = build_line_pipeline(options)
+        if len(_line_pipelines) >= LINE_PIPELINE_CACHE_SIZE:
+            _line_pipelines.pop(next(iter(_line_pipelines)))
+        _line_pipelines[fingerprint] = stages
+    return stages
+
+
 class SubtitleProcessor:
     # Added target_files to handle single file process mode
     def __init__(
@@ -411,9 +1568,58 @@ class SubtitleProcessor:
         self.total_lines_processed = 0
         self.elapsed_time = 0
 
-        self.total_input_lines = 0
+        # Progress is accounted in bytes: completed files count fully, the current one by its processed share
+        self.total_input_bytes = 0
+        self.processed_bytes = 0
+        self.current_file_bytes = 0
+        self.current_file_lines = 0
+        self.current_file_line_base = 0
         self.last_progress_reported = -1
 
+        # Worker processes for intra-file parallelism, started with the first file large enough to need them
+        self._line_pool = None
+        # In the pipelined mode, outputs are handed to the writer stage instead of being saved in place
+        self._defer_saves = False
+        self._counter_lock = threading.Lock()
+        # Outcome of every processed file by path (status, output or error), e.g. for the command line report
+        self.file_results = {}
+
+        # Processed text lines are memoized across files and runs in the shared LINE_CACHE. Engine settings
+        # never change the result of a line, so they are left out of the fingerprint.
+        self.line_cache = None
+        self.line_cache_fingerprint = None
+        line_cache_entries = int(self.options.get("line_cache_entries", 20000))
+        if line_cache_entries > 0:
+            LINE_CACHE.resize(line_cache_entries)
+            self.line_cache = LINE_CACHE
+            self.line_cache_fingerprint = options_fingerprint(self.options, ENGINE_OPTION_KEYS)
+
+        # Whole files processed earlier with the same settings are reused from a content-addressed folder
+        self.output_cache = None
+        self.output_cache_settings = None
+        self.output_cache_hits = 0
+        self.output_cache_misses = 0
+        self._pending_cache_entries = {}
+        if self.options.get("output_cache", 0):
+            cache_dir = self.options.get("output_cache_dir", "") or os.path.join(CONFIG_DIR, "Output-Cache")
+            max_bytes = float(self.options.get("output_cache_max_mb", 1024)) * 1024 * 1024
+            self.output_cache = OutputCache(cache_dir, max_bytes)
+            self.output_cache_settings = (
+                options_fingerprint(self.options, ENGINE_OPTION_KEYS).hex() + processing_code_version()
+            )
+
+        # General and process logs are rotated past this size; the limit travels with every write of this run
+        self.log_rotate_bytes = log_rotate_bytes(self.options)
+
+        # The run ledger records every file's state with its input digest, so a crashed run can be resumed
+        self._ledger = None
+        # Line stages enabled by this run's options (see build_line_pipeline); None runs the reference loop
+        self.line_pipeline = None
+        if self.options.get("compiled_line_pipeline", 1):
+            self.line_pipeline = cached_line_pipeline(self.options)
+        self._hash_inputs = self.output_cache is not None or bool(self.options.get("run_ledger", 0))
+        self._input_digests = {}
+
     def _report_convert_start(self):
         if self.convert_start_callback:
             try:
@@ -428,16 +1634,38 @@ class SubtitleProcessor:
             except Exception:
                 pass
 
-    def _report_progress(self):
+    def _start_file_progress(self, file_bytes):
+        self.current_file_bytes = file_bytes
+        self.current_file_lines = 0
+
+    def _track_file_lines(self, line_count):
+        """Measures progress within the current file by its processed lines, once they have been read."""
+        self.current_file_lines = line_count
+        self.current_file_line_base = self.total_lines_processed
+
+    def _finish_file_progress(self):
+        self.processed_bytes += self.current_file_bytes
+        self.current_file_bytes = 0
+        self.current_file_lines = 0
+        self._report_progress()
+
+    def _report_progress(self, file_fraction=None):
         if not self.progress_callback:
             return
 
-        if self.total_input_lines <= 0:
+        if self.total_input_bytes <= 0:
             return
 
-        percent = (self.total_lines_processed / self.total_input_lines) * 100
+        if file_fraction is None:
+            file_fraction = 0.0
+            if self.current_file_lines > 0:
+                file_fraction = (self.total_lines_processed - self.current_file_line_base) / self.current_file_lines
+
+        processed_bytes = self.processed_bytes + self.current_file_bytes * min(max(file_fraction, 0.0), 1.0)
+        percent = (processed_bytes / self.total_input_bytes) * 100
 
-        if percent == self.last_progress_reported:
+        # A streamed file that falls back to the buffered path is re-read; progress never moves backwards
+        if percent <= self.last_progress_reported:
             return
 
         self.last_progress_reported = percent
@@ -454,893 +1682,1718 @@ class SubtitleProcessor:
             except Exception:
                 pass
 
-    def run(self):
-        # Determine files to process based on execution mode
-        valid_extensions = (".srt", ".txt", ".vtt", ".ass")
+    def _process_lines_batched(
+        self,
+        document,
+        file_subtitle_logs,
+        detailed_logs_enabled,
+        bypass_regexes,
+        remove_regexes,
+        replace_regexes,
+    ):
+        """
+        File-level batched variant of the per-line loop _process_lines, which stays the reference.
+
+        Every stage runs over all eligible text lines of the file before the next stage starts, and
+        rule-list stages apply each rule once to the joined lines (see RuleIndex.apply_lines).
+        Per-line logs are buffered and emitted in line order, so the output and the change logs
+        are identical to the per-line loop. Results are written back into the document's lines;
+        returns file_has_changes.
+        """
+        options = self.options
+
+        self.total_lines_processed += len(document.lines)
+
+        # Column state for every subtitle text line, addressed by position
+        line_numbers = sorted(document.text_indices)
+        originals = [document.lines[index - document.first_line] for index in line_numbers]
+        texts = list(originals)
+        signatures = [line_signature(text) for text in texts]
+        pure_english = [is_pure_english(text) for text in texts]
+        line_logs = [[] for _ in texts]
+        dropped = [False] * len(texts)
+        changed = [False] * len(texts)
+
+        # Lines found in the line cache take their result and logs from it and skip every stage
+        cached = [None] * len(texts)
+        if self.line_cache is not None:
+            for position, original in enumerate(originals):
+                entry = self.line_cache.get(self.line_cache_fingerprint, original)
+                if entry is not None:
+                    cached[position] = entry
+                    result, changed[position], log_template = entry
+                    if result is None:
+                        dropped[position] = True
+                    else:
+                        texts[position] = result
+                    line_logs[position] = line_logs_from_template(line_numbers[position], log_template)
+
+        def record_change(position, option_name, after, before=None):
+            if before is None:
+                before = texts[position]
+            texts[position] = after
+            signatures[position] = line_signature(after)
+            changed[position] = True
+            _log_change(
+                line_numbers[position], option_name, before, after, line_logs[position], detailed_logs_enabled
+            )
 
-        if self.target_files:
-            srt_files_paths = [f for f in self.target_files if f.lower().endswith(valid_extensions)]
-            if srt_files_paths:
-                Logger.log_process(
-                    f"Single file process started. Found {len(srt_files_paths)} file(s).",
-                    os.path.dirname(srt_files_paths[0]),
-                )
-        else:
-            if not self.folder_path or not os.path.isdir(self.folder_path):
-                return
-            all_files = os.listdir(self.folder_path)
-            srt_files_paths = [
-                os.path.join(self.folder_path, f) for f in all_files if f.lower().endswith(valid_extensions)
+        def stage_positions(signature_bit=None, condition=None):
+            return [
+                position
+                for position in active
+                if (signature_bit is None or signatures[position] & signature_bit)
+                and (condition is None or condition(position))
             ]
-            if not srt_files_paths:
-                Logger.log_process(
-                    "No valid subtitle files (.srt, .txt, .vtt, .ass) found to process.", self.folder_path
-                )
-                return
-            Logger.log_process(f"Process started. Found {len(srt_files_paths)} file(s).", self.folder_path)
 
-        # Cache ALL options to avoid thousands of dictionary lookups during line processing
-        opt_bypass_enabled = self.options.get("bypass_enabled", 1)
-        opt_remove_enabled = self.options.get("remove_enabled", 1)
-        opt_replace_enabled = self.options.get("replace_enabled", 1)
+        def run_line_stage(option_name, signature_bit, transform, condition=None):
+            for position in stage_positions(signature_bit, condition):
+                after = transform(texts[position])
+                if after != texts[position]:
+                    record_change(position, option_name, after)
+
+        def run_rule_stage(option_name, signature_bit, rule_index, prepare=None, finish=None, condition=None):
+            positions = stage_positions(signature_bit, condition)
+            inputs = [texts[position] for position in positions]
+            if prepare:
+                inputs = [prepare(text) for text in inputs]
+            for position, after in zip(positions, rule_index.apply_lines(inputs)):
+                if finish:
+                    after = finish(after)
+                if after != texts[position]:
+                    record_change(position, option_name, after)
+
+        # --- Pre-Process: alignment tags and trimming run on every text line ---
+        active = [position for position in range(len(texts)) if cached[position] is None]
+
+        if options.get("remove_alignment_tags", 1):
+            run_line_stage(
+                "Pre-Process Remove Alignment Tags",
+                SIG_BRACE,
+                lambda text: ALIGNMENT_TAG_RE.sub("", text),
+                lambda position: "an" in texts[position].lower(),
+            )
 
-        opt_remove_alignment_tags = self.options.get("remove_alignment_tags", 1)
-        opt_trim_spaces = self.options.get("trim_spaces", 1)
-        opt_fix_misplaced_chars = self.options.get("fix_misplaced_chars", 1)
-        opt_fix_abbreviations = self.options.get("fix_abbreviations", 1)
-        opt_comma_fixes = self.options.get("comma_fixes", 1)
-        opt_exclamation_fixes = self.options.get("exclamation_fixes", 1)
-        opt_parentheses_fixes = self.options.get("parentheses_fixes", 1)
-        opt_question_mark_fixes = self.options.get("question_mark_fixes", 1)
-        opt_double_quotes_fixes = self.options.get("double_quotes_fixes", 1) == 1
-        opt_dash_fixes = self.options.get("dash_fixes", 1) == 1
-        opt_comments_fixes = self.options.get("comments_fixes", 1) == 1
-        opt_dialog_hyphen_fix = self.options.get("dialog_hyphen_fix", 1) == 1
-        opt_remove_standalone_dots = self.options.get("remove_standalone_dots", 1)
-        opt_remove_unneeded_spaces = self.options.get("remove_unneeded_spaces", 1)
-        opt_persian_question_mark_and_comma = self.options.get("persian_question_mark_and_comma", 1)
-        opt_arabic_char_to_persian = self.options.get("arabic_char_to_persian", 1)
-        opt_arabic_num_to_persian = self.options.get("arabic_num_to_persian", 1)
-        opt_english_num_to_persian = self.options.get("english_num_to_persian", 1)
-        opt_space_to_invisible_space = self.options.get("space_to_invisible_space", 1)
-        opt_hexre_fixes = self.options.get("hexre_fixes", 1)
-
-        opt_post_trim_spaces = self.options.get("post_trim_spaces", 1)
-        opt_remove_empty_tags = self.options.get("remove_empty_tags", 1)
-        opt_remove_negative_timecodes = self.options.get("remove_negative_timecodes", 1)
-        opt_fix_misplaced_timecodes = self.options.get("fix_misplaced_timecodes", 1)
-        opt_remove_duplicate_subtitles = self.options.get("remove_duplicate_subtitles", 1)
-        opt_fix_overlapping_timecodes = self.options.get("fix_overlapping_timecodes", 1)
-        opt_remove_empty_subtitles = self.options.get("remove_empty_subtitles", 1)
-        opt_add_intro_credit = self.options.get("add_intro_credit", 0)
-        opt_reformat_renumber = self.options.get("reformat_renumber", 1)
-        opt_force_rtl = self.options.get("force_rtl", 1)
-        opt_encode_utf8 = self.options.get("encode_utf8", 1)
-        opt_delete_original = self.options.get("delete_original", 0)
-        detailed_logs_enabled = self.options.get("detailed_subtitle_logs", 1)
-        opt_convert_ass_comments = self.options.get("convert_ass_comments", 0)
-        opt_delete_converted_temp_files = self.options.get("delete_converted_temp_files", 0)
-
-        # Extract Process configuration variables
-        bypass_list = [w.strip() for w in self.options.get("bypass_list", "").split("\n") if w.strip()]
-        # Pre-compile regexes for bypass list to optimize performance
-        bypass_regexes = []
-        for w in bypass_list:
-            regex = build_flexible_regex(w)
-            if regex:
-                bypass_regexes.append((w, regex))
+        trim_spaces = options.get("trim_spaces", 1)
+        for position in active:
+            after = trim_line_spaces(texts[position]) if trim_spaces else texts[position]
+            # Logged against the original line, like the per-line loop
+            if after != originals[position]:
+                record_change(position, "Pre-Process Trim Spaces", after, originals[position])
+
+        # Timecode or index lines inside a block are only pre-processed
+        active = [
+            position
+            for position in active
+            if not (timecode_pattern.match(originals[position]) or index_pattern.match(originals[position]))
+        ]
+
+        if options.get("fix_misplaced_chars", 1):
+            positions = stage_positions(SIG_MISPLACED_CHARS)
+            bodies = []
+            line_endings = []
+            for position in positions:
+                text = texts[position]
+                line_ending = "\r\n" if text.endswith("\r\n") else "\n" if text.endswith("\n") else ""
+                line_endings.append(line_ending)
+                bodies.append(text[: len(text) - len(line_ending)])
+
+            # Comment lines keep their punctuation untouched
+            rule_ids = [i for i, body in enumerate(bodies) if not misplaced_chars_comment_pattern.fullmatch(body)]
+            fixed_bodies = MISPLACED_CHARS_INDEX.apply_lines([bodies[i] for i in rule_ids])
+            for i, fixed_body in zip(rule_ids, fixed_bodies):
+                bodies[i] = fixed_body
+
+            for position, body, line_ending in zip(positions, bodies, line_endings):
+                after = body + line_ending
+                if after != texts[position]:
+                    record_change(position, "Pre-Process Fix Misplaced Chars", after)
+
+        if options.get("fix_abbreviations", 1):
+
+            def remove_abbreviation_spaces(text):
+                while english_abbr_pattern.search(text):
+                    text = english_abbr_pattern.sub("", text)
+                return text
+
+            run_rule_stage(
+                "Pre-Process Fix Abbreviations", None, ABBREVIATION_INDEX, prepare=remove_abbreviation_spaces
+            )
 
-        remove_list = [w.strip() for w in self.options.get("remove_list", "").split("\n") if w.strip()]
-        # Pre-compile regexes for remove list to optimize performance
-        remove_regexes = []
-        for w in remove_list:
-            regex = build_flexible_regex(w)
-            if regex:
-                remove_regexes.append((w, regex))
+        if options.get("comma_fixes", 1):
+            run_rule_stage(
+                "Pre-Process Comma Fixes",
+                SIG_COMMA,
+                COMMA_INDEX,
+                condition=lambda position: not pure_english[position],
+            )
 
-        replace_list = [w.strip() for w in self.options.get("replace_list", "").split("\n") if w.strip()]
-        # Pre-compile regexes for replace list to optimize performance
-        replace_regexes = []
-        for w in replace_list:
-            regex = build_flexible_regex(w)
-            if regex:
-                replace_regexes.append((w, regex))
+        if options.get("exclamation_fixes", 1):
+            run_rule_stage("Pre-Process Exclamation Mark Fixes", SIG_EXCLAMATION, EXCLAMATION_INDEX)
 
-        start_time = time.time()
-        self._report_convert_start()
-        converted_files = []
+        if options.get("parentheses_fixes", 1):
+            run_rule_stage(
+                "Pre-Process Parentheses Fixes",
+                SIG_BRACKET,
+                PARENTHESES_INDEX,
+                prepare=normalize_leading_brackets,
+            )
 
-        for file_path in srt_files_paths:
+        if options.get("question_mark_fixes", 1):
+            run_rule_stage("Pre-Process Question Mark Fixes", SIG_QUESTION_MARK, QUESTION_MARK_INDEX)
 
-            actual_file_path, validation_success = process_and_convert_if_needed(
-                file_path,
-                TimestampedLogBuffer(),
-                TimestampedLogBuffer(),
-                False,
-                opt_convert_ass_comments,
+        if options.get("double_quotes_fixes", 1) == 1:
+            run_rule_stage(
+                "Pre-Process Double-Quotes Fixes",
+                SIG_DOUBLE_QUOTE,
+                DOUBLE_QUOTES_INDEX,
+                finish=fix_double_quote_placement,
             )
 
-            if validation_success:
-                converted_files.append(actual_file_path)
+        if options.get("dash_fixes", 1) == 1:
+            run_rule_stage("Pre-Process Dash Fixes", SIG_DASH, DASH_INDEX)
 
-        self.total_input_lines = 0
+        if options.get("comments_fixes", 1) == 1:
+            run_rule_stage("Pre-Process Comments Fixes", SIG_COMMENT, COMMENTS_INDEX)
 
-        for converted_file in converted_files:
-            try:
-                with open(converted_file, "r", encoding="utf-8", errors="ignore") as f:
-                    self.total_input_lines += sum(1 for _ in f)
-            except Exception:
-                pass
+        if options.get("dialog_hyphen_fix", 1) == 1:
+            run_rule_stage("Pre-Process Dialog Hyphen Fix", None, DIALOG_HYPHEN_INDEX)
 
-        self._report_process_start()
-        for file_path in srt_files_paths:
-            filename = os.path.basename(file_path)
-            current_file_dir = os.path.dirname(file_path)
-
-            # Define output directory path dynamically for the current file
-            output_dir = os.path.join(current_file_dir, "Outputs")
-            os.makedirs(output_dir, exist_ok=True)
-            # Initialize timestamped log buffers for the current file to aggregate disk I/O
-            file_process_logs = TimestampedLogBuffer()
-            file_subtitle_logs = TimestampedLogBuffer()
-            file_has_changes = False
-            actual_file_path = file_path
-            converted_temp_file = False
-
-            file_process_logs.append(f"Identified file: {filename}")
-
-            # Check and convert alternative formats before reading
-            actual_file_path, validation_success = process_and_convert_if_needed(
-                file_path,
-                file_process_logs,
-                file_subtitle_logs,
-                detailed_logs_enabled,
-                opt_convert_ass_comments,
+        if options.get("remove_standalone_dots", 1):
+            run_line_stage(
+                "Pre-Process Remove Standalone Dots",
+                SIG_DOT,
+                lambda text: end_dot_pattern.sub("", start_dot_pattern.sub(r"\1\2", text)),
             )
 
-            converted_temp_file = validation_success and actual_file_path != file_path
+        if options.get("remove_unneeded_spaces", 1):
+            # Skip space cleaning for subtitle comment lines with open/close markers
+            positions = stage_positions(
+                SIG_WHITESPACE,
+                lambda position: not re.search(r"\.{1,2}:{1,2}.*?:{1,2}\.{1,2}", texts[position]),
+            )
+            unneeded_steps = [[] for _ in positions]
+            outputs = UNNEEDED_SPACES_INDEX.apply_lines([texts[position] for position in positions], unneeded_steps)
+            for position, after, line_steps in zip(positions, outputs, unneeded_steps):
+                # Log every individual rule step that modified the line
+                for step_before, step_after in line_steps:
+                    changed[position] = True
+                    _log_change(
+                        line_numbers[position],
+                        "Pre-Process Remove Unneeded Spaces",
+                        step_before,
+                        step_after,
+                        line_logs[position],
+                        detailed_logs_enabled,
+                    )
+                if after != texts[position]:
+                    texts[position] = after
+                    signatures[position] = line_signature(after)
 
-            if not validation_success:
-                file_process_logs.append(f"Validation failed for unsupported or corrupted format: {filename}")
-                self._report_progress()
-                self.failed_count += 1
-                continue  # Skip processing for this invalid file
+        if options.get("persian_question_mark_and_comma", 1):
 
-            try:
-                # Smart encoding reader on actual_file_path instead of original file_path
-                encodings_to_try = ["utf-8", "utf-8-sig", "utf-16", "cp1256", "cp1252"]
-                file_encoding = "utf-8"
-                lines = []
-
-                for enc in encodings_to_try:
-                    try:
-                        with open(actual_file_path, "r", encoding=enc) as f:  # Use actual_file_path here
-                            lines = f.readlines()
-                        file_encoding = enc
-                        break
-                    except UnicodeError:
-                        continue
-                else:
-                    # Fallback if all fail
-                    file_encoding = "utf-8"
-                    with open(
-                        actual_file_path, "r", encoding="utf-8", errors="ignore"
-                    ) as f:  # Use actual_file_path here
-                        lines = f.readlines()
+            def persian_question_mark_and_comma(position):
+                text = texts[position].replace("?", "؟")
+                return text if pure_english[position] else text.replace(",", "،")
 
-                file_process_logs.append(f"Identified encoding: {file_encoding}")
+            for position in stage_positions(SIG_LATIN_QUESTION_COMMA):
+                after = persian_question_mark_and_comma(position)
+                if after != texts[position]:
+                    record_change(position, "Pre-Process Persian Question Mark and Comma", after)
 
-                # Pre-parse blocks to identify and isolate valid text lines from timecodes/indexes
-                parsed_blocks_for_index = parse_srt_blocks(lines)
-                valid_text_indices = set()
-                for b in parsed_blocks_for_index:
-                    valid_text_indices.update(b.get("text_indices", []))
-
-                processed_lines = []
+        if options.get("arabic_char_to_persian", 1):
+            run_line_stage(
+                "Pre-Process Arabic Chars", SIG_ARABIC_CHAR, lambda text: text.translate(ARABIC_CHAR_TRANS)
+            )
 
-                if detailed_logs_enabled:
-                    file_subtitle_logs.append(f"Started tracking changes for: {filename}")
+        if options.get("arabic_num_to_persian", 1):
+            run_line_stage(
+                "Pre-Process Arabic Numerals", SIG_ARABIC_DIGIT, lambda text: text.translate(ARABIC_NUM_TRANS)
+            )
 
-                timecode_match = timecode_pattern.match
-                index_match = index_pattern.match
+        if options.get("english_num_to_persian", 1):
+            for position in stage_positions(SIG_ENGLISH_DIGIT):
+                text = texts[position]
+                # Lines without actual text are dropped from the output by the per-line loop as well
+                if not text.strip() or not any(c.isalpha() or "\u0600" <= c <= "\u06ff" for c in text):
+                    dropped[position] = True
+                    continue
+                after = convert_english_numerals(text)
+                if after != text:
+                    record_change(position, "Pre-Process English Numerals", after)
+            active = [position for position in active if not dropped[position]]
+
+        if options.get("space_to_invisible_space", 1):
+            run_rule_stage("Pre-Process Space to Invisible Space", None, SPACE_TO_INVISIBLE_SPACE_INDEX)
+
+        if options.get("hexre_fixes", 1):
+            run_rule_stage("Pre-Process Hexre Typo Fixes", SIG_HEH, HEXRE_INDEX)
+
+        # --- Process Options ---
+        for position in active:
+            index = line_numbers[position]
+
+            if options.get("bypass_enabled", 1) and bypass_regexes:
+                bypass_word = bypass_regexes.first_match(texts[position])
+                if bypass_word is not None:
+                    if detailed_logs_enabled:
+                        line_logs[position].append(
+                            f'Line {index} bypassed | Matched "{bypass_word}" in Bypass List. No further process changes applied.'
+                        )
+                    continue
+
+            if options.get("remove_enabled", 1) and remove_regexes:
+                remove_word = remove_regexes.first_match(texts[position])
+                if remove_word is not None:
+                    changed[position] = True
+                    dropped[position] = True
+                    if detailed_logs_enabled:
+                        curr_clean = texts[position].rstrip("\n")
+                        line_logs[position].append(
+                            f'Line {index} removed | Matched "{remove_word}" in Remove List. Entire line deleted. The line was: "{curr_clean}"'
+                        )
+                    continue
+
+            if options.get("replace_enabled", 1) and replace_regexes:
+                replace_steps = []
+                replace_regexes.remove_matches(texts[position], replace_steps)
+                for word, _, after in replace_steps:
+                    record_change(position, f'Replace List (Matched "{word}")', after)
+        active = [position for position in active if not dropped[position]]
+
+        # --- Post-Process Options ---
+        if options.get("post_trim_spaces", 1):
+            run_line_stage(
+                "Post-Process Trim Spaces", None, trim_line_spaces, lambda position: bool(texts[position])
+            )
 
-                for index, line in enumerate(lines, start=1):
-                    self.total_lines_processed += 1
-                    if (self.total_lines_processed % 250) == 0:
-                        self._report_progress()
+        if options.get("remove_empty_tags", 1):
 
-                    # Skip all processing if the line is not a subtitle text (e.g., timecodes, indexes, empty lines)
-                    if index not in valid_text_indices:
-                        processed_lines.append(line)
-                        continue
+            def remove_empty_tags(text):
+                while empty_tag_pattern.search(text):
+                    text = empty_tag_pattern.sub("", text)
+                return text
 
-                    original_line = line
-                    current_line = original_line
-                    line_is_pure_english = is_pure_english(current_line)
+            run_line_stage("Post-Process Remove Empty Tags", SIG_TAG, remove_empty_tags)
 
-                    # Check if line is standard subtitle timecode or index number
-                    is_timecode_or_index = bool(timecode_match(current_line) or index_match(current_line))
+        if self.line_cache is not None:
+            for position, original in enumerate(originals):
+                if cached[position] is None:
+                    self.line_cache.put(
+                        self.line_cache_fingerprint,
+                        original,
+                        None if dropped[position] else texts[position],
+                        changed[position],
+                        line_log_template(line_numbers[position], line_logs[position]),
+                    )
 
-                    # Apply Pre-Process Option: Remove Alignment Tags
-                    # Fast path guard: Check for '{' and 'an'/'AN'
-                    if opt_remove_alignment_tags and "{" in current_line and "an" in current_line.lower():
-                        before_align = current_line
-                        current_line = ALIGNMENT_TAG_RE.sub("", current_line)
+        # Emit buffered logs in line order and write the lines back
+        for messages in line_logs:
+            for message in messages:
+                file_subtitle_logs.append(message)
+
+        for index, text, is_dropped in zip(line_numbers, texts, dropped):
+            document.lines[index - document.first_line] = None if is_dropped else text
+
+        return any(changed)
+
+    def _iter_uncached_lines(self, line_iterator, document, line_record):
+        """
+        Yields the (index, line) pairs of the per-line loop, except subtitle text lines found in the
+        line cache, whose result and logs are replayed here instead. The outcome of every yielded text
+        line is stored in the cache once the loop asks for the next line. When the lines run out,
+        line_record holds the file's log buffer again and whether any line changed.
+        """
+        file_logs = line_record.logs
+        file_changed = False
+        text_indices = document.text_indices
+        line_cache = self.line_cache
+        fingerprint = self.line_cache_fingerprint
+
+        for index, line in line_iterator:
+            if index not in text_indices:
+                yield index, line
+                continue
+
+            entry = line_cache.get(fingerprint, line)
+            if entry is not None:
+                self.total_lines_processed += 1
+                if (self.total_lines_processed % 250) == 0:
+                    self._report_progress()
+                result, changed, log_template = entry
+                document.lines[index - 1] = result
+                for message in line_logs_from_template(index, log_template):
+                    file_logs.append(message)
+                file_changed = file_changed or changed
+                continue
+
+            line_record.changed = False
+            line_record.logs = []
+            yield index, line
+            line_cache.put(
+                fingerprint,
+                line,
+                document.lines[index - 1],
+                line_record.changed,
+                line_log_template(index, line_record.logs),
+            )
+            for message in line_record.logs:
+                file_logs.append(message)
+            file_changed = file_changed or line_record.changed
+
+        line_record.changed = file_changed
+        line_record.logs = file_logs
+
+    def _process_lines_parallel(self, document, file_subtitle_logs, chunk_lines, rule_lists):
+        """
+        Runs _process_lines_batched over chunks of a document on worker processes and writes the
+        results back in order. Chunks end after a blank line (see iter_line_windows), so each one
+        parses like its part of the file, and their logs concatenate to the logs of the whole file.
+        The dialog-hyphen and block-level stages still run on the whole document afterwards.
+        Returns file_has_changes.
+        """
+        if self._line_pool is None:
+            workers = int(self.options.get("parallel_workers", 0)) or os.cpu_count() or 1
+            self._line_pool = self._parallel_executor(workers, rule_lists)
+
+        file_has_changes = False
+        chunks = iter_line_windows(document.lines, chunk_lines)
+        for first_line, chunk_output, chunk_logs, chunk_has_changes in self._line_pool.map(
+            _process_line_chunk_in_worker, *zip(*chunks)
+        ):
+            start = first_line - document.first_line
+            document.lines[start : start + len(chunk_output)] = chunk_output
+            file_subtitle_logs.extend(chunk_logs)
+            if chunk_has_changes:
+                file_has_changes = True
+            self.total_lines_processed += len(chunk_output)
+            self._report_progress()
+
+        return file_has_changes
+
+    def _process_file_streaming(
+        self,
+        file_path,
+        file_encoding,
+        output_file_path,
+        out_encoding,
+        file_subtitle_logs,
+        detailed_logs_enabled,
+        bypass_regexes,
+        remove_regexes,
+        replace_regexes,
+        source_lines=None,
+    ):
+        """
+        Streaming variant of the per-file processing in run(), for files too large to hold in memory.
+
+        The file is read in windows of lines (see iter_line_windows). Each window goes through the
+        batched line stages and the dialog-hyphen fix, its blocks go through a StreamingBlockPipeline,
+        and the output is written before the next window is read. Logs are spooled per stage and
+        appended to file_subtitle_logs in the order of the buffered path, so the output and the logs
+        are identical to it. Raises StreamingFallback, leaving nothing behind, when the file has to be
+        processed in memory instead. source_lines, when given, are read instead of file_path (e.g. the
+        in-memory conversion of a non-SRT file). Returns file_has_changes.
+        """
+        options = self.options
+        window_size = max(1, int(options.get("streaming_window_lines", 20000)))
+        dialog_hyphen_fix = options.get("dialog_hyphen_fix", 1) == 1
+        reformat_renumber = options.get("reformat_renumber", 1)
+        force_rtl = options.get("force_rtl", 1)
+        run_block_operations = (
+            options.get("add_intro_credit", 0)
+            or options.get("remove_negative_timecodes", 1)
+            or options.get("fix_misplaced_timecodes", 1)
+            or options.get("remove_duplicate_subtitles", 1)
+            or options.get("remove_empty_subtitles", 1)
+            or reformat_renumber
+        )
+
+        pipeline = None
+        if run_block_operations:
+            pipeline = StreamingBlockPipeline(options, detailed_logs_enabled, *self._intro_credit())
+
+        # Dialog-hyphen blocks replace the file only if it has any; until then, lines of windows without blocks are held
+        serialize_dialog_blocks = dialog_hyphen_fix and not (run_block_operations and reformat_renumber)
+        file_has_blocks = False
+        held_lines = []
+
+        line_logs = SpooledLogBuffer()
+        rtl_logs = SpooledLogBuffer()
+        file_has_changes = False
+        output_line_count = 0
+        rtl_modified_lines_count = 0
+        total_lines_before = self.total_lines_processed
+        # The buffered path only saves once every stage has logged, so a failed write (e.g. a character the
+        # output encoding cannot represent) stops the writing but not the processing and is raised at the end
+        write_error = None
+
+        temp_fd, temp_path = tempfile.mkstemp(suffix=".part", dir=os.path.dirname(output_file_path))
+        os.close(temp_fd)
 
-                        if current_line != before_align:
+        try:
+            with (
+                open(file_path, "r", encoding=file_encoding) if source_lines is None else nullcontext(source_lines)
+            ) as source_file, open(temp_path, "w", encoding=out_encoding) as output_file:
+
+                def write_output(output_lines):
+                    nonlocal file_has_changes, output_line_count, rtl_modified_lines_count, write_error
+                    if force_rtl:
+                        output_lines, modified_count, rtl_has_changes = self._enforce_rtl(
+                            output_lines, output_line_count + 1, rtl_logs, detailed_logs_enabled
+                        )
+                        rtl_modified_lines_count += modified_count
+                        if rtl_has_changes:
                             file_has_changes = True
-                            _log_change(
-                                index,
-                                "Pre-Process Remove Alignment Tags",
-                                before_align,
-                                current_line,
-                                file_subtitle_logs,
-                                detailed_logs_enabled,
-                            )
+                    output_line_count += len(output_lines)
+                    if write_error is None:
+                        try:
+                            output_file.writelines(output_lines)
+                        except Exception as e:
+                            write_error = e
+
+                for first_line, window_lines in iter_line_windows(source_file, window_size):
+                    document = SubtitleDocument(window_lines, first_line)
+                    if self._process_lines_batched(
+                        document, line_logs, detailed_logs_enabled, bypass_regexes, remove_regexes, replace_regexes
+                    ):
+                        file_has_changes = True
+                    output_lines = document.output_lines()
+
+                    blocks = None
+                    if dialog_hyphen_fix:
+                        dialog_blocks = document.current_blocks()
+                        dialog_blocks = fix_trailing_dialog_hyphens(dialog_blocks)
+                        dialog_blocks = fix_inconsistent_dialog_hyphens(dialog_blocks)
+                        blocks = settle_blocks(dialog_blocks)
+                        if blocks is None:
+                            raise StreamingFallback()
+
+                        if serialize_dialog_blocks:
+                            if not dialog_blocks:
+                                if not file_has_blocks:
+                                    held_lines.extend(output_lines)
+                                continue
+                            file_has_blocks = True
+                            held_lines = []
+                            output_lines = []
+                            for dialog_block in dialog_blocks:
+                                if dialog_block["index"]:
+                                    output_lines.append(f'{dialog_block["index"]}\n')
+                                output_lines.append(f'{dialog_block["start_str"]} --> {dialog_block["end_str"]}\n')
+                                for dialog_text_line in dialog_block["text_lines"]:
+                                    output_lines.append(f"{dialog_text_line}\n")
+                                output_lines.append("\n")
+                    elif run_block_operations:
+                        blocks = document.current_blocks()
+
+                    if run_block_operations:
+                        pipeline.feed(blocks)
+                        if reformat_renumber:
+                            output_lines = pipeline.take_output()
+
+                    write_output(output_lines)
+
+                    if source_lines is None:
+                        self._report_progress(source_file.buffer.tell() / max(1, self.current_file_bytes))
+                    else:
+                        self._report_progress((first_line + len(window_lines) - 1) / len(source_lines))
+
+                if held_lines:
+                    write_output(held_lines)
+
+                if run_block_operations:
+                    pipeline.finish()
+                    if pipeline.has_changes:
+                        file_has_changes = True
+                    if reformat_renumber:
+                        write_output(pipeline.take_output())
+
+            # Log total RTL changes once at the end if any lines were modified
+            if rtl_modified_lines_count > 0 and detailed_logs_enabled:
+                rtl_logs.append(f"Total subtitle lines RTL formatted: {rtl_modified_lines_count}")
+
+            if write_error is not None:
+                raise write_error
+            os.replace(temp_path, output_file_path)
+        except StreamingFallback:
+            os.remove(temp_path)
+            self.total_lines_processed = total_lines_before
+            raise
+        except BaseException:
+            # Like the buffered path, a failed file keeps the logs of the changes made so far
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            self._merge_streamed_logs(file_subtitle_logs, line_logs, pipeline, rtl_logs)
+            raise
+
+        self._merge_streamed_logs(file_subtitle_logs, line_logs, pipeline, rtl_logs)
+        return file_has_changes
+
+    def _merge_streamed_logs(self, file_subtitle_logs, line_logs, pipeline, rtl_logs):
+        file_subtitle_logs.extend(line_logs)
+        if pipeline is not None:
+            for stage_logs in pipeline.spools():
+                file_subtitle_logs.extend(stage_logs)
+        file_subtitle_logs.extend(rtl_logs)
+
+    def _record_saved_file(
+        self, file_path, output_filename, file_has_changes, file_process_logs, file_subtitle_logs, cached=False
+    ):
+        output_file_path = os.path.join(os.path.dirname(file_path), "Outputs", output_filename)
+        pending_cache_entry = self._pending_cache_entries.pop(file_path, None)
+        if pending_cache_entry is not None:
+            self._store_cached_output(
+                pending_cache_entry, output_file_path, file_has_changes, file_process_logs, file_subtitle_logs
+            )
 
-                    # Apply Pre-Process Option: Trim Spaces
-                    if opt_trim_spaces:
-                        current_line = trim_line_spaces(current_line)
+        file_process_logs.append(f"Processed and saved successfully: {output_filename}")
+        if self.options.get("detailed_subtitle_logs", 1):
+            file_subtitle_logs.append(f"Finished tracking. Total changes occurred: {file_has_changes}")
+
+        # Post processing clean up option: Delete Original
+        if self.options.get("delete_original", 0):
+            os.remove(file_path)
+            file_process_logs.append(f"Original file deleted by request: {os.path.basename(file_path)}")
+
+        # Increment successful tracking counter
+        details = {"output": output_file_path, "changed": bool(file_has_changes)}
+        if self.output_cache is not None:
+            details["cached"] = cached
+        self._count_file(file_path, True, **details)
+
+    def _count_cached_lines(self, file_path):
+        """Turns the line counter noted for a pending output cache entry into the file's processed lines."""
+        pending_cache_entry = self._pending_cache_entries.get(file_path)
+        if pending_cache_entry is not None:
+            pending_cache_entry[3] = self.total_lines_processed - pending_cache_entry[3]
+
+    def _store_cached_output(
+        self, pending_cache_entry, output_file_path, file_has_changes, file_process_logs, file_subtitle_logs
+    ):
+        """Stores a saved output in the output cache with the logs it produced from reading the file on."""
+        cache_key, process_log_start, subtitle_log_start, lines_processed = pending_cache_entry
+        meta = {
+            "changed": bool(file_has_changes),
+            "lines": lines_processed,
+            "process_logs": [message for _, message in itertools.islice(file_process_logs, process_log_start, None)],
+            "subtitle_logs": [message for _, message in itertools.islice(file_subtitle_logs, subtitle_log_start, None)],
+        }
+        try:
+            self.output_cache.put(cache_key, output_file_path, meta)
+        except Exception as e:
+            print(f"Output cache failed: {e}")
 
-                    # Log Pre-Process Changes
-                    if current_line != original_line:
+    def _restore_cached_output(self, prepared, output_file_path, output_filename):
+        """Copies the cached output found by _read_file into Outputs and replays its logs; returns False if it fails."""
+        cached_output_path, meta = prepared.cached_entry
+        try:
+            shutil.copyfile(cached_output_path, output_file_path)
+        except OSError:
+            return False
+
+        # Change records come back from JSON as lists, which format_log_message and journal_lines accept
+        for message in meta["process_logs"]:
+            prepared.file_process_logs.append(message)
+        for message in meta["subtitle_logs"]:
+            prepared.file_subtitle_logs.append(message)
+        self.total_lines_processed += meta["lines"]
+        self._record_saved_file(
+            prepared.file_path,
+            output_filename,
+            meta["changed"],
+            prepared.file_process_logs,
+            prepared.file_subtitle_logs,
+            cached=True,
+        )
+        return True
+
+    def _record_failed_file(self, file_path, error, file_process_logs):
+        file_process_logs.append(f"Failed to process file {os.path.basename(file_path)} due to: {str(error)}")
+        # Increment failed tracking counter
+        self._count_file(file_path, False, error=str(error))
+
+    def _count_file(self, file_path, succeeded, **details):
+        # The writer stage of the pipelined mode counts saved files while the next file is processed
+        with self._counter_lock:
+            if succeeded:
+                self.successful_count += 1
+            else:
+                self.failed_count += 1
+            result = dict(status="succeeded" if succeeded else "failed", **details)
+            input_digest = self._input_digests.pop(file_path, None)
+            if input_digest is not None:
+                result["input_digest"] = input_digest
+            self.file_results[file_path] = result
+            if self._ledger is not None:
+                self._ledger.record(file_path, result)
+
+    def _save_output(
+        self,
+        file_path,
+        output_file_path,
+        output_filename,
+        out_encoding,
+        processed_lines,
+        file_has_changes,
+        file_process_logs,
+        file_subtitle_logs,
+    ):
+        with open(output_file_path, "w", encoding=out_encoding) as f:
+            f.writelines(processed_lines)
+
+        self._record_saved_file(file_path, output_filename, file_has_changes, file_process_logs, file_subtitle_logs)
+
+    def _intro_credit(self):
+        """Returns (credit_lines, dur_ms) of the intro credit subtitle; credit_lines is empty without credit text."""
+        credit_text = self.options.get("intro_credit_text", "").strip()
+        credit_lines = [l.strip() for l in credit_text.split("\n") if l.strip()][:2]
+        try:
+            dur_sec = int(self.options.get("intro_credit_duration", "8"))
+            dur_sec = max(2, min(10, dur_sec))
+        except Exception:
+            dur_sec = 8
+        return credit_lines, dur_sec * 1000
+
+    def _enforce_rtl(self, lines, first_index, file_subtitle_logs, detailed_logs_enabled):
+        """
+        Post-Process Force RTL over output lines numbered from first_index: removes control chars,
+        trims spaces and wraps text lines in RTL embedding marks where needed.
+        Returns (rtl_processed_lines, rtl_modified_lines_count, file_has_changes).
+        """
+        post_trim_spaces = self.options.get("post_trim_spaces", 1)
+        index_match = index_pattern.match
+        timecode_match = timecode_pattern.match
+        file_has_changes = False
+        rtl_processed_lines = []
+        rtl_modified_lines_count = 0
+
+        for index, line in enumerate(lines, start=first_index):
+            if index_match(line) or timecode_match(line) or not line.strip():
+                rtl_processed_lines.append(line)
+            else:
+                original_text_line = line
+                clean_text = line
+
+                clean_text = clean_text.translate(CTRL_CHAR_TRANS)
+
+                # Apply RTL Trim Spaces
+                if post_trim_spaces and clean_text:
+                    before_post = clean_text
+                    clean_text = trim_line_spaces(clean_text)
+                    if before_post != clean_text:
                         file_has_changes = True
                         _log_change(
                             index,
-                            "Pre-Process Trim Spaces",
-                            original_line,
-                            current_line,
+                            "RTL Trim Spaces",
+                            before_post,
+                            clean_text,
                             file_subtitle_logs,
                             detailed_logs_enabled,
                         )
 
-                    # Skip text processing entirely for timecode or index lines
-                    if is_timecode_or_index:
-                        processed_lines.append(current_line)
-                        continue
-
-                    # Option: Fix Misplaced Chars processing and logging
-                    # Fast path guard: Check if common punctuation exists before running rules.
-                    if opt_fix_misplaced_chars and any(c in current_line for c in "*:؛!?؟.,،-»«…"):
-                        before_misplaced = current_line
-                        temp_line = current_line
-
-                        # Preserve and strip trailing newline to prevent regexes from corrupting line endings
-                        line_ending = ""
-                        if temp_line.endswith(("\r\n", "\n")):
-                            if temp_line.endswith("\r\n"):
-                                line_ending = "\r\n"
-                            else:
-                                line_ending = "\n"
-                            temp_line = temp_line[: -len(line_ending)]
+                # Apply Post-Process Option: Smart RTL Enforcement
+                if clean_text.strip():
+                    line_stripped = clean_text.rstrip("\r\n")
+                    line_ending = clean_text[len(line_stripped) :]
 
-                        if not misplaced_chars_comment_pattern.fullmatch(temp_line):
-                            temp_line = apply_rule_set(temp_line, misplaced_chars_rules)
+                    # Remove HTML tags AND invisible zero-width chars temporarily to check boundaries accurately
+                    text_no_tags = HTML_TAG_RE.sub("", line_stripped)
+                    text_no_tags = ZERO_WIDTH_RE.sub("", text_no_tags).strip()
 
-                        temp_line += line_ending
-                        current_line = temp_line
+                    if text_no_tags:
+                        # Ignore music symbols when detecting non-English content
+                        text_for_language_check = MUSIC_SYMBOLS_RE.sub("", text_no_tags).strip()
 
-                        if current_line != before_misplaced:
-                            file_has_changes = True
-                            _log_change(
-                                index,
-                                "Pre-Process Fix Misplaced Chars",
-                                before_misplaced,
-                                current_line,
-                                file_subtitle_logs,
-                                detailed_logs_enabled,
-                            )
-
-                    # Apply Pre-Process Option: Fix Abbreviations
-                    if opt_fix_abbreviations:
-                        before_abbr = current_line
-                        temp_line = current_line
-
-                        # Apply general English spaced abbreviations pattern
-                        while english_abbr_pattern.search(temp_line):
-                            temp_line = english_abbr_pattern.sub("", temp_line)
+                        # Check if the line contains any non-ASCII (non-English) characters
+                        has_non_english = bool(NON_ASCII_RE.search(text_for_language_check))
 
-                        # Apply specific imported XML abbreviation rules
-                        temp_line = apply_rule_set(temp_line, abbreviation_rules)
-
-                        current_line = temp_line
-
-                        if current_line != before_abbr:
-                            file_has_changes = True
-                            _log_change(
-                                index,
-                                "Pre-Process Fix Abbreviations",
-                                before_abbr,
-                                current_line,
-                                file_subtitle_logs,
-                                detailed_logs_enabled,
-                            )
+                        if has_non_english:
+                            # Fix visually typed punctuation at the start of the line
+                            # Moves misplaced punctuation (colons, question/exclamation marks) from the start to the end
+                            if re.match(r"^((?:<[^>]+>\s*)*)([:؛!\?؟])", line_stripped):
+                                line_stripped = re.sub(
+                                    r"^((?:<[^>]+>\s*)*)([:؛!\?؟])\s*(.*)$", r"\1\3\2", line_stripped
+                                )
 
-                    # Apply Pre-Process Option: Comma Fixes
-                    # Fast path guard: Check if line contains any comma format.
-                    if opt_comma_fixes and any(c in current_line for c in ",،"):
-                        before_comma = current_line
-                        temp_line = current_line
+                            # Re-evaluate text_no_tags after modification
+                            text_no_tags = HTML_TAG_RE.sub("", line_stripped)
+                            text_no_tags = re.sub(r"[\u200b\u200c\u200d\ufeff]", "", text_no_tags).strip()
 
-                        # Apply comma rules only if the line is not purely English
-                        if not line_is_pure_english:
-                            temp_line = apply_rule_set(temp_line, comma_rules_list)
+                            # Check for music symbols before removing them to ensure they trigger RTL formatting
+                            has_music_symbol = bool(MUSIC_SYMBOLS_RE.search(text_no_tags))
 
-                        current_line = temp_line
+                            # Ignore music symbols for boundary checks to accurately detect punctuation
+                            text_no_tags = MUSIC_SYMBOLS_RE.sub("", text_no_tags).strip()
 
-                        if current_line != before_comma:
-                            file_has_changes = True
-                            _log_change(
-                                index,
-                                "Pre-Process Comma Fixes",
-                                before_comma,
-                                current_line,
-                                file_subtitle_logs,
-                                detailed_logs_enabled,
+                            has_symbol_start = text_no_tags.startswith(RTL_START_SYMBOLS)
+                            has_symbol_end = text_no_tags.endswith(RTL_END_SYMBOLS)
+                            # Detect English letters, ASCII digits, Persian digits and Arabic digits
+                            has_english_or_digits = bool(
+                                re.search(r"[a-zA-Z0-9\u06F0-\u06F9\u0660-\u0669]", text_no_tags)
                             )
+                            rtl_line = line_stripped
 
-                    # Apply Pre-Process Option: Exclamation Mark Fixes
-                    # Fast path guard: Check for literal exclamation mark.
-                    if opt_exclamation_fixes and "!" in current_line:
-                        before_excl = current_line
-                        temp_line = current_line
-
-                        temp_line = apply_rule_set(temp_line, exclamation_rules_list)
-
-                        current_line = temp_line
+                            # Use RLE (\u202b) and PDF (\u202c) to strictly enforce RTL direction
+                            # This forces the internal bidi algorithm to treat English words and digits as embedded inside an RTL context
+                            if (
+                                has_symbol_start
+                                or has_symbol_end
+                                or has_english_or_digits
+                                or has_music_symbol
+                            ):
+                                # Place Bidi markers inside HTML tags to prevent rendering issues in players
+                                tag_pattern = r"^((?:<[^>]+>\s*)*)(.*?)(\s*(?:<[^>]+>\s*)*)$"
+                                tag_match = re.match(tag_pattern, rtl_line)
+                                if tag_match:
+                                    rtl_line = (
+                                        tag_match.group(1)
+                                        + "\u202b"
+                                        + tag_match.group(2)
+                                        + "\u202c"
+                                        + tag_match.group(3)
+                                    )
+                                else:
+                                    rtl_line = "\u202b" + rtl_line + "\u202c"
 
-                        if current_line != before_excl:
-                            file_has_changes = True
-                            _log_change(
-                                index,
-                                "Pre-Process Exclamation Mark Fixes",
-                                before_excl,
-                                current_line,
-                                file_subtitle_logs,
-                                detailed_logs_enabled,
-                            )
+                            clean_text = rtl_line + line_ending
+                        else:
+                            # Skip RTL processing completely for fully English/ASCII lines
+                            clean_text = line_stripped + line_ending
+                else:
+                    clean_text = line_stripped + line_ending
+
+                if clean_text != original_text_line:
+                    file_has_changes = True
+                    rtl_modified_lines_count += 1
+                    _log_change(
+                        index,
+                        "Smart RTL Enforcement",
+                        original_text_line,
+                        clean_text,
+                        file_subtitle_logs,
+                        detailed_logs_enabled,
+                    )
 
-                    # Apply Pre-Process Option: Parentheses Fixes
-                    # Fast path guard: Check for standard bracket types.
-                    if opt_parentheses_fixes and any(c in current_line for c in "()[]{}"):
-                        before_paren = current_line
-                        temp_line = current_line
-
-                        # Normalize repeated opening brackets at the start of the visible text.
-                        # This keeps leading HTML/bidi markers intact while fixing cases like:
-                        # "(‏(text" -> "(text)"
-                        leading_prefix_match = re.match(
-                            r"^(?:[ \t\u200b-\u200f\u202a-\u202e\u2066-\u2069\ufeff]+|<[^>]+>)*",
-                            temp_line,
-                        )
-                        leading_prefix = leading_prefix_match.group(0) if leading_prefix_match else ""
-                        body = temp_line[len(leading_prefix) :]
-
-                        if body:
-                            bracket_pairs = {
-                                "(": ")",
-                                "[": "]",
-                                "{": "}",
-                            }
-
-                            first_char = body[0]
-                            if first_char in bracket_pairs:
-                                closing_char = bracket_pairs[first_char]
-
-                                # Collapse repeated opening brackets, allowing invisible RTL marks/spaces between them.
-                                body = re.sub(
-                                    rf"^(?:{re.escape(first_char)}(?:[ \t\u200b-\u200f\u202a-\u202e\u2066-\u2069\ufeff]*{re.escape(first_char)})+)",
-                                    first_char,
-                                    body,
-                                )
+                rtl_processed_lines.append(clean_text)
 
-                                # If the line has no matching closing bracket, append one at the end.
-                                if closing_char not in body:
-                                    line_ending = ""
+        return rtl_processed_lines, rtl_modified_lines_count, file_has_changes
 
-                                    if body.endswith("\r\n"):
-                                        line_ending = "\r\n"
-                                        body = body[:-2]
-                                    elif body.endswith("\n"):
-                                        line_ending = "\n"
-                                        body = body[:-1]
+    def _compile_rule_lists(self):
+        """Returns the bypass, remove and replace lists as FlexibleWordLists of (word, regex) pairs."""
+        # Extract Process configuration variables
+        bypass_list = [w.strip() for w in self.options.get("bypass_list", "").split("\n") if w.strip()]
+        # Pre-compile regexes for bypass list to optimize performance
+        bypass_regexes = []
+        for w in bypass_list:
+            regex = build_flexible_regex(w)
+            if regex:
+                bypass_regexes.append((w, regex))
+        bypass_regexes = FlexibleWordList(bypass_regexes)
 
-                                    body = body + closing_char + line_ending
+        remove_list = [w.strip() for w in self.options.get("remove_list", "").split("\n") if w.strip()]
+        # Pre-compile regexes for remove list to optimize performance
+        remove_regexes = []
+        for w in remove_list:
+            regex = build_flexible_regex(w)
+            if regex:
+                remove_regexes.append((w, regex))
+        remove_regexes = FlexibleWordList(remove_regexes)
 
-                        temp_line = leading_prefix + body
+        replace_list = [w.strip() for w in self.options.get("replace_list", "").split("\n") if w.strip()]
+        # Pre-compile regexes for replace list to optimize performance
+        replace_regexes = []
+        for w in replace_list:
+            regex = build_flexible_regex(w)
+            if regex:
+                replace_regexes.append((w, regex))
+        replace_regexes = FlexibleWordList(replace_regexes)
 
-                        temp_line = apply_rule_set(temp_line, parentheses_rules_list)
+        return bypass_regexes, remove_regexes, replace_regexes
 
-                        current_line = temp_line
+    def _read_file(self, file_path, file_bytes):
+        """
+        Reads a subtitle file ahead of processing: looks its output up in the output cache and, when
+        it is not cached, converts alternative formats in memory, detects the encoding and, outside
+        streaming mode, decodes the lines. Errors while reading are kept in the PreparedFile and
+        reported when it is processed, as if they happened there.
+        """
+        opt_streaming_mode = self.options.get("streaming_mode", 0)
 
-                        if current_line != before_paren:
-                            file_has_changes = True
-                            _log_change(
-                                index,
-                                "Pre-Process Parentheses Fixes",
-                                before_paren,
-                                current_line,
-                                file_subtitle_logs,
-                                detailed_logs_enabled,
-                            )
+        # Initialize timestamped log buffers for the current file to aggregate disk I/O
+        file_process_logs = TimestampedLogBuffer()
+        # Streamed files can log a change for every line, so their subtitle logs are spooled to disk
+        file_subtitle_logs = SpooledLogBuffer() if opt_streaming_mode else TimestampedLogBuffer()
+        prepared = PreparedFile(file_path, file_bytes, file_process_logs, file_subtitle_logs)
 
-                    # Apply Pre-Process Option: Question Mark Fixes
-                    # Fast path guard: Check for English or Arabic question mark.
-                    if opt_question_mark_fixes and ("?" in current_line or "؟" in current_line):
-                        before_qm = current_line
-                        temp_line = current_line
+        file_process_logs.append(f"Identified file: {os.path.basename(file_path)}")
 
-                        temp_line = apply_rule_set(temp_line, question_mark_rules_list)
+        try:
+            # The raw bytes are read and hashed once: the digest keys the input caches and the encoding cache,
+            # and the bytes are decoded in memory. Other formats are read by their converter, so they only
+            # need the bytes for the digest
+            needs_bytes = self._hash_inputs or os.path.splitext(file_path)[1].lower() == ".srt"
+            with open_file_bytes(file_path) if needs_bytes else nullcontext() as data:
+                digest = content_digest(data) if needs_bytes else None
+                if self._hash_inputs:
+                    prepared.content_digest = self._input_digests[file_path] = digest
+
+                # Unchanged inputs processed with the same settings are restored from the output cache
+                # without being converted or decoded (see _process_prepared_file)
+                if self.output_cache is not None:
+                    prepared.cache_key = self.output_cache.key(digest, self.output_cache_settings)
+                    prepared.cached_entry = self.output_cache.get(prepared.cache_key)
+                if prepared.cached_entry is not None:
+                    prepared.validation_success = True
+                else:
+                    self._read_contents(prepared, data, digest)
+        except Exception as e:
+            # Read errors are reported when the file is processed, not as a failed validation
+            prepared.read_error = e
+            prepared.validation_success = True
+
+        return prepared
+
+    def _read_contents(self, prepared, data, digest):
+        """
+        The part of _read_file that runs when the output is not cached: converts alternative formats,
+        detects the encoding of SRT files from their raw bytes and, outside streaming mode, decodes them.
+        """
+        opt_streaming_mode = self.options.get("streaming_mode", 0)
+        detailed_logs_enabled = self.options.get("detailed_subtitle_logs", 1)
+        opt_convert_ass_comments = self.options.get("convert_ass_comments", 0)
+        opt_delete_converted_temp_files = self.options.get("delete_converted_temp_files", 0)
+        file_path = prepared.file_path
+        file_process_logs = prepared.file_process_logs
+        file_subtitle_logs = prepared.file_subtitle_logs
+
+        # The output cache stores the logs from here on, which a cached run replays instead of reading the file
+        if self.output_cache is not None:
+            prepared.pending_cache_entry = [prepared.cache_key, len(file_process_logs), len(file_subtitle_logs), None]
+
+        # Convert alternative formats to SRT lines in memory before reading
+        prepared.converted_lines, prepared.validation_success = convert_to_srt_lines(
+            file_path,
+            file_process_logs,
+            file_subtitle_logs,
+            detailed_logs_enabled,
+            opt_convert_ass_comments,
+        )
+        if not prepared.validation_success:
+            return
 
-                        current_line = temp_line
+        converted_lines = prepared.converted_lines
+        if converted_lines is not None:
+            # Converted SRT text is already decoded; it is only written out when the user keeps converted files
+            prepared.file_encoding = "utf-8"
+            if not opt_delete_converted_temp_files:
+                with open(os.path.splitext(file_path)[0] + ".srt", "w", encoding="utf-8") as f:
+                    f.writelines(converted_lines)
+            if not opt_streaming_mode:
+                prepared.lines = converted_lines
+        else:
+            # Streamed files are decoded window by window as they are processed, so only the encoding is kept
+            prepared.file_encoding = detect_cached_encoding(data, digest)
+            if not opt_streaming_mode:
+                prepared.lines = decode_lines(data, prepared.file_encoding)
+
+        file_process_logs.append(f"Identified encoding: {prepared.file_encoding}")
+
+    def _run_line_pipeline(self, line_iterator, document, line_record, bypass_regexes, remove_regexes, replace_regexes):
+        """
+        The per-line loop of _process_prepared_file with the compiled line pipeline: runs the stages of
+        self.line_pipeline over the subtitle text lines of line_iterator, writes the results into
+        document and the changes into line_record. Matches _process_lines line for line.
+        """
+        stages = self.line_pipeline
+        state_class = LineState if self.options.get("detailed_subtitle_logs", 1) else UnloggedLineState
+        state = state_class(line_record, bypass_regexes, remove_regexes, replace_regexes)
+        valid_text_indices = document.text_indices
+        lines = document.lines
+
+        for index, line in line_iterator:
+            self.total_lines_processed += 1
+            if (self.total_lines_processed % 250) == 0:
+                self._report_progress()
 
-                        if current_line != before_qm:
-                            file_has_changes = True
-                            _log_change(
-                                index,
-                                "Pre-Process Question Mark Fixes",
-                                before_qm,
-                                current_line,
-                                file_subtitle_logs,
-                                detailed_logs_enabled,
-                            )
+            # Skip all processing if the line is not a subtitle text (e.g., timecodes, indexes, empty lines)
+            if index not in valid_text_indices:
+                continue
 
-                    # Double-Quotes Fixes processing and logging
-                    # Fast path guard: Check for double quotes existence.
-                    if opt_double_quotes_fixes and '"' in current_line:
-                        before_dq = current_line
-                        temp_line = current_line
-                        temp_line = apply_rule_set(temp_line, double_quotes_rules_list)
-
-                        # Handle misplaced opening quote at start of line
-                        if temp_line.count('"') == 2:
-                            line_ending = ""
-
-                            if temp_line.endswith("\r\n"):
-                                line_ending = "\r\n"
-                                temp_line = temp_line[:-2]
-                            elif temp_line.endswith("\n"):
-                                line_ending = "\n"
-                                temp_line = temp_line[:-1]
-
-                            # Detect leading HTML tags and common punctuation marks including RTL/LTR control marks
-                            html_prefix_match = re.match(
-                                r"^((?:<[^<>]+>|[\u200e\u200f\u202a-\u202e\u2066-\u2069\u061c\ufeff\u200b]|[\s\.\-–—])*)",
-                                temp_line,
-                            )
-                            html_prefix = html_prefix_match.group(1) if html_prefix_match else ""
-                            remainder = temp_line[len(html_prefix) :]
+            state.start(index, line)
+            for guard, stage in stages:
+                if state.signature & guard and stage(state):
+                    break
+            lines[index - 1] = state.text
 
-                            # Detect trailing HTML tags, spaces, and RTL/LTR control marks
-                            html_suffix_match = re.search(
-                                r"((?:<[^<>]+>|[\u200e\u200f\u202a-\u202e\u2066-\u2069\u061c\ufeff\u200b]|\s)+)$",
-                                remainder,
-                            )
-                            if html_suffix_match:
-                                html_suffix = html_suffix_match.group(1)
-                                content_after_html = remainder[: -len(html_suffix)]
-                            else:
-                                html_suffix = ""
-                                content_after_html = remainder
+    def _process_lines(self, line_iterator, document, line_record, bypass_regexes, remove_regexes, replace_regexes):
+        """
+        The per-line loop of _process_prepared_file: runs the line stages over the subtitle text lines
+        of line_iterator, writes the results into document and the changes into line_record.
 
-                            if content_after_html.count('"') == 2:
-                                # Case 1: Both quotes are clustered at the start (""Text -> "Text")
-                                if content_after_html.startswith('""'):
-                                    content_after_html = '"' + content_after_html[2:] + '"'
+        This is the reference implementation of the loop, used when "compiled_line_pipeline" is off.
+        Otherwise runs use the stages of build_line_pipeline (see _run_line_pipeline).
+        """
+        # Cache ALL options to avoid thousands of dictionary lookups during line processing
+        opt_bypass_enabled = self.options.get("bypass_enabled", 1)
+        opt_remove_enabled = self.options.get("remove_enabled", 1)
+        opt_replace_enabled = self.options.get("replace_enabled", 1)
+        opt_remove_alignment_tags = self.options.get("remove_alignment_tags", 1)
+        opt_trim_spaces = self.options.get("trim_spaces", 1)
+        opt_fix_misplaced_chars = self.options.get("fix_misplaced_chars", 1)
+        opt_fix_abbreviations = self.options.get("fix_abbreviations", 1)
+        opt_comma_fixes = self.options.get("comma_fixes", 1)
+        opt_exclamation_fixes = self.options.get("exclamation_fixes", 1)
+        opt_parentheses_fixes = self.options.get("parentheses_fixes", 1)
+        opt_question_mark_fixes = self.options.get("question_mark_fixes", 1)
+        opt_double_quotes_fixes = self.options.get("double_quotes_fixes", 1) == 1
+        opt_dash_fixes = self.options.get("dash_fixes", 1) == 1
+        opt_comments_fixes = self.options.get("comments_fixes", 1) == 1
+        opt_dialog_hyphen_fix = self.options.get("dialog_hyphen_fix", 1) == 1
+        opt_remove_standalone_dots = self.options.get("remove_standalone_dots", 1)
+        opt_remove_unneeded_spaces = self.options.get("remove_unneeded_spaces", 1)
+        opt_persian_question_mark_and_comma = self.options.get("persian_question_mark_and_comma", 1)
+        opt_arabic_char_to_persian = self.options.get("arabic_char_to_persian", 1)
+        opt_arabic_num_to_persian = self.options.get("arabic_num_to_persian", 1)
+        opt_english_num_to_persian = self.options.get("english_num_to_persian", 1)
+        opt_space_to_invisible_space = self.options.get("space_to_invisible_space", 1)
+        opt_hexre_fixes = self.options.get("hexre_fixes", 1)
+        opt_post_trim_spaces = self.options.get("post_trim_spaces", 1)
+        opt_remove_empty_tags = self.options.get("remove_empty_tags", 1)
+        detailed_logs_enabled = self.options.get("detailed_subtitle_logs", 1)
 
-                                # Case 2: Both quotes are clustered at the end (Text"" -> "Text")
-                                elif content_after_html.endswith('""'):
-                                    content_after_html = '"' + content_after_html[:-2] + '"'
+        valid_text_indices = document.text_indices
+        timecode_match = timecode_pattern.match
+        index_match = index_pattern.match
 
-                                else:
-                                    q1_idx = content_after_html.find('"')
-                                    q2_idx = content_after_html.rfind('"')
-
-                                    # Case 3: Misplaced closing quote pushed to the beginning of line in RTL text
-                                    if q1_idx == 0 and q2_idx < len(content_after_html) - 1:
-                                        prev_char = content_after_html[q2_idx - 1] if q2_idx > 0 else ""
-                                        next_char = (
-                                            content_after_html[q2_idx + 1]
-                                            if q2_idx + 1 < len(content_after_html)
-                                            else ""
-                                        )
-                                        if (
-                                            prev_char in " \t\u200c\u200e\u200f([{'«،,;:.!?-–—"
-                                            and next_char not in " \t\r\n"
-                                        ):
-                                            content_after_html = content_after_html[1:] + '"'
-
-                                    # Case 4: Opening quote is misplaced at end of text while line starts with HTML tags or text
-                                    elif q2_idx == len(content_after_html) - 1 and q1_idx > 0:
-                                        prev_char = content_after_html[q1_idx - 1] if q1_idx > 0 else ""
-                                        next_char = (
-                                            content_after_html[q1_idx + 1]
-                                            if q1_idx + 1 < len(content_after_html)
-                                            else ""
-                                        )
-                                        if prev_char not in " \t\r\n" and (
-                                            next_char in " \t\u200c\u200e\u200f)]}'»،,;:.!?-–—"
-                                            or q1_idx + 1 == len(content_after_html)
-                                        ):
-                                            content_after_html = '"' + content_after_html[:-1]
-
-                            temp_line = html_prefix + content_after_html + html_suffix + line_ending
-
-                        # Handle unbalanced double quotes (odd number of quotes)
-                        if temp_line.count('"') % 2 != 0:
-                            # Replace the quote and any surrounding spaces/tabs with a single space
-                            # to avoid merging words. The unneeded_spaces rules will clean up any extra spaces.
-                            temp_line = re.sub(r'[ \t]*"[ \t]*', " ", temp_line)
-
-                        current_line = temp_line
-                        if current_line != before_dq:
-                            file_has_changes = True
-                            _log_change(
-                                index,
-                                "Pre-Process Double-Quotes Fixes",
-                                before_dq,
-                                current_line,
-                                file_subtitle_logs,
-                                detailed_logs_enabled,
-                            )
+        for index, line in line_iterator:
+            self.total_lines_processed += 1
+            if (self.total_lines_processed % 250) == 0:
+                self._report_progress()
 
-                    # Dash Fixes processing and logging
-                    # Fast path guard: Check for standard dash variations.
-                    if opt_dash_fixes and any(c in current_line for c in "-–—"):
-                        before_dash = current_line
-                        temp_line = current_line
-                        temp_line = apply_rule_set(temp_line, dash_rules_list)
-                        current_line = temp_line
-                        if current_line != before_dash:
-                            file_has_changes = True
-                            _log_change(
-                                index,
-                                "Pre-Process Dash Fixes",
-                                before_dash,
-                                current_line,
-                                file_subtitle_logs,
-                                detailed_logs_enabled,
-                            )
+            # Skip all processing if the line is not a subtitle text (e.g., timecodes, indexes, empty lines)
+            if index not in valid_text_indices:
+                continue
+
+            original_line = line
+            current_line = original_line
+            line_is_pure_english = is_pure_english(current_line)
+            signature = line_signature(current_line)
+
+            # Check if line is standard subtitle timecode or index number
+            is_timecode_or_index = bool(timecode_match(current_line) or index_match(current_line))
+
+            # Apply Pre-Process Option: Remove Alignment Tags
+            # Fast path guard: Check for '{' and 'an'/'AN'
+            if opt_remove_alignment_tags and signature & SIG_BRACE and "an" in current_line.lower():
+                before_align = current_line
+                current_line = ALIGNMENT_TAG_RE.sub("", current_line)
+
+                if current_line != before_align:
+                    line_record.changed = True
+                    signature = line_signature(current_line)
+                    _log_change(
+                        index,
+                        "Pre-Process Remove Alignment Tags",
+                        before_align,
+                        current_line,
+                        line_record.logs,
+                        detailed_logs_enabled,
+                    )
 
-                    # Comments Fixes processing and logging
-                    # Fast path guard: Subtitle comments typically involve brackets.
-                    if opt_comments_fixes and any(c in current_line for c in ":."):
-                        before_com = current_line
-                        temp_line = current_line
-                        temp_line = apply_rule_set(temp_line, comments_rules_list)
-                        current_line = temp_line
-                        if current_line != before_com:
-                            file_has_changes = True
-                            _log_change(
-                                index,
-                                "Pre-Process Comments Fixes",
-                                before_com,
-                                current_line,
-                                file_subtitle_logs,
-                                detailed_logs_enabled,
-                            )
+            # Apply Pre-Process Option: Trim Spaces
+            if opt_trim_spaces:
+                current_line = trim_line_spaces(current_line)
+
+            # Log Pre-Process Changes
+            if current_line != original_line:
+                line_record.changed = True
+                signature = line_signature(current_line)
+                _log_change(
+                    index,
+                    "Pre-Process Trim Spaces",
+                    original_line,
+                    current_line,
+                    line_record.logs,
+                    detailed_logs_enabled,
+                )
 
-                    # Dialog Hyphen Fix processing and logging
-                    if opt_dialog_hyphen_fix:
-                        before_dh = current_line
-                        temp_line = current_line
-                        temp_line = apply_rule_set(temp_line, dialog_hyphen_fix_list)
-                        current_line = temp_line
-                        if current_line != before_dh:
-                            file_has_changes = True
-                            _log_change(
-                                index,
-                                "Pre-Process Dialog Hyphen Fix",
-                                before_dh,
-                                current_line,
-                                file_subtitle_logs,
-                                detailed_logs_enabled,
-                            )
+            # Skip text processing entirely for timecode or index lines
+            if is_timecode_or_index:
+                document.lines[index - 1] = current_line
+                continue
+
+            # Option: Fix Misplaced Chars processing and logging
+            # Fast path guard: Check if common punctuation exists before running rules.
+            if opt_fix_misplaced_chars and signature & SIG_MISPLACED_CHARS:
+                before_misplaced = current_line
+                temp_line = current_line
+
+                # Preserve and strip trailing newline to prevent regexes from corrupting line endings
+                line_ending = ""
+                if temp_line.endswith(("\r\n", "\n")):
+                    if temp_line.endswith("\r\n"):
+                        line_ending = "\r\n"
+                    else:
+                        line_ending = "\n"
+                    temp_line = temp_line[: -len(line_ending)]
+
+                if not misplaced_chars_comment_pattern.fullmatch(temp_line):
+                    temp_line = MISPLACED_CHARS_INDEX.apply(temp_line)
+
+                temp_line += line_ending
+                current_line = temp_line
+
+                if current_line != before_misplaced:
+                    line_record.changed = True
+                    signature = line_signature(current_line)
+                    _log_change(
+                        index,
+                        "Pre-Process Fix Misplaced Chars",
+                        before_misplaced,
+                        current_line,
+                        line_record.logs,
+                        detailed_logs_enabled,
+                    )
 
-                    # Apply Pre-Process Option: Remove Standalone Dots
-                    # Fast path guard: Requires at least one period.
-                    if opt_remove_standalone_dots and any(c in current_line for c in ".…"):
-                        before_dots = current_line
+            # Apply Pre-Process Option: Fix Abbreviations
+            if opt_fix_abbreviations:
+                before_abbr = current_line
+                temp_line = current_line
+
+                # Apply general English spaced abbreviations pattern
+                while english_abbr_pattern.search(temp_line):
+                    temp_line = english_abbr_pattern.sub("", temp_line)
+
+                # Apply specific imported XML abbreviation rules
+                temp_line = ABBREVIATION_INDEX.apply(temp_line)
+
+                current_line = temp_line
+
+                if current_line != before_abbr:
+                    line_record.changed = True
+                    signature = line_signature(current_line)
+                    _log_change(
+                        index,
+                        "Pre-Process Fix Abbreviations",
+                        before_abbr,
+                        current_line,
+                        line_record.logs,
+                        detailed_logs_enabled,
+                    )
 
-                        # Whitespace + Zero-Width & Invisible Formatting Characters (\u200c=ZWNJ, \u200d=ZWJ, \u200e=LRM, \u200f=RLM, \ufeff=BOM)
-                        # Regex patterns are pre-compiled outside the main loop for performance
+            # Apply Pre-Process Option: Comma Fixes
+            # Fast path guard: Check if line contains any comma format.
+            if opt_comma_fixes and signature & SIG_COMMA:
+                before_comma = current_line
+                temp_line = current_line
+
+                # Apply comma rules only if the line is not purely English
+                if not line_is_pure_english:
+                    temp_line = COMMA_INDEX.apply(temp_line)
+
+                current_line = temp_line
+
+                if current_line != before_comma:
+                    line_record.changed = True
+                    signature = line_signature(current_line)
+                    _log_change(
+                        index,
+                        "Pre-Process Comma Fixes",
+                        before_comma,
+                        current_line,
+                        line_record.logs,
+                        detailed_logs_enabled,
+                    )
 
-                        # Remove standalone dot at the start of the line (ignores HTML tags, zero-width chars & music symbols prefix)
-                        current_line = start_dot_pattern.sub(r"\1\2", current_line)
+            # Apply Pre-Process Option: Exclamation Mark Fixes
+            # Fast path guard: Check for literal exclamation mark.
+            if opt_exclamation_fixes and signature & SIG_EXCLAMATION:
+                before_excl = current_line
+                temp_line = current_line
+
+                temp_line = EXCLAMATION_INDEX.apply(temp_line)
+
+                current_line = temp_line
+
+                if current_line != before_excl:
+                    line_record.changed = True
+                    signature = line_signature(current_line)
+                    _log_change(
+                        index,
+                        "Pre-Process Exclamation Mark Fixes",
+                        before_excl,
+                        current_line,
+                        line_record.logs,
+                        detailed_logs_enabled,
+                    )
 
-                        # Remove standalone dot at the end of the line (ignores HTML tags, zero-width chars & music symbols suffix)
-                        current_line = end_dot_pattern.sub("", current_line)
+            # Apply Pre-Process Option: Parentheses Fixes
+            # Fast path guard: Check for standard bracket types.
+            if opt_parentheses_fixes and signature & SIG_BRACKET:
+                before_paren = current_line
+                temp_line = current_line
 
-                        if current_line != before_dots:
-                            file_has_changes = True
-                            _log_change(
-                                index,
-                                "Pre-Process Remove Standalone Dots",
-                                before_dots,
-                                current_line,
-                                file_subtitle_logs,
-                                detailed_logs_enabled,
-                            )
+                temp_line = normalize_leading_brackets(temp_line)
 
-                    # Apply Pre-Process Option: Remove Unneeded Spaces (Aligned with XML rules)
-                    # Fast path guard: Requires at least one space or tab character.
-                    if opt_remove_unneeded_spaces and any(c in current_line for c in " \n\t"):
-                        # Skip space cleaning for subtitle comment lines with open/close markers
-                        # Updated regex to support both single and double colons (e.g., .: :. or ..:: ::..)
-                        if not re.search(r"\.{1,2}:{1,2}.*?:{1,2}\.{1,2}", current_line):
-                            temp_line = current_line
+                temp_line = PARENTHESES_INDEX.apply(temp_line)
 
-                            for pattern, replacement, desc in unneeded_rules:
-                                step_before = temp_line
-                                temp_line = pattern.sub(replacement, temp_line)
+                current_line = temp_line
 
-                                if temp_line != step_before:
-                                    file_has_changes = True
-                                    _log_change(
-                                        index,
-                                        "Pre-Process Remove Unneeded Spaces",
-                                        step_before,
-                                        temp_line,
-                                        file_subtitle_logs,
-                                        detailed_logs_enabled,
-                                    )
+                if current_line != before_paren:
+                    line_record.changed = True
+                    signature = line_signature(current_line)
+                    _log_change(
+                        index,
+                        "Pre-Process Parentheses Fixes",
+                        before_paren,
+                        current_line,
+                        line_record.logs,
+                        detailed_logs_enabled,
+                    )
 
-                            current_line = temp_line
+            # Apply Pre-Process Option: Question Mark Fixes
+            # Fast path guard: Check for English or Arabic question mark.
+            if opt_question_mark_fixes and signature & SIG_QUESTION_MARK:
+                before_qm = current_line
+                temp_line = current_line
+
+                temp_line = QUESTION_MARK_INDEX.apply(temp_line)
+
+                current_line = temp_line
+
+                if current_line != before_qm:
+                    line_record.changed = True
+                    signature = line_signature(current_line)
+                    _log_change(
+                        index,
+                        "Pre-Process Question Mark Fixes",
+                        before_qm,
+                        current_line,
+                        line_record.logs,
+                        detailed_logs_enabled,
+                    )
 
-                    # Option: Convert English Question Marks and Commas to Persian
-                    # Fast path guard: Look for target English characters before attempting translation.
-                    if opt_persian_question_mark_and_comma and ("?" in current_line or "," in current_line):
-                        before_q = current_line
-                        current_line = current_line.replace("?", "؟")
+            # Double-Quotes Fixes processing and logging
+            # Fast path guard: Check for double quotes existence.
+            if opt_double_quotes_fixes and signature & SIG_DOUBLE_QUOTE:
+                before_dq = current_line
+                temp_line = current_line
+                temp_line = DOUBLE_QUOTES_INDEX.apply(temp_line)
+
+                temp_line = fix_double_quote_placement(temp_line)
+
+                current_line = temp_line
+                if current_line != before_dq:
+                    line_record.changed = True
+                    signature = line_signature(current_line)
+                    _log_change(
+                        index,
+                        "Pre-Process Double-Quotes Fixes",
+                        before_dq,
+                        current_line,
+                        line_record.logs,
+                        detailed_logs_enabled,
+                    )
 
-                        if not line_is_pure_english:
-                            current_line = current_line.replace(",", "،")
+            # Dash Fixes processing and logging
+            # Fast path guard: Check for standard dash variations.
+            if opt_dash_fixes and signature & SIG_DASH:
+                before_dash = current_line
+                temp_line = current_line
+                temp_line = DASH_INDEX.apply(temp_line)
+                current_line = temp_line
+                if current_line != before_dash:
+                    line_record.changed = True
+                    signature = line_signature(current_line)
+                    _log_change(
+                        index,
+                        "Pre-Process Dash Fixes",
+                        before_dash,
+                        current_line,
+                        line_record.logs,
+                        detailed_logs_enabled,
+                    )
 
-                        if current_line != before_q:
-                            file_has_changes = True
-                            _log_change(
-                                index,
-                                "Pre-Process Persian Question Mark and Comma",
-                                before_q,
-                                current_line,
-                                file_subtitle_logs,
-                                detailed_logs_enabled,
-                            )
+            # Comments Fixes processing and logging
+            # Fast path guard: Subtitle comments typically involve brackets.
+            if opt_comments_fixes and signature & SIG_COMMENT:
+                before_com = current_line
+                temp_line = current_line
+                temp_line = COMMENTS_INDEX.apply(temp_line)
+                current_line = temp_line
+                if current_line != before_com:
+                    line_record.changed = True
+                    signature = line_signature(current_line)
+                    _log_change(
+                        index,
+                        "Pre-Process Comments Fixes",
+                        before_com,
+                        current_line,
+                        line_record.logs,
+                        detailed_logs_enabled,
+                    )
 
-                    # 1. Convert Arabic Characters to Persian
-                    if opt_arabic_char_to_persian and any(c in current_line for c in "يكةؤإأ"):
-                        before_char = current_line
-                        current_line = current_line.translate(ARABIC_CHAR_TRANS)
-                        if current_line != before_char:
-                            file_has_changes = True
-                            _log_change(
-                                index,
-                                "Pre-Process Arabic Chars",
-                                before_char,
-                                current_line,
-                                file_subtitle_logs,
-                                detailed_logs_enabled,
-                            )
+            # Dialog Hyphen Fix processing and logging
+            if opt_dialog_hyphen_fix:
+                before_dh = current_line
+                temp_line = current_line
+                temp_line = DIALOG_HYPHEN_INDEX.apply(temp_line)
+                current_line = temp_line
+                if current_line != before_dh:
+                    line_record.changed = True
+                    signature = line_signature(current_line)
+                    _log_change(
+                        index,
+                        "Pre-Process Dialog Hyphen Fix",
+                        before_dh,
+                        current_line,
+                        line_record.logs,
+                        detailed_logs_enabled,
+                    )
 
-                    # 2. Convert Arabic Numerals to Persian Numerals
-                    if opt_arabic_num_to_persian and any(c in current_line for c in "٠١٢٣٤٥٦٧٨٩"):
-                        before_anum = current_line
-                        current_line = current_line.translate(ARABIC_NUM_TRANS)
-                        if current_line != before_anum:
-                            file_has_changes = True
-                            _log_change(
-                                index,
-                                "Pre-Process Arabic Numerals",
-                                before_anum,
-                                current_line,
-                                file_subtitle_logs,
-                                detailed_logs_enabled,
-                            )
+            # Apply Pre-Process Option: Remove Standalone Dots
+            # Fast path guard: Requires at least one period.
+            if opt_remove_standalone_dots and signature & SIG_DOT:
+                before_dots = current_line
+
+                # Whitespace + Zero-Width & Invisible Formatting Characters (\u200c=ZWNJ, \u200d=ZWJ, \u200e=LRM, \u200f=RLM, \ufeff=BOM)
+                # Regex patterns are pre-compiled outside the main loop for performance
+
+                # Remove standalone dot at the start of the line (ignores HTML tags, zero-width chars & music symbols prefix)
+                current_line = start_dot_pattern.sub(r"\1\2", current_line)
+
+                # Remove standalone dot at the end of the line (ignores HTML tags, zero-width chars & music symbols suffix)
+                current_line = end_dot_pattern.sub("", current_line)
+
+                if current_line != before_dots:
+                    line_record.changed = True
+                    signature = line_signature(current_line)
+                    _log_change(
+                        index,
+                        "Pre-Process Remove Standalone Dots",
+                        before_dots,
+                        current_line,
+                        line_record.logs,
+                        detailed_logs_enabled,
+                    )
 
-                    # 3. Convert English Numerals to Persian Numerals conditionally
-                    if opt_english_num_to_persian and any(c in current_line for c in "1234567890"):
-                        # Skip lines that are just whitespace or empty
-                        if not current_line.strip():
-                            continue
+            # Apply Pre-Process Option: Remove Unneeded Spaces (Aligned with XML rules)
+            # Fast path guard: Requires at least one space or tab character.
+            if opt_remove_unneeded_spaces and signature & SIG_WHITESPACE:
+                # Skip space cleaning for subtitle comment lines with open/close markers
+                # Updated regex to support both single and double colons (e.g., .: :. or ..:: ::..)
+                if not re.search(r"\.{1,2}:{1,2}.*?:{1,2}\.{1,2}", current_line):
+                    unneeded_steps = []
+                    temp_line = UNNEEDED_SPACES_INDEX.apply(current_line, unneeded_steps)
+
+                    # Log every individual rule step that modified the line
+                    for step_before, step_after in unneeded_steps:
+                        line_record.changed = True
+                        _log_change(
+                            index,
+                            "Pre-Process Remove Unneeded Spaces",
+                            step_before,
+                            step_after,
+                            line_record.logs,
+                            detailed_logs_enabled,
+                        )
 
-                        # Only process if the line likely contains actual text
-                        # Skip if the line contains only numbers and special characters/tags
-                        if not any(c.isalpha() or "\u0600" <= c <= "\u06ff" for c in current_line):
-                            continue
+                    if temp_line != current_line:
+                        signature = line_signature(temp_line)
+                    current_line = temp_line
+
+            # Option: Convert English Question Marks and Commas to Persian
+            # Fast path guard: Look for target English characters before attempting translation.
+            if opt_persian_question_mark_and_comma and signature & SIG_LATIN_QUESTION_COMMA:
+                before_q = current_line
+                current_line = current_line.replace("?", "؟")
+
+                if not line_is_pure_english:
+                    current_line = current_line.replace(",", "،")
+
+                if current_line != before_q:
+                    line_record.changed = True
+                    signature = line_signature(current_line)
+                    _log_change(
+                        index,
+                        "Pre-Process Persian Question Mark and Comma",
+                        before_q,
+                        current_line,
+                        line_record.logs,
+                        detailed_logs_enabled,
+                    )
 
-                        before_enum = current_line
+            # 1. Convert Arabic Characters to Persian
+            if opt_arabic_char_to_persian and signature & SIG_ARABIC_CHAR:
+                before_char = current_line
+                current_line = current_line.translate(ARABIC_CHAR_TRANS)
+                if current_line != before_char:
+                    line_record.changed = True
+                    signature = line_signature(current_line)
+                    _log_change(
+                        index,
+                        "Pre-Process Arabic Chars",
+                        before_char,
+                        current_line,
+                        line_record.logs,
+                        detailed_logs_enabled,
+                    )
 
-                        def replace_eng_num(match):
-                            start = match.start()
-                            end = match.end()
-                            text = match.string
+            # 2. Convert Arabic Numerals to Persian Numerals
+            if opt_arabic_num_to_persian and signature & SIG_ARABIC_DIGIT:
+                before_anum = current_line
+                current_line = current_line.translate(ARABIC_NUM_TRANS)
+                if current_line != before_anum:
+                    line_record.changed = True
+                    signature = line_signature(current_line)
+                    _log_change(
+                        index,
+                        "Pre-Process Arabic Numerals",
+                        before_anum,
+                        current_line,
+                        line_record.logs,
+                        detailed_logs_enabled,
+                    )
 
-                            # Expand left boundary across alphanumeric and common identifier/date delimiters
-                            left = start
-                            while left > 0 and re.match(r"[A-Za-z0-9@._\-+/\\:]", text[left - 1]):
-                                left -= 1
+            # 3. Convert English Numerals to Persian Numerals conditionally
+            if opt_english_num_to_persian and signature & SIG_ENGLISH_DIGIT:
+                # Skip lines that are just whitespace or empty
+                if not current_line.strip():
+                    document.lines[index - 1] = None
+                    continue
+
+                # Only process if the line likely contains actual text
+                # Skip if the line contains only numbers and special characters/tags
+                if not any(c.isalpha() or "\u0600" <= c <= "\u06ff" for c in current_line):
+                    document.lines[index - 1] = None
+                    continue
+
+                before_enum = current_line
+                current_line = convert_english_numerals(current_line)
+                if current_line != before_enum:
+                    line_record.changed = True
+                    signature = line_signature(current_line)
+                    _log_change(
+                        index,
+                        "Pre-Process English Numerals",
+                        before_enum,
+                        current_line,
+                        line_record.logs,
+                        detailed_logs_enabled,
+                    )
 
-                            # Expand right boundary across alphanumeric and common identifier/date delimiters
-                            right = end
-                            while right < len(text) and re.match(r"[A-Za-z0-9@._\-+/\\:]", text[right]):
-                                right += 1
+            # 4. Convert Space to Invisible Space conditionally
+            if opt_space_to_invisible_space:
+                before_space_zwnj = current_line
+                temp_line = current_line
+
+                temp_line = SPACE_TO_INVISIBLE_SPACE_INDEX.apply(temp_line)
+
+                current_line = temp_line
+                if current_line != before_space_zwnj:
+                    line_record.changed = True
+                    signature = line_signature(current_line)
+                    _log_change(
+                        index,
+                        "Pre-Process Space to Invisible Space",
+                        before_space_zwnj,
+                        current_line,
+                        line_record.logs,
+                        detailed_logs_enabled,
+                    )
 
-                            token = text[left:right]
+            # 5. Fix Common Hexre Typo Errors conditionally
+            if opt_hexre_fixes and signature & SIG_HEH:
+                before_hexre = current_line
+                temp_line = current_line
+
+                temp_line = HEXRE_INDEX.apply(temp_line)
+
+                current_line = temp_line
+                if current_line != before_hexre:
+                    line_record.changed = True
+                    signature = line_signature(current_line)
+                    _log_change(
+                        index,
+                        "Pre-Process Hexre Typo Fixes",
+                        before_hexre,
+                        current_line,
+                        line_record.logs,
+                        detailed_logs_enabled,
+                    )
 
-                            # Skip emails, usernames, identifiers, filenames, dates with English month names, and mixed English tokens
-                            if re.search(r"[A-Za-z]", token):
-                                return match.group(0)
+            # --- Process Options ---
+            is_bypassed = False
+            if opt_bypass_enabled and bypass_regexes:
+                word = bypass_regexes.first_match(current_line)
+                if word is not None:
+                    is_bypassed = True
+                    if detailed_logs_enabled:
+                        log_msg = f'Line {index} bypassed | Matched "{word}" in Bypass List. No further process changes applied.'
+                        line_record.logs.append(log_msg)
+
+            if not is_bypassed:
+                is_removed = False
+
+                # Process Option: Remove List
+                if opt_remove_enabled and remove_regexes:
+                    word = remove_regexes.first_match(current_line)
+                    if word is not None:
+                        is_removed = True
+                        line_record.changed = True
+                        if detailed_logs_enabled:
+                            curr_clean = current_line.rstrip("\n")
+                            log_msg = f'Line {index} removed | Matched "{word}" in Remove List. Entire line deleted. The line was: "{curr_clean}"'
+                            line_record.logs.append(log_msg)
+                        current_line = None
+
+                # If removed, skip remaining processing steps and do not append this line
+                if is_removed:
+                    document.lines[index - 1] = None
+                    continue
+
+                # Process Option: Replace List
+                if opt_replace_enabled and replace_regexes:
+                    replace_steps = []
+                    current_line = replace_regexes.remove_matches(current_line, replace_steps)
+
+                    # Log every word that modified the line
+                    for word, before_replace, after_replace in replace_steps:
+                        line_record.changed = True
+                        _log_change(
+                            index,
+                            f'Replace List (Matched "{word}")',
+                            before_replace,
+                            after_replace,
+                            line_record.logs,
+                            detailed_logs_enabled,
+                        )
 
-                            return "".join(english_numerals.get(char, char) for char in match.group(0))
+                    if replace_steps:
+                        signature = line_signature(current_line)
+            # --- Post-Process Options ---
+            # Apply Post-Process Option: Trim Spaces
+            if opt_post_trim_spaces and current_line:
+                before_post = current_line
+                current_line = trim_line_spaces(current_line)
+
+                if current_line != before_post:
+                    line_record.changed = True
+                    signature = line_signature(current_line)
+                    _log_change(
+                        index,
+                        "Post-Process Trim Spaces",
+                        before_post,
+                        current_line,
+                        line_record.logs,
+                        detailed_logs_enabled,
+                    )
 
-                        # Split text by HTML tags to preserve numbers inside tags
-                        parts = html_tag_split_pattern.split(current_line)
-                        for i in range(len(parts)):
-                            # Only process parts that are not HTML tags
-                            if not parts[i].startswith("<"):
-                                # Ensure numbers are not attached to English letters or identifier-like tokens
-                                parts[i] = isolated_eng_num_pattern.sub(replace_eng_num, parts[i])
+            # Option: Post-Process Remove Empty Tags
+            # Fast path guard: Subtitle tags inherently require < and > characters.
+            if opt_remove_empty_tags and signature & SIG_TAG:
+                before_tags = current_line
+                temp_line = current_line
+                while empty_tag_pattern.search(temp_line):
+                    temp_line = empty_tag_pattern.sub("", temp_line)
+                current_line = temp_line
+                if current_line != before_tags:
+                    line_record.changed = True
+                    signature = line_signature(current_line)
+                    _log_change(
+                        index,
+                        "Post-Process Remove Empty Tags",
+                        before_tags,
+                        current_line,
+                        line_record.logs,
+                        detailed_logs_enabled,
+                    )
 
-                        current_line = "".join(parts)
-                        if current_line != before_enum:
-                            file_has_changes = True
-                            _log_change(
-                                index,
-                                "Pre-Process English Numerals",
-                                before_enum,
-                                current_line,
-                                file_subtitle_logs,
-                                detailed_logs_enabled,
-                            )
+            # Finally, write the line back if it wasn't removed completely
+            if current_line is not None:
+                document.lines[index - 1] = current_line
+
+    def _process_file(self, file_path, file_bytes, bypass_regexes, remove_regexes, replace_regexes):
+        """
+        Reads, processes and saves a single subtitle file, updating the counters and progress.
+        Returns its (file_process_logs, file_subtitle_logs) for _flush_file_logs, or None when the
+        file failed validation, whose logs are not written.
+        """
+        return self._process_prepared_file(
+            self._read_file(file_path, file_bytes), bypass_regexes, remove_regexes, replace_regexes
+        )
+
+    def _process_prepared_file(self, prepared, bypass_regexes, remove_regexes, replace_regexes):
+        """
+        Processes a file read by _read_file and saves its output, or leaves the output in
+        prepared.pending_save for the writer stage of the pipelined mode. Returns like _process_file.
+        """
+        # Cache ALL options to avoid thousands of dictionary lookups during line processing
+        opt_dialog_hyphen_fix = self.options.get("dialog_hyphen_fix", 1) == 1
+        opt_remove_negative_timecodes = self.options.get("remove_negative_timecodes", 1)
+        opt_fix_misplaced_timecodes = self.options.get("fix_misplaced_timecodes", 1)
+        opt_remove_duplicate_subtitles = self.options.get("remove_duplicate_subtitles", 1)
+        opt_fix_overlapping_timecodes = self.options.get("fix_overlapping_timecodes", 1)
+        opt_remove_empty_subtitles = self.options.get("remove_empty_subtitles", 1)
+        opt_add_intro_credit = self.options.get("add_intro_credit", 0)
+        opt_reformat_renumber = self.options.get("reformat_renumber", 1)
+        opt_force_rtl = self.options.get("force_rtl", 1)
+        opt_encode_utf8 = self.options.get("encode_utf8", 1)
+        detailed_logs_enabled = self.options.get("detailed_subtitle_logs", 1)
+        opt_batched_stage_execution = self.options.get("batched_stage_execution", 0)
+        opt_streaming_mode = self.options.get("streaming_mode", 0)
+        opt_intra_file_parallelism = self.options.get("intra_file_parallelism", 0)
+        intra_file_chunk_lines = max(1, int(self.options.get("intra_file_chunk_lines", 50000)))
+
+        file_path = prepared.file_path
+        filename = os.path.basename(file_path)
+        current_file_dir = os.path.dirname(file_path)
+
+        # Define output directory path dynamically for the current file
+        output_dir = os.path.join(current_file_dir, "Outputs")
+        os.makedirs(output_dir, exist_ok=True)
+        file_process_logs = prepared.file_process_logs
+        file_subtitle_logs = prepared.file_subtitle_logs
+        file_has_changes = False
+
+        self._start_file_progress(prepared.file_bytes)
+
+        if not prepared.validation_success:
+            file_process_logs.append(f"Validation failed for unsupported or corrupted format: {filename}")
+            self._finish_file_progress()
+            self._count_file(file_path, False, error="Validation failed for unsupported or corrupted format")
+            return None  # Skip processing for this invalid file; its logs are not flushed
 
-                    # 4. Convert Space to Invisible Space conditionally
-                    if opt_space_to_invisible_space:
-                        before_space_zwnj = current_line
-                        temp_line = current_line
-
-                        for (
-                            rule_pattern,
-                            replace_with,
-                            is_regex,
-                            required_literal,
-                        ) in SPACE_TO_INVISIBLE_SPACE_FAST_RULES:
-                            if required_literal is not None and required_literal not in temp_line:
-                                continue
-                            if is_regex:
-                                temp_line = rule_pattern.sub(replace_with, temp_line)
-                            else:
-                                temp_line = temp_line.replace(rule_pattern, replace_with)
+        try:
+            if prepared.read_error is not None:
+                raise prepared.read_error
+
+            # Construct output file path structure
+            name_part, _ = os.path.splitext(filename)
+
+            # Enforce SRT format for the output file, regardless of the input extension
+            output_filename = f"{name_part}_Edited.srt"
+            output_file_path = os.path.join(output_dir, output_filename)
+
+            # Outputs found in the output cache by _read_file are restored with the logs that produced them
+            if prepared.cached_entry is not None:
+                if self._restore_cached_output(prepared, output_file_path, output_filename):
+                    self._finish_file_progress()
+                    return file_process_logs, file_subtitle_logs
+                # The cached output could not be copied, so the file is read after all
+                with open_file_bytes(file_path) as data:
+                    self._read_contents(prepared, data, prepared.content_digest)
+                if not prepared.validation_success:
+                    raise ValueError("Validation failed for unsupported or corrupted format")
+            converted_lines = prepared.converted_lines
+            file_encoding = prepared.file_encoding
+            lines = prepared.lines
+
+            # Use explicit UTF-8 if setting is enabled, otherwise use original detected encoding
+            out_encoding = "utf-8-sig" if opt_encode_utf8 else file_encoding
 
-                        current_line = temp_line
-                        if current_line != before_space_zwnj:
-                            file_has_changes = True
-                            _log_change(
-                                index,
-                                "Pre-Process Space to Invisible Space",
-                                before_space_zwnj,
-                                current_line,
-                                file_subtitle_logs,
-                                detailed_logs_enabled,
-                            )
+            if detailed_logs_enabled:
+                file_subtitle_logs.append(f"Started tracking changes for: {filename}")
+
+            # The output of an uncached file is cached once it is saved (see _record_saved_file)
+            if prepared.pending_cache_entry is not None:
+                prepared.pending_cache_entry[3] = self.total_lines_processed
+                self._pending_cache_entries[file_path] = prepared.pending_cache_entry
+
+            # Streaming mode processes and writes the file window by window; files it cannot stream are read below
+            if opt_streaming_mode:
+                try:
+                    file_has_changes = self._process_file_streaming(
+                        file_path,
+                        file_encoding,
+                        output_file_path,
+                        out_encoding,
+                        file_subtitle_logs,
+                        detailed_logs_enabled,
+                        bypass_regexes,
+                        remove_regexes,
+                        replace_regexes,
+                        converted_lines,
+                    )
+                    self._count_cached_lines(file_path)
+                    self._record_saved_file(
+                        file_path, output_filename, file_has_changes, file_process_logs, file_subtitle_logs
+                    )
+                    self._finish_file_progress()
+                    return file_process_logs, file_subtitle_logs
+                except StreamingFallback:
+                    if converted_lines is not None:
+                        lines = converted_lines
+                    else:
+                        with open(file_path, "r", encoding=file_encoding) as f:
+                            lines = f.readlines()
 
-                    # 5. Fix Common Hexre Typo Errors conditionally
-                    if opt_hexre_fixes and any(c in current_line for c in "ههٔهٕ"):
-                        before_hexre = current_line
-                        temp_line = current_line
+            self._track_file_lines(len(lines))
 
-                        for rule_pattern, replace_with, is_regex, required_literal in HEXRE_FAST_RULES:
-                            if required_literal is not None and required_literal not in temp_line:
-                                continue
-                            if is_regex:
-                                temp_line = rule_pattern.sub(replace_with, temp_line)
-                            else:
-                                temp_line = temp_line.replace(rule_pattern, replace_with)
+            # Parse blocks once to identify and isolate valid text lines from timecodes/indexes
+            document = SubtitleDocument(lines)
 
-                        current_line = temp_line
-                        if current_line != before_hexre:
-                            file_has_changes = True
-                            _log_change(
-                                index,
-                                "Pre-Process Hexre Typo Fixes",
-                                before_hexre,
-                                current_line,
-                                file_subtitle_logs,
-                                detailed_logs_enabled,
-                            )
+            # The batched mode runs every stage over the whole file; the per-line loop is then skipped
+            line_iterator = enumerate(lines, start=1)
+            if opt_intra_file_parallelism and len(lines) > intra_file_chunk_lines:
+                # Very large files run their line stages in chunks on worker processes
+                file_has_changes = self._process_lines_parallel(
+                    document,
+                    file_subtitle_logs,
+                    intra_file_chunk_lines,
+                    (bypass_regexes, remove_regexes, replace_regexes),
+                )
+                line_iterator = ()
+            elif opt_batched_stage_execution:
+                file_has_changes = self._process_lines_batched(
+                    document,
+                    file_subtitle_logs,
+                    detailed_logs_enabled,
+                    bypass_regexes,
+                    remove_regexes,
+                    replace_regexes,
+                )
+                line_iterator = ()
+                self._report_progress()
 
-                    # --- Process Options ---
-                    is_bypassed = False
-                    if opt_bypass_enabled and bypass_regexes:
-                        for word, reg in bypass_regexes:
-                            if reg.search(current_line):
-                                is_bypassed = True
-                                if detailed_logs_enabled:
-                                    log_msg = f'Line {index} bypassed | Matched "{word}" in Bypass List. No further process changes applied.'
-                                    file_subtitle_logs.append(log_msg)
-                                break
+            line_record = LineRecord(file_subtitle_logs)
+            if line_iterator and self.line_cache is not None:
+                line_iterator = self._iter_uncached_lines(line_iterator, document, line_record)
 
-                    if not is_bypassed:
-                        is_removed = False
+            if self.line_pipeline is not None:
+                self._run_line_pipeline(
+                    line_iterator, document, line_record, bypass_regexes, remove_regexes, replace_regexes
+                )
+            else:
+                self._process_lines(
+                    line_iterator, document, line_record, bypass_regexes, remove_regexes, replace_regexes
+                )
 
-                        # Process Option: Remove List
-                        if opt_remove_enabled and remove_regexes:
-                            for word, reg in remove_regexes:
-                                if reg.search(current_line):
-                                    is_removed = True
-                                    file_has_changes = True
-                                    if detailed_logs_enabled:
-                                        curr_clean = current_line.rstrip("\n")
-                                        log_msg = f'Line {index} removed | Matched "{word}" in Remove List. Entire line deleted. The line was: "{curr_clean}"'
-                                        file_subtitle_logs.append(log_msg)
-                                    current_line = None
-                                    break
-
-                        # If removed, skip remaining processing steps and do not append this line
-                        if is_removed:
-                            continue
-
-                        # Process Option: Replace List
-                        if opt_replace_enabled and replace_regexes:
-                            for word, reg in replace_regexes:
-                                if reg.search(current_line):
-                                    before_replace = current_line
-                                    current_line = reg.sub("", current_line)
-                                    if current_line != before_replace:
-                                        file_has_changes = True
-                                        _log_change(
-                                            index,
-                                            f'Replace List (Matched "{word}")',
-                                            before_replace,
-                                            current_line,
-                                            file_subtitle_logs,
-                                            detailed_logs_enabled,
-                                        )
-                    # --- Post-Process Options ---
-                    # Apply Post-Process Option: Trim Spaces
-                    if opt_post_trim_spaces and current_line:
-                        before_post = current_line
-                        current_line = trim_line_spaces(current_line)
-
-                        if current_line != before_post:
-                            file_has_changes = True
-                            _log_change(
-                                index,
-                                "Post-Process Trim Spaces",
-                                before_post,
-                                current_line,
-                                file_subtitle_logs,
-                                detailed_logs_enabled,
-                            )
+            if line_record.changed:
+                file_has_changes = True
 
-                    # Option: Post-Process Remove Empty Tags
-                    # Fast path guard: Subtitle tags inherently require < and > characters.
-                    if opt_remove_empty_tags and any(c in current_line for c in "<>"):
-                        before_tags = current_line
-                        temp_line = current_line
-                        while empty_tag_pattern.search(temp_line):
-                            temp_line = empty_tag_pattern.sub("", temp_line)
-                        current_line = temp_line
-                        if current_line != before_tags:
-                            file_has_changes = True
-                            _log_change(
-                                index,
-                                "Post-Process Remove Empty Tags",
-                                before_tags,
-                                current_line,
-                                file_subtitle_logs,
-                                detailed_logs_enabled,
-                            )
+            processed_lines = document.output_lines()
+            blocks = None
 
-                    # Finally, append the line if it wasn't removed completely
-                    if current_line is not None:
-                        processed_lines.append(current_line)
+            run_block_operations = (
+                opt_add_intro_credit
+                or opt_remove_negative_timecodes
+                or opt_fix_misplaced_timecodes
+                or opt_remove_duplicate_subtitles
+                or opt_remove_empty_subtitles
+                or opt_reformat_renumber
+            )
 
-                # --- Block-Level Dialog Hyphen Validation ---
-                if opt_dialog_hyphen_fix:
-                    dialog_blocks = parse_srt_blocks(processed_lines)
-                    dialog_blocks = fix_trailing_dialog_hyphens(dialog_blocks)
-                    dialog_blocks = fix_inconsistent_dialog_hyphens(dialog_blocks)
+            # --- Block-Level Dialog Hyphen Validation ---
+            if opt_dialog_hyphen_fix:
+                dialog_blocks = document.current_blocks()
+                dialog_blocks = fix_trailing_dialog_hyphens(dialog_blocks)
+                dialog_blocks = fix_inconsistent_dialog_hyphens(dialog_blocks)
+                blocks = settle_blocks(dialog_blocks)
 
+                # Reformat & Renumber serializes the blocks itself, so the intermediate lines are skipped then
+                if dialog_blocks and not (blocks is not None and run_block_operations and opt_reformat_renumber):
                     dialog_reformatted_lines = []
                     for dialog_block in dialog_blocks:
                         if dialog_block["index"]:
@@ -1349,437 +3402,489 @@ class SubtitleProcessor:
                         for dialog_text_line in dialog_block["text_lines"]:
                             dialog_reformatted_lines.append(f"{dialog_text_line}\n")
                         dialog_reformatted_lines.append("\n")
-
-                    if dialog_reformatted_lines:
-                        processed_lines = dialog_reformatted_lines
-
-                # --- Block-Level Post-Process Operations ---
-                if (
-                    opt_add_intro_credit
-                    or opt_remove_negative_timecodes
-                    or opt_fix_misplaced_timecodes
-                    or opt_remove_duplicate_subtitles
-                    or opt_remove_empty_subtitles
-                    or opt_reformat_renumber
-                ):
+                    processed_lines = dialog_reformatted_lines
+            elif run_block_operations:
+                blocks = document.current_blocks()
+
+            # --- Block-Level Post-Process Operations ---
+            if run_block_operations:
+                # Blocks that would not parse back the same are read from the serialized lines
+                if blocks is None:
                     blocks = parse_srt_blocks(processed_lines)
+                cues = CueStore.from_blocks(blocks)
 
-                    # Option: Remove Negative Timecodes
-                    if opt_remove_negative_timecodes:
-                        filtered_blocks = []
-                        for b in blocks:
-                            if (
-                                b["start_ms"] < 0
-                                or b["end_ms"] < 0
-                                or b["start_str"].startswith("-")
-                                or b["end_str"].startswith("-")
-                            ):
-                                file_has_changes = True
-                                if detailed_logs_enabled:
-                                    b_index = b["index"]
-                                    b_start = b["start_str"]
-                                    b_end = b["end_str"]
-                                    log_msg = f'Subtitle block removed | Option: Remove Negative Timecodes | Index: "{b_index}" | Timecode: "{b_start} --> {b_end}"'
-                                    file_subtitle_logs.append(log_msg)
-                            else:
-                                filtered_blocks.append(b)
-                        blocks = filtered_blocks
-
-                    # Option: Fix Misplaced Timecodes
-                    if opt_fix_misplaced_timecodes:
-                        blocks = fix_misplaced_timecodes(blocks, file_subtitle_logs, detailed_logs_enabled)
-
-                    # Option: Remove Duplicate Subtitles
-                    if opt_remove_duplicate_subtitles:
-                        before_dup = len(blocks)
-                        blocks = remove_duplicate_subtitles(blocks, file_subtitle_logs, detailed_logs_enabled)
-                        if len(blocks) != before_dup:
-                            file_has_changes = True
+                # Option: Remove Negative Timecodes
+                if opt_remove_negative_timecodes:
+                    negative_mask = cues.negative_mask()
+                    if negative_mask.any():
+                        file_has_changes = True
+                        if detailed_logs_enabled:
+                            for row in np.flatnonzero(negative_mask).tolist():
+                                b_index = cues.index[row]
+                                b_start = cues.start_str[row]
+                                b_end = cues.end_str[row]
+                                log_msg = f'Subtitle block removed | Option: Remove Negative Timecodes | Index: "{b_index}" | Timecode: "{b_start} --> {b_end}"'
+                                file_subtitle_logs.append(log_msg)
+                        cues.select(~negative_mask)
+
+                # Option: Fix Misplaced Timecodes
+                if opt_fix_misplaced_timecodes:
+                    fix_misplaced_timecodes(cues, file_subtitle_logs, detailed_logs_enabled)
+
+                # Option: Remove Duplicate Subtitles
+                if opt_remove_duplicate_subtitles:
+                    before_dup = len(cues)
+                    remove_duplicate_subtitles(cues, file_subtitle_logs, detailed_logs_enabled)
+                    if len(cues) != before_dup:
+                        file_has_changes = True
 
-                    # Option: Fix Overlapping Timecodes
-                    if opt_fix_overlapping_timecodes:
-                        blocks, has_changes = fix_overlapping_timecodes(
-                            blocks, file_subtitle_logs, detailed_logs_enabled
-                        )
-                        if has_changes:
-                            file_has_changes = True
+                # Option: Fix Overlapping Timecodes
+                if opt_fix_overlapping_timecodes:
+                    if fix_overlapping_timecodes(cues, file_subtitle_logs, detailed_logs_enabled):
+                        file_has_changes = True
 
-                    # Option: Remove Empty Subtitles
-                    if opt_remove_empty_subtitles:
-                        filtered_blocks = []
-                        for b in blocks:
-                            text_content = "".join(b["text_lines"]).strip()
-                            if not text_content:
+                # Option: Remove Empty Subtitles
+                if opt_remove_empty_subtitles:
+                    empty_mask = cues.empty_mask()
+                    if empty_mask.any():
+                        file_has_changes = True
+                        if detailed_logs_enabled:
+                            for row in np.flatnonzero(empty_mask).tolist():
+                                b_index = cues.index[row]
+                                b_start = cues.start_str[row]
+                                b_end = cues.end_str[row]
+                                log_msg = f'Subtitle block removed | Option: Remove Empty Subtitles | Index: "{b_index}" | Timecode: "{b_start} --> {b_end}"'
+                                file_subtitle_logs.append(log_msg)
+                        cues.select(~empty_mask)
+
+                # Option: Add Intro Credit Subtitle
+                if opt_add_intro_credit:
+                    credit_lines, dur_ms = self._intro_credit()
+                    if credit_lines:
+                        required_space = dur_ms + 400
+
+                        if not len(cues):
+                            cues.insert(0, "1", 200, 200 + dur_ms, credit_lines)
+                            file_has_changes = True
+                            if detailed_logs_enabled:
+                                log_msg = f'Intro credit subtitle added | Timecode: "{ms_to_timecode(200)} --> {ms_to_timecode(200 + dur_ms)}"'
+                                file_subtitle_logs.append(log_msg)
+                        else:
+                            first_start_ms = int(cues.start_ms[0])
+                            if first_start_ms >= required_space:
+                                start_time_ms = 200
+                                end_time_ms = start_time_ms + dur_ms
+                                cues.insert(0, "1", start_time_ms, end_time_ms, credit_lines)
                                 file_has_changes = True
                                 if detailed_logs_enabled:
-                                    b_index = b["index"]
-                                    b_start = b["start_str"]
-                                    b_end = b["end_str"]
-                                    log_msg = f'Subtitle block removed | Option: Remove Empty Subtitles | Index: "{b_index}" | Timecode: "{b_start} --> {b_end}"'
+                                    log_msg = f'Intro credit subtitle added at beginning | Timecode: "{ms_to_timecode(start_time_ms)} --> {ms_to_timecode(end_time_ms)}"'
                                     file_subtitle_logs.append(log_msg)
                             else:
-                                filtered_blocks.append(b)
-                        blocks = filtered_blocks
-
-                    # Option: Add Intro Credit Subtitle
-                    if opt_add_intro_credit:
-                        credit_text = self.options.get("intro_credit_text", "").strip()
-                        if credit_text:
-                            credit_lines = [l.strip() for l in credit_text.split("\n") if l.strip()][:2]
-                            if credit_lines:
-                                try:
-                                    dur_sec = int(self.options.get("intro_credit_duration", "8"))
-                                    dur_sec = max(2, min(10, dur_sec))
-                                except Exception:
-                                    dur_sec = 8
-
-                                dur_ms = dur_sec * 1000
-                                required_space = dur_ms + 400
-
-                                if not blocks:
-                                    new_block = {
-                                        "index": "1",
-                                        "start_ms": 200,
-                                        "end_ms": 200 + dur_ms,
-                                        "start_str": ms_to_timecode(200),
-                                        "end_str": ms_to_timecode(200 + dur_ms),
-                                        "text_lines": credit_lines,
-                                    }
-                                    blocks.append(new_block)
+                                k = cues.first_gap(required_space)
+                                if k >= 0:
+                                    start_time_ms = int(cues.end_ms[k]) + 200
+                                    end_time_ms = start_time_ms + dur_ms
+                                    cues.insert(k + 1, "", start_time_ms, end_time_ms, credit_lines)
                                     file_has_changes = True
                                     if detailed_logs_enabled:
-                                        log_msg = f'Intro credit subtitle added | Timecode: "{ms_to_timecode(200)} --> {ms_to_timecode(200 + dur_ms)}"'
+                                        log_msg = f'Intro credit subtitle added at gap after block {k + 1} | Timecode: "{ms_to_timecode(start_time_ms)} --> {ms_to_timecode(end_time_ms)}"'
                                         file_subtitle_logs.append(log_msg)
                                 else:
-                                    first_start_ms = blocks[0]["start_ms"]
-                                    if first_start_ms >= required_space:
-                                        start_time_ms = 200
-                                        end_time_ms = start_time_ms + dur_ms
-                                        new_block = {
-                                            "index": "1",
-                                            "start_ms": start_time_ms,
-                                            "end_ms": end_time_ms,
-                                            "start_str": ms_to_timecode(start_time_ms),
-                                            "end_str": ms_to_timecode(end_time_ms),
-                                            "text_lines": credit_lines,
-                                        }
-                                        blocks.insert(0, new_block)
-                                        file_has_changes = True
-                                        if detailed_logs_enabled:
-                                            log_msg = f'Intro credit subtitle added at beginning | Timecode: "{ms_to_timecode(start_time_ms)} --> {ms_to_timecode(end_time_ms)}"'
-                                            file_subtitle_logs.append(log_msg)
-                                    else:
-                                        inserted = False
-                                        for k in range(len(blocks) - 1):
-                                            gap_start = blocks[k]["end_ms"]
-                                            gap_end = blocks[k + 1]["start_ms"]
-
-                                            if gap_end - gap_start >= required_space:
-                                                start_time_ms = gap_start + 200
-                                                end_time_ms = start_time_ms + dur_ms
-                                                new_block = {
-                                                    "index": "",
-                                                    "start_ms": start_time_ms,
-                                                    "end_ms": end_time_ms,
-                                                    "start_str": ms_to_timecode(start_time_ms),
-                                                    "end_str": ms_to_timecode(end_time_ms),
-                                                    "text_lines": credit_lines,
-                                                }
-                                                blocks.insert(k + 1, new_block)
-                                                inserted = True
-                                                file_has_changes = True
-                                                if detailed_logs_enabled:
-                                                    log_msg = f'Intro credit subtitle added at gap after block {k + 1} | Timecode: "{ms_to_timecode(start_time_ms)} --> {ms_to_timecode(end_time_ms)}"'
-                                                    file_subtitle_logs.append(log_msg)
-                                                break
-
-                                        if not inserted:
-                                            last_end = blocks[-1]["end_ms"]
-                                            start_time_ms = last_end + 200
-                                            end_time_ms = start_time_ms + dur_ms
-                                            new_block = {
-                                                "index": "",
-                                                "start_ms": start_time_ms,
-                                                "end_ms": end_time_ms,
-                                                "start_str": ms_to_timecode(start_time_ms),
-                                                "end_str": ms_to_timecode(end_time_ms),
-                                                "text_lines": credit_lines,
-                                            }
-                                            blocks.append(new_block)
-                                            file_has_changes = True
-                                            if detailed_logs_enabled:
-                                                log_msg = f'Intro credit subtitle added at the end | Timecode: "{ms_to_timecode(start_time_ms)} --> {ms_to_timecode(end_time_ms)}"'
-                                                file_subtitle_logs.append(log_msg)
-
-                    # Option: Reformat & Renumber Subtitles
-                    if opt_reformat_renumber:
-                        reformatted_lines = []
-                        for new_idx, b in enumerate(blocks, start=1):
-                            reformatted_lines.append(f"{new_idx}\n")
-                            tc_s = ms_to_timecode(b["start_ms"])
-                            tc_e = ms_to_timecode(b["end_ms"])
-                            reformatted_lines.append(f"{tc_s} --> {tc_e}\n")
-                            for t_line in b["text_lines"]:
-                                reformatted_lines.append(f"{t_line}\n")
-                            reformatted_lines.append("\n")
-                        processed_lines = reformatted_lines
+                                    last_end = int(cues.end_ms[-1])
+                                    start_time_ms = last_end + 200
+                                    end_time_ms = start_time_ms + dur_ms
+                                    cues.insert(len(cues), "", start_time_ms, end_time_ms, credit_lines)
+                                    file_has_changes = True
+                                    if detailed_logs_enabled:
+                                        log_msg = f'Intro credit subtitle added at the end | Timecode: "{ms_to_timecode(start_time_ms)} --> {ms_to_timecode(end_time_ms)}"'
+                                        file_subtitle_logs.append(log_msg)
 
-                        if detailed_logs_enabled:
-                            log_msg = f"Reformat & Renumber completed | Total blocks renumbered: {len(blocks)}"
-                            file_subtitle_logs.append(log_msg)
-
-                # Option: Post-Process Force RTL (Remove control chars and force Right-To-Left)
-                # Executed after reformat and renumber block as requested
-                if opt_force_rtl:
-                    rtl_processed_lines = []
-                    rtl_modified_lines_count = 0
-
-                    # Tuples of symbols that require RTL enforcement at boundaries
-                    start_symbols = (
-                        ".",
-                        "…",
-                        "-",
-                        "–",
-                        "—",
-                        '"',
-                        "'",
-                        "«",
-                        "»",
-                        "“",
-                        "”",
-                        "‘",
-                        "’",
-                        "(",
-                        "[",
-                        "{",
-                        "<",
-                    )
-                    end_symbols = (
-                        ".",
-                        "!",
-                        "؟",
-                        "?",
-                        "،",
-                        ",",
-                        ":",
-                        "؛",
-                        ";",
-                        "…",
-                        '"',
-                        "'",
-                        "«",
-                        "»",
-                        "“",
-                        "”",
-                        "‘",
-                        "’",
-                        ")",
-                        "]",
-                        "}",
-                        ">",
-                    )
+                # Option: Reformat & Renumber Subtitles
+                if opt_reformat_renumber:
+                    processed_lines = cues.to_srt_lines()
 
-                    for index, line in enumerate(processed_lines, start=1):
-                        if index_match(line) or timecode_match(line) or not line.strip():
-                            rtl_processed_lines.append(line)
-                        else:
-                            original_text_line = line
-                            clean_text = line
+                    if detailed_logs_enabled:
+                        log_msg = f"Reformat & Renumber completed | Total blocks renumbered: {len(cues)}"
+                        file_subtitle_logs.append(log_msg)
 
-                            clean_text = clean_text.translate(CTRL_CHAR_TRANS)
+            # Option: Post-Process Force RTL (Remove control chars and force Right-To-Left)
+            # Executed after reformat and renumber block as requested
+            if opt_force_rtl:
+                rtl_processed_lines, rtl_modified_lines_count, rtl_has_changes = self._enforce_rtl(
+                    processed_lines, 1, file_subtitle_logs, detailed_logs_enabled
+                )
+                if rtl_has_changes:
+                    file_has_changes = True
 
-                            # Apply RTL Trim Spaces
-                            if opt_post_trim_spaces and clean_text:
-                                before_post = clean_text
-                                clean_text = trim_line_spaces(clean_text)
-                                if before_post != clean_text:
-                                    file_has_changes = True
-                                    _log_change(
-                                        index,
-                                        "RTL Trim Spaces",
-                                        before_post,
-                                        clean_text,
-                                        file_subtitle_logs,
-                                        detailed_logs_enabled,
-                                    )
+                # Log total RTL changes once at the end if any lines were modified
+                if rtl_modified_lines_count > 0 and detailed_logs_enabled:
+                    log_msg = f"Total subtitle lines RTL formatted: {rtl_modified_lines_count}"
+                    file_subtitle_logs.append(log_msg)
 
-                            # Apply Post-Process Option: Smart RTL Enforcement
-                            if clean_text.strip():
-                                line_stripped = clean_text.rstrip("\r\n")
-                                line_ending = clean_text[len(line_stripped) :]
-
-                                # Remove HTML tags AND invisible zero-width chars temporarily to check boundaries accurately
-                                text_no_tags = HTML_TAG_RE.sub("", line_stripped)
-                                text_no_tags = ZERO_WIDTH_RE.sub("", text_no_tags).strip()
-
-                                if text_no_tags:
-                                    # Ignore music symbols when detecting non-English content
-                                    text_for_language_check = MUSIC_SYMBOLS_RE.sub("", text_no_tags).strip()
-
-                                    # Check if the line contains any non-ASCII (non-English) characters
-                                    has_non_english = bool(NON_ASCII_RE.search(text_for_language_check))
-
-                                    if has_non_english:
-                                        # Fix visually typed punctuation at the start of the line
-                                        # Moves misplaced punctuation (colons, question/exclamation marks) from the start to the end
-                                        if re.match(r"^((?:<[^>]+>\s*)*)([:؛!\?؟])", line_stripped):
-                                            line_stripped = re.sub(
-                                                r"^((?:<[^>]+>\s*)*)([:؛!\?؟])\s*(.*)$", r"\1\3\2", line_stripped
-                                            )
-
-                                        # Re-evaluate text_no_tags after modification
-                                        text_no_tags = HTML_TAG_RE.sub("", line_stripped)
-                                        text_no_tags = re.sub(r"[\u200b\u200c\u200d\ufeff]", "", text_no_tags).strip()
-
-                                        # Check for music symbols before removing them to ensure they trigger RTL formatting
-                                        has_music_symbol = bool(MUSIC_SYMBOLS_RE.search(text_no_tags))
-
-                                        # Ignore music symbols for boundary checks to accurately detect punctuation
-                                        text_no_tags = MUSIC_SYMBOLS_RE.sub("", text_no_tags).strip()
-
-                                        has_symbol_start = text_no_tags.startswith(start_symbols)
-                                        has_symbol_end = text_no_tags.endswith(end_symbols)
-                                        # Detect English letters, ASCII digits, Persian digits and Arabic digits
-                                        has_english_or_digits = bool(
-                                            re.search(r"[a-zA-Z0-9\u06F0-\u06F9\u0660-\u0669]", text_no_tags)
-                                        )
-                                        rtl_line = line_stripped
-
-                                        # Use RLE (\u202b) and PDF (\u202c) to strictly enforce RTL direction
-                                        # This forces the internal bidi algorithm to treat English words and digits as embedded inside an RTL context
-                                        if (
-                                            has_symbol_start
-                                            or has_symbol_end
-                                            or has_english_or_digits
-                                            or has_music_symbol
-                                        ):
-                                            # Place Bidi markers inside HTML tags to prevent rendering issues in players
-                                            tag_pattern = r"^((?:<[^>]+>\s*)*)(.*?)(\s*(?:<[^>]+>\s*)*)$"
-                                            tag_match = re.match(tag_pattern, rtl_line)
-                                            if tag_match:
-                                                rtl_line = (
-                                                    tag_match.group(1)
-                                                    + "\u202b"
-                                                    + tag_match.group(2)
-                                                    + "\u202c"
-                                                    + tag_match.group(3)
-                                                )
-                                            else:
-                                                rtl_line = "\u202b" + rtl_line + "\u202c"
-
-                                        clean_text = rtl_line + line_ending
-                                    else:
-                                        # Skip RTL processing completely for fully English/ASCII lines
-                                        clean_text = line_stripped + line_ending
-                            else:
-                                clean_text = line_stripped + line_ending
+                processed_lines = rtl_processed_lines
 
-                            if clean_text != original_text_line:
-                                file_has_changes = True
-                                rtl_modified_lines_count += 1
-                                _log_change(
-                                    index,
-                                    "Smart RTL Enforcement",
-                                    original_text_line,
-                                    clean_text,
-                                    file_subtitle_logs,
-                                    detailed_logs_enabled,
-                                )
+            self._count_cached_lines(file_path)
+            pending_save = (
+                file_path,
+                output_file_path,
+                output_filename,
+                out_encoding,
+                processed_lines,
+                file_has_changes,
+                file_process_logs,
+                file_subtitle_logs,
+            )
+            if self._defer_saves:
+                prepared.pending_save = pending_save
+            else:
+                self._save_output(*pending_save)
 
-                            rtl_processed_lines.append(clean_text)
+        except Exception as e:
+            self._record_failed_file(file_path, e, file_process_logs)
 
-                    # Log total RTL changes once at the end if any lines were modified
-                    if rtl_modified_lines_count > 0 and detailed_logs_enabled:
-                        log_msg = f"Total subtitle lines RTL formatted: {rtl_modified_lines_count}"
-                        file_subtitle_logs.append(log_msg)
+        self._finish_file_progress()
+        return file_process_logs, file_subtitle_logs
 
-                    processed_lines = rtl_processed_lines
+    def _flush_file_logs(self, file_path, file_process_logs, file_subtitle_logs):
+        """Appends a processed file's logs to the log files next to it."""
+        filename = os.path.basename(file_path)
+        current_file_dir = os.path.dirname(file_path)
+        detailed_logs_enabled = self.options.get("detailed_subtitle_logs", 1)
 
-                # Construct output file path structure
-                name_part, _ = os.path.splitext(filename)
+        # Flush timestamped process logs while preserving the timestamp captured at append time
+        if file_process_logs and current_file_dir and os.path.isdir(current_file_dir):
+            process_log_file = os.path.join(current_file_dir, "Logs", "process-logs.txt")
+            LOG_SINK.write_entries(
+                process_log_file, file_process_logs, "Process logging failed", self.log_rotate_bytes
+            )
 
-                # Enforce SRT format for the output file, regardless of the input extension
-                output_filename = f"{name_part}_Edited.srt"
-                output_file_path = os.path.join(output_dir, output_filename)
+        # Flush timestamped subtitle logs while preserving the timestamp captured at append time
+        if (
+            file_subtitle_logs
+            and detailed_logs_enabled
+            and current_file_dir
+            and os.path.isdir(current_file_dir)
+        ):
+            subtitle_log_dir = os.path.join(current_file_dir, "Logs", "Subtitle-Logs")
+            if self.options.get("change_journal_format", "text") == "jsonl":
+                LOG_SINK.write_lines(
+                    os.path.join(subtitle_log_dir, f"{filename}_changelogs.jsonl"),
+                    journal_lines(filename, file_subtitle_logs),
+                    "Subtitle detailed logging failed",
+                )
+            else:
+                LOG_SINK.write_entries(
+                    os.path.join(subtitle_log_dir, f"{filename}_changelogs.txt"),
+                    ((timestamp, format_log_message(message)) for timestamp, message in file_subtitle_logs),
+                    "Subtitle detailed logging failed",
+                )
 
-                # Use explicit UTF-8 if setting is enabled, otherwise use original detected encoding
-                out_encoding = "utf-8-sig" if opt_encode_utf8 else file_encoding
+    def _run_pipelined(self, srt_files_paths, file_sizes, rule_lists):
+        """
+        Processes the files in order with reading and writing overlapped on two threads: a reader
+        prefetches upcoming files (see _read_file) and a writer saves outputs and flushes logs, both
+        through bounded queues of "pipeline_prefetch_files" files. Outputs and logs are identical to
+        the sequential run; a file counts towards progress once it is processed.
+        """
+        queue_size = max(1, int(self.options.get("pipeline_prefetch_files", 4)))
+        read_queue = queue.Queue(maxsize=queue_size)
+        write_queue = queue.Queue(maxsize=queue_size)
+        writer_errors = []
+
+        def read_files():
+            for file_path in srt_files_paths:
+                try:
+                    read_queue.put(self._read_file(file_path, file_sizes[file_path]))
+                except BaseException as e:
+                    # Failures outside the per-file error handling stop the run, as in the sequential loop
+                    read_queue.put(e)
+                    return
+
+        def write_files():
+            while True:
+                item = write_queue.get()
+                if item is None:
+                    return
+                prepared, file_logs = item
+                try:
+                    if prepared.pending_save is not None:
+                        try:
+                            self._save_output(*prepared.pending_save)
+                        except Exception as e:
+                            self._record_failed_file(prepared.file_path, e, prepared.file_process_logs)
+                        prepared.pending_save = None
+                    if file_logs is not None:
+                        self._flush_file_logs(prepared.file_path, *file_logs)
+                except BaseException as e:
+                    writer_errors.append(e)
+
+        reader = threading.Thread(target=read_files, daemon=True)
+        writer = threading.Thread(target=write_files)
+        reader.start()
+        writer.start()
+        self._defer_saves = True
+        try:
+            for _ in srt_files_paths:
+                prepared = read_queue.get()
+                if isinstance(prepared, BaseException):
+                    raise prepared
+                if self._ledger is not None:
+                    self._ledger.mark_started(prepared.file_path)
+                write_queue.put((prepared, self._process_prepared_file(prepared, *rule_lists)))
+        finally:
+            self._defer_saves = False
+            write_queue.put(None)
+            writer.join()
+
+        if writer_errors:
+            raise writer_errors[0]
+
+    def _parallel_executor(self, max_workers, rule_lists):
+        """
+        Returns the executor of the parallel modes. The "thread" backend shares the compiled rules of
+        this process and runs the batched stages, whose substitutions over joined text release the
+        GIL (see BATCH_CONCURRENT); the "process" backend starts a Python process per worker.
+        """
+        if self.options.get("parallel_backend", "process") == "thread":
+            return ThreadPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_parallel_worker,
+                initargs=(dict(self.options, batched_stage_execution=1), rule_lists),
+            )
+        return ProcessPoolExecutor(max_workers=max_workers, initializer=_init_parallel_worker, initargs=(self.options,))
+
+    def _run_parallel(self, srt_files_paths, file_sizes, rule_lists):
+        """
+        Processes the files on a pool of workers (see _parallel_executor), largest first. Files that share an output
+        name (e.g. movie.srt and movie.vtt) form one task and keep their sequential order. Counters,
+        progress and log files are updated here in the parent, in the original file order, so the
+        results are identical to the sequential run.
+        """
+        workers = int(self.options.get("parallel_workers", 0)) or os.cpu_count() or 1
+
+        groups = {}
+        for position, file_path in enumerate(srt_files_paths):
+            groups.setdefault(os.path.splitext(file_path)[0].lower(), []).append(position)
+        tasks = sorted(groups.values(), key=lambda positions: -sum(file_sizes[srt_files_paths[p]] for p in positions))
+
+        results = {}
+        next_position = 0
+        with self._parallel_executor(min(workers, len(tasks)), rule_lists) as executor:
+            futures = {
+                executor.submit(
+                    _process_files_in_worker, [(srt_files_paths[p], file_sizes[srt_files_paths[p]]) for p in positions]
+                ): positions
+                for positions in tasks
+            }
+            if self._ledger is not None:
+                for file_path in srt_files_paths:
+                    self._ledger.mark_started(file_path)
+            for future in as_completed(futures):
+                for position, file_result in zip(futures[future], future.result()):
+                    results[position] = file_result
+                    self.processed_bytes += file_sizes[srt_files_paths[position]]
+                self._report_progress()
 
-                with open(output_file_path, "w", encoding=out_encoding) as f:
-                    f.writelines(processed_lines)
+                # Flush finished files in their original order; later ones wait for the files before them
+                while next_position in results:
+                    file_logs, successful, failed, lines_processed, file_result = results.pop(next_position)
+                    self.successful_count += successful
+                    self.failed_count += failed
+                    self.total_lines_processed += lines_processed
+                    if file_result is not None:
+                        self.file_results[srt_files_paths[next_position]] = file_result
+                        if self._ledger is not None:
+                            self._ledger.record(srt_files_paths[next_position], file_result)
+                    if file_logs is not None:
+                        self._flush_file_logs(srt_files_paths[next_position], *file_logs)
+                    next_position += 1
+
+    def _start_ledger(self, srt_files_paths):
+        """
+        Opens the run ledger in the Logs folder and starts a run over the files. With "resume_run", the last
+        unfinished run over the same folder and settings is continued and the files it completed are dropped.
+        """
+        root = os.path.dirname(srt_files_paths[0]) if self.target_files else self.folder_path
+        self._ledger = RunLedger(os.path.join(root, "Logs", "run-ledger.sqlite3"))
+        run_id, resumed, completed = self._ledger.start_run(
+            root,
+            options_fingerprint(self.options, ENGINE_OPTION_KEYS).hex(),
+            srt_files_paths,
+            resume=bool(self.options.get("resume_run", 0)),
+        )
+        if resumed:
+            remaining_files = [f for f in srt_files_paths if f not in completed]
+            Logger.log_process(
+                f"Resuming run {run_id}: {len(srt_files_paths) - len(remaining_files)} completed file(s) skipped, "
+                f"{len(remaining_files)} left.",
+                root,
+                self.log_rotate_bytes,
+            )
+            srt_files_paths = remaining_files
+        return srt_files_paths
 
-                file_process_logs.append(f"Processed and saved successfully: {output_filename}")
-                if detailed_logs_enabled:
-                    file_subtitle_logs.append(f"Finished tracking. Total changes occurred: {file_has_changes}")
+    def run(self):
+        try:
+            self._run()
+        finally:
+            if self._ledger is not None:
+                # Queued file states are committed; a run that did not finish stays resumable
+                self._ledger.close()
+                self._ledger = None
+            # Log lines are written by a background thread; make sure they are on disk when run returns
+            LOG_SINK.flush()
+
+    def _run(self):
+        # Determine files to process based on execution mode
+        valid_extensions = (".srt", ".txt", ".vtt", ".ass")
 
-                # Post processing clean up option: Delete Original
-                if opt_delete_original:
-                    os.remove(file_path)
-                    file_process_logs.append(f"Original file deleted by request: {filename}")
+        if self.target_files:
+            srt_files_paths = [f for f in self.target_files if f.lower().endswith(valid_extensions)]
+            if srt_files_paths:
+                Logger.log_process(
+                    f"Single file process started. Found {len(srt_files_paths)} file(s).",
+                    os.path.dirname(srt_files_paths[0]),
+                    self.log_rotate_bytes,
+                )
+        else:
+            if not self.folder_path or not os.path.isdir(self.folder_path):
+                return
+            all_files = os.listdir(self.folder_path)
+            srt_files_paths = [
+                os.path.join(self.folder_path, f) for f in all_files if f.lower().endswith(valid_extensions)
+            ]
+            if not srt_files_paths:
+                Logger.log_process(
+                    "No valid subtitle files (.srt, .txt, .vtt, .ass) found to process.",
+                    self.folder_path,
+                    self.log_rotate_bytes,
+                )
+                return
+            Logger.log_process(
+                f"Process started. Found {len(srt_files_paths)} file(s).", self.folder_path, self.log_rotate_bytes
+            )
 
-                # Increment successful tracking counter
-                self.successful_count += 1
-                self._report_progress()
+        if self.options.get("run_ledger", 0):
+            srt_files_paths = self._start_ledger(srt_files_paths)
 
-            except Exception as e:
-                file_process_logs.append(f"Failed to process file {filename} due to: {str(e)}")
-                self._report_progress()
-                # Increment failed tracking counter
-                self.failed_count += 1
+        bypass_regexes, remove_regexes, replace_regexes = self._compile_rule_lists()
 
-            finally:
-                if opt_delete_converted_temp_files and converted_temp_file and os.path.isfile(actual_file_path):
-                    try:
-                        os.remove(actual_file_path)
-                        file_process_logs.append(
-                            f"Temporary converted SRT file deleted by request: {os.path.basename(actual_file_path)}"
-                        )
-                    except Exception as e:
-                        file_process_logs.append(
-                            f"Failed to delete temporary converted SRT file {os.path.basename(actual_file_path)}: {str(e)}"
-                        )
+        start_time = time.time()
+        self._report_convert_start()
+        # Progress is measured against the input sizes from a stat call; no file is read ahead of processing
+        file_sizes = {}
+        self.total_input_bytes = 0
+        self.processed_bytes = 0
 
-                # Flush timestamped process logs while preserving the timestamp captured at append time
-                if file_process_logs and current_file_dir and os.path.isdir(current_file_dir):
-                    process_log_dir = os.path.join(current_file_dir, "Logs")
-                    os.makedirs(process_log_dir, exist_ok=True)
-                    process_log_file = os.path.join(process_log_dir, "process-logs.txt")
+        for file_path in srt_files_paths:
+            try:
+                file_sizes[file_path] = os.path.getsize(file_path)
+            except OSError:
+                file_sizes[file_path] = 0
+            self.total_input_bytes += file_sizes[file_path]
 
-                    try:
-                        with open(process_log_file, "a", encoding="utf-8") as f:
-                            for timestamp, message in file_process_logs:
-                                f.write(f"[{timestamp}] {message}\n")
-                    except Exception as e:
-                        print(f"Process logging failed: {e}")
+        self._report_process_start()
+        if self.options.get("parallel_mode", 0) and len(srt_files_paths) > 1:
+            self._run_parallel(srt_files_paths, file_sizes, (bypass_regexes, remove_regexes, replace_regexes))
+        elif self.options.get("pipelined_io", 0):
+            self._run_pipelined(srt_files_paths, file_sizes, (bypass_regexes, remove_regexes, replace_regexes))
+        else:
+            for file_path in srt_files_paths:
+                if self._ledger is not None:
+                    self._ledger.mark_started(file_path)
+                file_logs = self._process_file(
+                    file_path, file_sizes[file_path], bypass_regexes, remove_regexes, replace_regexes
+                )
+                if file_logs is not None:
+                    self._flush_file_logs(file_path, *file_logs)
 
-                # Flush timestamped subtitle logs while preserving the timestamp captured at append time
-                if (
-                    file_subtitle_logs
-                    and detailed_logs_enabled
-                    and current_file_dir
-                    and os.path.isdir(current_file_dir)
-                ):
-                    subtitle_log_dir = os.path.join(current_file_dir, "Logs", "Subtitle-Logs")
-                    os.makedirs(subtitle_log_dir, exist_ok=True)
-                    subtitle_log_file = os.path.join(subtitle_log_dir, f"{filename}_changelogs.txt")
-
-                    try:
-                        with open(subtitle_log_file, "a", encoding="utf-8") as f:
-                            for timestamp, message in file_subtitle_logs:
-                                f.write(f"[{timestamp}] {message}\n")
-                    except Exception as e:
-                        print(f"Subtitle detailed logging failed: {e}")
-        if self.total_input_lines > 0:
-            self.total_lines_processed = self.total_input_lines
+        if self._line_pool is not None:
+            self._line_pool.shutdown()
+            self._line_pool = None
 
         self._report_progress()
         self._report_complete()
         self.elapsed_time = time.time() - start_time
+        if self._ledger is not None:
+            self._ledger.finish()
+
+        if self.output_cache is not None:
+            self.output_cache.trim()
+            self.output_cache_hits = sum(1 for result in self.file_results.values() if result.get("cached"))
+            self.output_cache_misses = sum(1 for result in self.file_results.values() if result.get("cached") is False)
+            Logger.log_process(
+                f"Output cache: {self.output_cache_hits} file(s) reused, {self.output_cache_misses} file(s) processed.",
+                os.path.dirname(self.target_files[0]) if self.target_files else self.folder_path,
+                self.log_rotate_bytes,
+            )
 
         if self.target_files:
             Logger.log_process(
                 "All single file tasks completed inside process pipeline.",
                 os.path.dirname(self.target_files[0]) if self.target_files else "",
+                self.log_rotate_bytes,
             )
         else:
-            Logger.log_process("All tasks completed inside process pipeline.", self.folder_path)
+            Logger.log_process("All tasks completed inside process pipeline.", self.folder_path, self.log_rotate_bytes)
+
+
+# Per-worker state of the parallel modes: the processor and its compiled rule lists stay warm across tasks.
+# Process workers run their tasks on one thread, so thread-local state serves both backends.
+_worker_state = threading.local()
+
+
+def _init_parallel_worker(options, rule_lists=None):
+    """
+    Initializes a worker process or thread. Thread workers receive the parent's compiled rule lists
+    and share them; process workers compile their own.
+    """
+    # Workers already run in parallel to each other, so they do not split files any further
+    _worker_state.processor = SubtitleProcessor(None, dict(options, intra_file_parallelism=0))
+    if rule_lists is None:
+        rule_lists = _worker_state.processor._compile_rule_lists()
+    _worker_state.rule_lists = rule_lists
+
+
+def _process_files_in_worker(files):
+    """
+    Processes (file_path, file_bytes) pairs in order on a worker and returns, per file, its logs as
+    plain lists, the changes to the successful, failed and processed line counters and its file result.
+    """
+    processor = _worker_state.processor
+    results = []
+    for file_path, file_bytes in files:
+        successful, failed, lines_processed = (
+            processor.successful_count,
+            processor.failed_count,
+            processor.total_lines_processed,
+        )
+        file_logs = processor._process_file(file_path, file_bytes, *_worker_state.rule_lists)
+        if file_logs is not None:
+            file_logs = tuple(list(logs) for logs in file_logs)
+        results.append(
+            (
+                file_logs,
+                processor.successful_count - successful,
+                processor.failed_count - failed,
+                processor.total_lines_processed - lines_processed,
+                processor.file_results.pop(file_path, None),
+            )
+        )
+    return results
+
+
+def _process_line_chunk_in_worker(first_line, lines):
+    """
+    Runs the line stages over one chunk of a file on a worker. Returns the chunk's first line
+    number, its lines (None where a line was dropped), its logs and whether anything changed.
+    """
+    processor = _worker_state.processor
+    document = SubtitleDocument(lines, first_line)
+    chunk_logs = TimestampedLogBuffer()
+    chunk_has_changes = processor._process_lines_batched(
+        document,
+        chunk_logs,
+        processor.options.get("detailed_subtitle_logs", 1),
+        *_worker_state.rule_lists,
+    )
+    return first_line, document.lines, list(chunk_logs), chunk_has_changes
@@ -0,0 +1,131 @@
+import numpy as np
+
+
+def format_timecodes(ms_values):
+    """Converts an array of milliseconds to SRT timecode strings (HH:MM:SS,mmm) in one pass."""
+    ms_values = np.maximum(np.asarray(ms_values, dtype=np.int64), 0)
+    hours, rem = np.divmod(ms_values, 3600000)
+    minutes, rem = np.divmod(rem, 60000)
+    seconds, millis = np.divmod(rem, 1000)
+    return [
+        f"{h:02d}:{m:02d}:{s:02d},{x:03d}"
+        for h, m, s, x in zip(hours.tolist(), minutes.tolist(), seconds.tolist(), millis.tolist())
+    ]
+
+
+class CueStore:
+    """
+    Columnar store of subtitle cues for the block-level operations.
+    Start and end times are int64 arrays; index and timecode strings are object arrays,
+    and each row points into the text column through text_ref so rows can be
+    filtered and reordered without touching the text lines themselves.
+    """
+
+    def __init__(self, index, start_ms, end_ms, start_str, end_str, texts, text_ref):
+        self.index = index
+        self.start_ms = start_ms
+        self.end_ms = end_ms
+        self.start_str = start_str
+        self.end_str = end_str
+        self.texts = texts
+        self.text_ref = text_ref
+
+    @classmethod
+    def from_blocks(cls, blocks):
+        """Builds a store from the block dictionaries returned by parse_srt_blocks."""
+        count = len(blocks)
+        return cls(
+            np.array([b["index"] for b in blocks], dtype=object),
+            np.fromiter((b["start_ms"] for b in blocks), dtype=np.int64, count=count),
+            np.fromiter((b["end_ms"] for b in blocks), dtype=np.int64, count=count),
+            np.array([b["start_str"] for b in blocks], dtype=object),
+            np.array([b["end_str"] for b in blocks], dtype=object),
+            [b["text_lines"] for b in blocks],
+            np.arange(count, dtype=np.int64),
+        )
+
+    def __len__(self):
+        return len(self.start_ms)
+
+    def text_lines(self, row):
+        return self.texts[self.text_ref[row]]
+
+    def select(self, rows):
+        """Keeps only the given rows (boolean mask or index array), in the given order."""
+        self.index = self.index[rows]
+        self.start_ms = self.start_ms[rows]
+        self.end_ms = self.end_ms[rows]
+        self.start_str = self.start_str[rows]
+        self.end_str = self.end_str[rows]
+        self.text_ref = self.text_ref[rows]
+
+    def insert(self, row, index, start_ms, end_ms, text_lines):
+        """Inserts a new cue before the given row; timecode strings are formatted from the times."""
+        start_str, end_str = format_timecodes([start_ms, end_ms])
+        self.texts.append(text_lines)
+        self.index = np.insert(self.index, row, index)
+        self.start_ms = np.insert(self.start_ms, row, start_ms)
+        self.end_ms = np.insert(self.end_ms, row, end_ms)
+        self.start_str = np.insert(self.start_str, row, start_str)
+        self.end_str = np.insert(self.end_str, row, end_str)
+        self.text_ref = np.insert(self.text_ref, row, len(self.texts) - 1)
+
+    def negative_mask(self):
+        """Rows whose start or end time is negative, including a written "-00:00:00,000"."""
+        mask = (self.start_ms < 0) | (self.end_ms < 0)
+        mask |= np.fromiter((s.startswith("-") for s in self.start_str), dtype=bool, count=len(self))
+        mask |= np.fromiter((s.startswith("-") for s in self.end_str), dtype=bool, count=len(self))
+        return mask
+
+    def empty_mask(self):
+        """Rows whose text lines are all blank."""
+        text_empty = np.fromiter(
+            (not any(line.strip() for line in text_lines) for text_lines in self.texts),
+            dtype=bool,
+            count=len(self.texts),
+        )
+        return text_empty[self.text_ref]
+
+    def duplicate_candidate_mask(self):
+        """Rows sharing their start and end times with another row; identical cues can only be among them."""
+        mask = np.zeros(len(self), dtype=bool)
+        if len(self) < 2:
+            return mask
+        order = np.lexsort((self.end_ms, self.start_ms))
+        same = (np.diff(self.start_ms[order]) == 0) & (np.diff(self.end_ms[order]) == 0)
+        mask[order[1:][same]] = True
+        mask[order[:-1][same]] = True
+        return mask
+
+    def overlap_fixes(self):
+        """
+        Returns (rows, new_end_ms) for the cues whose end time has to move back to
+        1 ms before the next cue's start, bounded by the cue's own start time.
+        """
+        if len(self) < 2:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        next_start = self.start_ms[1:]
+        new_end = np.maximum(self.start_ms[:-1], next_start - 1)
+        changed = (self.end_ms[:-1] >= next_start) & (self.end_ms[:-1] != new_end)
+        rows = np.flatnonzero(changed)
+        return rows, new_end[rows]
+
+    def first_gap(self, required_space):
+        """Returns the row after which the gap to the next cue is at least required_space ms, or -1."""
+        if len(self) < 2:
+            return -1
+        gaps = np.flatnonzero(self.start_ms[1:] - self.end_ms[:-1] >= required_space)
+        return int(gaps[0]) if len(gaps) else -1
+
+    def to_srt_lines(self):
+        """Serializes the cues as renumbered SRT lines with timecodes rebuilt from the times."""
+        srt_lines = []
+        start_codes = format_timecodes(self.start_ms)
+        end_codes = format_timecodes(self.end_ms)
+        for new_idx, (tc_s, tc_e, text_id) in enumerate(zip(start_codes, end_codes, self.text_ref.tolist()), start=1):
+            srt_lines.append(f"{new_idx}\n")
+            srt_lines.append(f"{tc_s} --> {tc_e}\n")
+            for t_line in self.texts[text_id]:
+                srt_lines.append(f"{t_line}\n")
+            srt_lines.append("\n")
+        return srt_lines
@@ -0,0 +1,137 @@
+import io
+import os
+import mmap
+import codecs
+import threading
+import contextlib
+import numpy as np
+
+# Files at least this large are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 1 << 20
+# Chunk size used when validating a multi-byte encoding incrementally
+DETECT_CHUNK_SIZE = 1 << 20
+# Number of detection results kept, keyed by content digest
+ENCODING_CACHE_SIZE = 256
+
+# Bytes that are undefined in cp1252; several of them are Persian letters in cp1256 (پ چ گ and ZWNJ)
+CP1252_UNDEFINED_BYTES = np.array([0x81, 0x8D, 0x8F, 0x90, 0x9D])
+
+_encoding_cache = {}
+_encoding_cache_lock = threading.Lock()
+
+
+def _decodes_as(data, encoding):
+    """Validates data against a codec chunk by chunk, without building the decoded text."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    view = memoryview(data)
+    try:
+        for offset in range(0, len(view), DETECT_CHUNK_SIZE):
+            decoder.decode(view[offset : offset + DETECT_CHUNK_SIZE])
+        decoder.decode(b"", True)
+        return True
+    except UnicodeError:
+        return False
+    finally:
+        view.release()
+
+
+def _single_byte_letters(encoding, letter_test):
+    """Returns a boolean table telling which byte values decode to a letter accepted by letter_test."""
+    return np.array(
+        [letter_test(bytes([value]).decode(encoding, "replace")) for value in range(256)], dtype=bool
+    )
+
+
+# Bytes that are ASCII letters, and bytes that are Arabic-script letters in cp1256
+ASCII_LETTER_BYTES = _single_byte_letters("ascii", lambda char: char.isascii() and char.isalpha())
+CP1256_ARABIC_LETTER_BYTES = _single_byte_letters("cp1256", lambda char: char.isalpha() and "\u0600" <= char <= "\u06ff")
+
+
+def _detect_single_byte_encoding(byte_values, histogram):
+    """
+    Tells cp1256 from cp1252. Legacy Persian releases are cp1256, so that is the default and cp1252 is
+    only chosen on positive evidence: no run of two or more high bytes that are all Arabic letters in
+    cp1256 (a Persian or Arabic word), and most runs of high bytes attached to ASCII letters, as
+    accented letters inside Latin words are. Persian words stand apart from ASCII letters, so a few
+    Persian lines among Latin text still decide for cp1256.
+    """
+    if histogram[CP1252_UNDEFINED_BYTES].any():
+        return "cp1256"
+    is_high = byte_values >= 0x80
+    # Start and end (exclusive) positions of the runs of high bytes
+    edges = np.flatnonzero(np.diff(is_high, prepend=False, append=False))
+    run_starts, run_ends = edges[0::2], edges[1::2]
+    if not len(run_starts):
+        return "cp1256"
+
+    non_arabic_counts = np.concatenate(([0], np.cumsum(is_high & ~CP1256_ARABIC_LETTER_BYTES[byte_values])))
+    arabic_runs = (run_ends - run_starts >= 2) & (non_arabic_counts[run_ends] == non_arabic_counts[run_starts])
+    if arabic_runs.any():
+        return "cp1256"
+
+    is_letter = ASCII_LETTER_BYTES[byte_values]
+    letter_before = (run_starts > 0) & is_letter[np.maximum(run_starts - 1, 0)]
+    letter_after = (run_ends < len(byte_values)) & is_letter[np.minimum(run_ends, len(byte_values) - 1)]
+    if np.count_nonzero(letter_before | letter_after) * 2 > len(run_starts):
+        return "cp1252"
+    return "cp1256"
+
+
+def detect_encoding(data):
+    """
+    Detects the encoding of raw subtitle bytes in a single pass over the data.
+    Data that is neither UTF-8 nor UTF-16 is read as a single-byte code page, which decodes any byte.
+    """
+    if data[:2] in (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE):
+        if _decodes_as(data, "utf-16"):
+            return "utf-16"
+    elif _decodes_as(data, "utf-8"):
+        # Files with a UTF-8 BOM are read as utf-8 as well, keeping U+FEFF on the first line
+        return "utf-8"
+
+    byte_values = np.frombuffer(data, dtype=np.uint8)
+    try:
+        histogram = np.bincount(byte_values, minlength=256)
+        # UTF-16 without a BOM: ASCII characters leave NUL bytes on every other position
+        if histogram[0] * 10 >= len(byte_values) and len(byte_values) % 2 == 0:
+            odd_nuls = int(np.count_nonzero(byte_values[1::2] == 0))
+            encoding = "utf-16-le" if odd_nuls * 2 >= histogram[0] else "utf-16-be"
+            if _decodes_as(data, encoding):
+                return encoding
+        return _detect_single_byte_encoding(byte_values, histogram)
+    finally:
+        del byte_values
+
+
+@contextlib.contextmanager
+def open_file_bytes(file_path):
+    """Yields the raw bytes of a file, memory-mapping large files; the mapping is closed on exit."""
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                yield data
+        else:
+            yield f.read()
+
+
+def detect_cached_encoding(data, digest):
+    """
+    Detects the encoding of a file's raw bytes, caching the result by the digest of the bytes, so
+    re-processing an unchanged file skips detection. The digest is the one the caller computed for
+    its own use (see content_digest), so the bytes are only hashed once.
+    """
+    with _encoding_cache_lock:
+        result = _encoding_cache.pop(digest, None)
+    if result is None:
+        result = detect_encoding(data)
+    with _encoding_cache_lock:
+        if len(_encoding_cache) >= ENCODING_CACHE_SIZE:
+            _encoding_cache.pop(next(iter(_encoding_cache)))
+        _encoding_cache[digest] = result
+    return result
+
+
+def decode_lines(data, encoding):
+    """Decodes raw bytes into lines in memory, with the universal newlines of a file opened in text mode."""
+    return io.StringIO(str(data, encoding), newline=None).readlines()
@@ -0,0 +1,116 @@
+import sys
+import hashlib
+import threading
+from collections import OrderedDict
+
+# Approximate memory of one cache entry besides its strings: key and value tuples and the LRU links
+ENTRY_OVERHEAD_BYTES = 200
+
+
+def options_fingerprint(options, ignored_keys=()):
+    """Digest of the option values, including the bypass, remove and replace lists, except ignored_keys."""
+    items = sorted((key, value) for key, value in options.items() if key not in ignored_keys)
+    return hashlib.blake2b(repr(items).encode(), digest_size=16).digest()
+
+
+def line_log_template(index, logs):
+    """
+    Turns the log entries of one line into a template that is independent of the line number, or
+    returns None if an entry cannot be re-addressed. Change records keep their (option, before, after)
+    part and messages the text after their "Line N" prefix.
+    """
+    prefix = f"Line {index}"
+    template = []
+    for message in logs:
+        if isinstance(message, str):
+            if not message.startswith(prefix):
+                return None
+            template.append(message[len(prefix) :])
+        else:
+            template.append(tuple(message[1:]))
+    return tuple(template)
+
+
+def line_logs_from_template(index, template):
+    return [
+        f"Line {index}{entry}" if isinstance(entry, str) else (index,) + entry
+        for entry in template
+    ]
+
+
+class LineCache:
+    """
+    Bounded LRU cache of processed subtitle text lines, shared by every run in the process.
+    Keys are (options fingerprint, original line); values are (processed line or None when the line
+    was removed, whether any stage changed it, log template). Thread safe for the thread backend.
+    """
+
+    def __init__(self, max_entries=0):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.memory_bytes = 0
+
+    def resize(self, max_entries):
+        with self._lock:
+            self.max_entries = max_entries
+            self._evict()
+
+    def get(self, fingerprint, line):
+        key = (fingerprint, line)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, fingerprint, line, result, changed, log_template):
+        if log_template is None or self.max_entries <= 0:
+            return
+        size = ENTRY_OVERHEAD_BYTES + sys.getsizeof(line)
+        if result is not None:
+            size += sys.getsizeof(result)
+        for entry in log_template:
+            size += sum(sys.getsizeof(part) for part in entry) if isinstance(entry, tuple) else sys.getsizeof(entry)
+        key = (fingerprint, line)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.memory_bytes -= previous[1]
+            self._entries[key] = ((result, changed, log_template), size)
+            self.memory_bytes += size
+            self._evict()
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.memory_bytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.memory_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "memory_bytes": self.memory_bytes,
+            }
+
+
+# Shared by every SubtitleProcessor in the process; sized by the line_cache_entries option of each run
+LINE_CACHE = LineCache()
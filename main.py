@@ -6,6 +6,7 @@ from tkinter import messagebox
 from PIL import ImageTk, Image
 from idlelib.tooltip import Hovertip
 import webbrowser
+import multiprocessing
 import arabic_reshaper
 from bidi.algorithm import get_display
 from tkinterdnd2 import TkinterDnD, DND_FILES
@@ -491,6 +492,11 @@ class PersianSubtitleToolkit(CustomTkinterDnD):
         # Load configuration, adjust dimensions, and state logic
         self.load_config()
 
+        # Compile the rules of the enabled options in the background while the user sets up the run
+        config = self.config_manager.load()
+        if config.get("prewarm_rules", 1):
+            start_rule_prewarm(config)
+
         self.after(100, lambda: self.start_btn.focus_set())
 
         # Safely reveal the window after states are established
@@ -1283,6 +1289,7 @@ class PersianSubtitleToolkit(CustomTkinterDnD):
     # --- Config Management Methods ---
     def load_config(self):
         config = self.config_manager.load()
+        self.log_rotate_bytes = log_rotate_bytes(config)
 
         w = int(config.get("window_width", 800))
         h = int(config.get("window_height", 600))
@@ -1648,6 +1655,7 @@ class PersianSubtitleToolkit(CustomTkinterDnD):
             "convert_ass_comments": self.chk_convert_ass_comments.get(),
             "delete_converted_temp_files": self.chk_delete_converted_temp_files.get(),
         }
+        config_data.update(self._get_engine_options())
         self.config_manager.save(config_data)
         self.write_log("Config saved.")
 
@@ -1832,15 +1840,15 @@ class PersianSubtitleToolkit(CustomTkinterDnD):
     def write_log(self, message):
         folder = self.path_entry.get()
         is_enabled = self.log_switch.get() == 1
-        Logger.log(message, folder, is_enabled)
+        Logger.log(message, folder, is_enabled, self.log_rotate_bytes)
 
     def toggle_logs(self):
         current_state = self.log_switch.get() == 1
         if current_state:
             messagebox.showinfo("Logs Enabled", "Logs will be saved in the selected folder under /Logs directory.")
-            Logger.log("Logging enabled by user.", self.path_entry.get(), True)
+            Logger.log("Logging enabled by user.", self.path_entry.get(), True, self.log_rotate_bytes)
         else:
-            Logger.log("Logging disabled by user.", self.path_entry.get(), True)
+            Logger.log("Logging disabled by user.", self.path_entry.get(), True, self.log_rotate_bytes)
         self.save_config()
 
     def change_theme(self):
@@ -1896,9 +1904,14 @@ class PersianSubtitleToolkit(CustomTkinterDnD):
 
         self.after(0, finish)
 
+    def _get_engine_options(self):
+        # Engine settings have no widgets, so the values saved in config.json are passed through unchanged
+        config = self.config_manager.load()
+        return {key: config.get(key, DEFAULT_CONFIG[key]) for key in ENGINE_OPTION_KEYS}
+
     def _get_run_options(self):
         # Helper to collect options dictionary
-        return {
+        run_options = {
             "remove_alignment_tags": self.chk_remove_alignment_tags.get(),
             "trim_spaces": self.chk_trim_spaces.get(),
             "remove_unneeded_spaces": self.chk_remove_unneeded_spaces.get(),
@@ -1944,6 +1957,8 @@ class PersianSubtitleToolkit(CustomTkinterDnD):
             "convert_ass_comments": self.chk_convert_ass_comments.get(),
             "delete_converted_temp_files": self.chk_delete_converted_temp_files.get(),
         }
+        run_options.update(self._get_engine_options())
+        return run_options
 
     def start_process_threaded(self):
         threading.Thread(target=self.start_process, daemon=True).start()
@@ -2221,5 +2236,7 @@ class PersianSubtitleToolkit(CustomTkinterDnD):
 
 
 if __name__ == "__main__":
+    # Parallel mode starts worker processes, which need this in frozen Windows builds
+    multiprocessing.freeze_support()
     app = PersianSubtitleToolkit()
     app.mainloop()
@@ -0,0 +1,106 @@
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+
+def content_digest(data):
+    """Hex digest of a file's bytes, keying the output cache, the run ledger and the encoding cache."""
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+def code_version(source_paths, fallback):
+    """
+    Digest of the source files that produce the outputs, so cached outputs are not reused after the
+    rules or stages change. Builds without readable sources (e.g. frozen ones) use the fallback version.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for source_path in source_paths:
+        try:
+            with open(source_path, "rb") as f:
+                digest.update(f.read())
+        except (OSError, TypeError):
+            digest.update(str(fallback).encode())
+    return digest.hexdigest()
+
+
+class OutputCache:
+    """
+    Content-addressed cache of processed subtitle files. An entry is keyed by the digest of the input
+    bytes and of the effective options and code version, and holds the output file (<key>.out) and its
+    logs and counters (<key>.json). Entries are written atomically, so several runs can share a folder.
+    Reading an entry refreshes its modification time, and trim() evicts the least recently used
+    entries once the folder grows past max_bytes.
+    """
+
+    def __init__(self, cache_dir, max_bytes):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def key(self, content_digest, settings_digest):
+        return hashlib.blake2b(f"{content_digest}:{settings_digest}".encode(), digest_size=20).hexdigest()
+
+    def _paths(self, key):
+        entry_dir = os.path.join(self.cache_dir, key[:2])
+        return os.path.join(entry_dir, f"{key}.out"), os.path.join(entry_dir, f"{key}.json")
+
+    def get(self, key):
+        """Returns (output path, metadata) of an entry, or None if it is not cached."""
+        output_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if not os.path.isfile(output_path):
+                return None
+            os.utime(meta_path)
+            os.utime(output_path)
+        except (OSError, ValueError):
+            return None
+        return output_path, meta
+
+    def put(self, key, produced_output_path, meta):
+        output_path, meta_path = self._paths(key)
+        entry_dir = os.path.dirname(output_path)
+        os.makedirs(entry_dir, exist_ok=True)
+
+        # The output goes in first: an entry only counts as cached once its metadata exists
+        fd, temp_path = tempfile.mkstemp(dir=entry_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copyfile(produced_output_path, temp_path)
+            os.replace(temp_path, output_path)
+            fd, temp_path = tempfile.mkstemp(dir=entry_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False)
+            os.replace(temp_path, meta_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def trim(self):
+        """Removes the least recently used entries until the cache fits in max_bytes."""
+        entries = {}
+        total_bytes = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                total_bytes += stat.st_size
+                entry = entries.setdefault(os.path.splitext(path)[0], [0, 0.0])
+                entry[0] += stat.st_size
+                entry[1] = max(entry[1], stat.st_mtime)
+
+        for entry_base, (entry_bytes, _) in sorted(entries.items(), key=lambda item: item[1][1]):
+            if total_bytes <= self.max_bytes:
+                break
+            for suffix in (".json", ".out"):
+                try:
+                    os.remove(entry_base + suffix)
+                except OSError:
+                    pass
+            total_bytes -= entry_bytes
@@ -0,0 +1,785 @@
+from rules import *
+from collections import deque
+import itertools
+import threading
+from re import _parser as sre_parse
+from re import _constants as sre_constants
+
+# Largest character range that is expanded into an explicit trigger set
+MAX_TRIGGER_RANGE = 1024
+
+# The regex module supports a few escapes that the standard library parser rejects.
+# They are rewritten into an equivalent "unknown" category, which never produces a guard.
+UNICODE_PROPERTY_RE = re.compile(r"\\[pP](?:\{[^}]*\}|[A-Za-z])")
+
+# Separator used to apply a rule list to many lines with one substitution per rule.
+# U+FFFF is a Unicode noncharacter, so it does not occur in subtitle text.
+BATCH_SENTINEL = "\uffff"
+BATCH_SENTINEL_CODE = ord(BATCH_SENTINEL)
+
+# Line anchors rewritten for the joined text: a line starts after the sentinel and ends before it
+BATCH_LINE_START = r"(?<![^\uffff])"
+BATCH_LINE_END = r"(?=\n?(?![^\uffff]))"
+BATCH_TEXT_END = r"(?![^\uffff])"
+BATCH_CHAR_GUARD = r"(?!\uffff)"
+
+# A rule runs over the whole joined text only if its literal occurs at least once per this many lines
+BATCH_MIN_LINE_SHARE = 8
+
+# Substitutions over joined text release the GIL while matching, so threads can share the compiled rules
+BATCH_CONCURRENT = True
+
+# Word tokens as seen by \b, and rule patterns that only consist of such whole words
+WORD_TOKEN_RE = re.compile(r"\w+")
+TOKEN_RULE_SHAPE_RE = re.compile(r"\\b(?:\w+|\(\w+(?:\|\w+)*\))(?: (?:\w+|\(\w+(?:\|\w+)*\)))*\\b")
+
+
+def _literal_char_set(items):
+    """Returns the explicit set of characters matched by a character class, or None if unbounded."""
+    chars = set()
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            chars.add(chr(av))
+        elif op is sre_constants.RANGE:
+            low, high = av
+            if high - low > MAX_TRIGGER_RANGE:
+                return None
+            chars.update(chr(code) for code in range(low, high + 1))
+        else:
+            # NEGATE and CATEGORY (\w, \s, \d) match too many characters to be useful
+            return None
+    return frozenset(chars) if chars else None
+
+
+REPEAT_OPCODES = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT, sre_constants.POSSESSIVE_REPEAT)
+
+# Categories that never match BATCH_SENTINEL (U+FFFF is not a word, space or digit character)
+SENTINEL_FREE_CATEGORIES = (
+    sre_constants.CATEGORY_WORD,
+    sre_constants.CATEGORY_SPACE,
+    sre_constants.CATEGORY_DIGIT,
+)
+
+
+def _collect_requirements(subpattern, literals, trigger_sets, spaceless=False):
+    """
+    Walks a parsed pattern and records what must be present in any text it can match.
+    Consecutive mandatory literals are merged into substrings, zero-width items (\\b, anchors and
+    lookarounds) do not interrupt them, and mandatory character classes are recorded as trigger sets
+    (at least one of the characters must be present).
+
+    With spaceless=True the walk describes the text with all spaces removed: space literals and
+    space-only repeats become transparent, so "\\b(P)( *)(S)" yields the single literal "PS".
+
+    Returns (exact, prefix, suffix) for the sequence: exact is the text it always matches (or None),
+    prefix and suffix are literals every match starts and ends with.
+    """
+    exact = ""
+    prefix = None
+    run = ""
+
+    for op, av in subpattern:
+        item_exact, item_prefix, item_suffix = _item_requirements(op, av, literals, trigger_sets, spaceless)
+        if item_exact is not None:
+            run += item_exact
+            if exact is not None:
+                exact += item_exact
+            continue
+
+        run += item_prefix
+        if run:
+            literals.append(run)
+        if exact is not None:
+            prefix = exact + item_prefix
+            exact = None
+        run = item_suffix
+
+    if run:
+        literals.append(run)
+    if exact is not None:
+        return exact, exact, exact
+    return None, prefix, run
+
+
+def _item_requirements(op, av, literals, trigger_sets, spaceless):
+    """Returns (exact, prefix, suffix) for a single parsed item, see _collect_requirements."""
+    if op is sre_constants.LITERAL:
+        char = chr(av)
+        return ("", "", "") if spaceless and char == " " else (char, char, char)
+
+    if op in (sre_constants.AT, sre_constants.ASSERT_NOT):
+        return "", "", ""
+
+    if op is sre_constants.ASSERT:
+        # Positive lookarounds still require their content to exist in the text
+        _, inner = av
+        _collect_requirements(inner, literals, trigger_sets, spaceless)
+        return "", "", ""
+
+    if op is sre_constants.SUBPATTERN:
+        _, add_flags, _, inner = av
+        if add_flags & sre_constants.SRE_FLAG_IGNORECASE:
+            return None, "", ""
+        return _collect_requirements(inner, literals, trigger_sets, spaceless)
+
+    if op is sre_constants.ATOMIC_GROUP:
+        return _collect_requirements(av, literals, trigger_sets, spaceless)
+
+    if op in REPEAT_OPCODES:
+        min_count, max_count, inner = av
+        if min_count == 0:
+            # An optional item adds no requirement, unless it can only match text that is ignored anyway
+            exact, _, _ = _collect_requirements(inner, [], [], spaceless)
+            return ("", "", "") if exact == "" else (None, "", "")
+        exact, prefix, suffix = _collect_requirements(inner, literals, trigger_sets, spaceless)
+        if exact is None:
+            return None, prefix, suffix
+        if min_count == max_count or not exact:
+            return exact * min_count, exact * min_count, exact * min_count
+        return None, exact * min_count, exact * min_count
+
+    if op is sre_constants.IN:
+        chars = _literal_char_set(av)
+        if chars and not spaceless:
+            trigger_sets.append(chars)
+        return None, "", ""
+
+    if op is sre_constants.BRANCH and not spaceless:
+        # Each alternative must contribute a trigger set, otherwise the branch is unconstrained
+        union = set()
+        for alternative in av[1]:
+            alt_literals, alt_triggers = [], []
+            _collect_requirements(alternative, alt_literals, alt_triggers)
+            candidates = [frozenset(literal[:1]) for literal in alt_literals] + alt_triggers
+            if not candidates:
+                union = None
+                break
+            union.update(min(candidates, key=len))
+        if union:
+            trigger_sets.append(frozenset(union))
+
+    # ANY, NOT_LITERAL, CATEGORY, BRANCH and group references add no literal requirement
+    return None, "", ""
+
+
+def analyze_rule_pattern(pattern):
+    """
+    Extracts a conservative guard for a compiled regex rule.
+    Returns (required_literal, spaceless_literal, trigger_chars); any of them may be None when nothing
+    can be proven. A rule can only match a text that contains required_literal, whose copy without
+    spaces contains spaceless_literal, and that contains at least one trigger char.
+    """
+    if getattr(pattern, "flags", 0) & re.IGNORECASE:
+        return None, None, None
+
+    pattern_text = UNICODE_PROPERTY_RE.sub(r"\\d", pattern.pattern).replace(r"\z", r"\Z")
+    try:
+        parsed = sre_parse.parse(pattern_text)
+    except Exception:
+        return None, None, None
+
+    if parsed.state.flags & sre_constants.SRE_FLAG_IGNORECASE:
+        return None, None, None
+
+    literals, trigger_sets = [], []
+    _collect_requirements(parsed, literals, trigger_sets)
+    spaceless_literals = []
+    _collect_requirements(parsed, spaceless_literals, [], spaceless=True)
+
+    required_literal = max(literals, key=len) if literals else None
+    spaceless_literal = max(spaceless_literals, key=len) if spaceless_literals else None
+    trigger_chars = min(trigger_sets, key=len) if trigger_sets else None
+
+    # A trigger set already implied by the literal adds no selectivity
+    if required_literal and trigger_chars and not trigger_chars.isdisjoint(required_literal):
+        trigger_chars = None
+
+    return required_literal, spaceless_literal, trigger_chars
+
+
+class AhoCorasick:
+    """
+    Trie-backed matcher that locates every occurrence of a fixed set of literal keys in one pass.
+    Characters that appear in no key reset the automaton without any dictionary lookups.
+    """
+
+    def __init__(self, keys):
+        goto = [{}]
+        outputs = [()]
+        for key in keys:
+            state = 0
+            for char in key:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto.append({})
+                    outputs.append(())
+                    goto[state][char] = next_state
+                state = next_state
+            outputs[state] += (key,)
+
+        # Breadth-first failure links; every state also reports the keys of its failure chain
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                if state:
+                    fail[next_state] = goto[fallback].get(char, 0)
+                outputs[next_state] += outputs[fail[next_state]]
+
+        self.goto = goto
+        self.fail = fail
+        self.outputs = outputs
+        self.alphabet = frozenset(char for key in keys for char in key)
+
+    def finditer(self, text):
+        """Yields (start, end, key) for every occurrence of every key, overlapping ones included."""
+        goto, fail, outputs, alphabet = self.goto, self.fail, self.outputs, self.alphabet
+        state = 0
+        for position, char in enumerate(text):
+            if char not in alphabet:
+                state = 0
+                continue
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for key in outputs[state]:
+                yield position + 1 - len(key), position + 1, key
+
+    def findall(self, text):
+        """Returns the set of keys that occur in text."""
+        goto, fail, outputs, alphabet = self.goto, self.fail, self.outputs, self.alphabet
+        found = set()
+        state = 0
+        for char in text:
+            if char not in alphabet:
+                state = 0
+                continue
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return found
+
+
+class RuleIndex:
+    """
+    Literal and trigger-character dispatch index for an ordered (pattern, replacement, is_regex) rule list.
+
+    Rules are applied in their original order, but a rule is only executed when its required literal
+    and trigger characters are present in the current text. Rule lists that only differ in the affix
+    words they join (such as the ZWNJ suffix rules) collapse into one trie: all required literals of
+    the list are located with a single Aho-Corasick pass, which is repeated only after a rule actually
+    modifies the text. Literals that span optional spaces are matched against the text without spaces.
+    """
+
+    def __init__(self, rule_list):
+        self.rules = []
+        self.unguarded_ids = []
+        self.literal_rule_ids = {}
+        self.spaceless_rule_ids = {}
+
+        self.rule_literals = []
+        self.batch_patterns = None
+
+        for rule_id, (rule_pattern, replace_with, is_regex) in enumerate(rule_list):
+            if is_regex:
+                required_literal, spaceless_literal, trigger_chars = analyze_rule_pattern(rule_pattern)
+            else:
+                required_literal, spaceless_literal, trigger_chars = rule_pattern, None, None
+
+            # The spaceless literal is only worth an extra scan when it is more selective
+            if not spaceless_literal or len(spaceless_literal) <= len(required_literal or ""):
+                spaceless_literal = None
+
+            self.rules.append((rule_pattern, replace_with, is_regex, trigger_chars))
+            self.rule_literals.append((required_literal, spaceless_literal))
+            self._index_rule(rule_id, rule_pattern, is_regex, required_literal, spaceless_literal)
+
+        self.literal_finder = AhoCorasick(self.literal_rule_ids) if self.literal_rule_ids else None
+        self.spaceless_finder = AhoCorasick(self.spaceless_rule_ids) if self.spaceless_rule_ids else None
+
+    def _index_rule(self, rule_id, rule_pattern, is_regex, required_literal, spaceless_literal):
+        """Registers the guard of a rule in the literal finders."""
+        if spaceless_literal:
+            self.spaceless_rule_ids.setdefault(spaceless_literal, []).append(rule_id)
+        elif required_literal:
+            self.literal_rule_ids.setdefault(required_literal, []).append(rule_id)
+        else:
+            self.unguarded_ids.append(rule_id)
+
+    def candidates(self, text):
+        """Returns the sorted ids of rules whose required literals occur in text."""
+        rule_ids = set(self.unguarded_ids)
+        if self.literal_finder is not None:
+            literal_rule_ids = self.literal_rule_ids
+            for literal in self.literal_finder.findall(text):
+                rule_ids.update(literal_rule_ids[literal])
+        if self.spaceless_finder is not None:
+            spaceless_rule_ids = self.spaceless_rule_ids
+            for literal in self.spaceless_finder.findall(text.replace(" ", "")):
+                rule_ids.update(spaceless_rule_ids[literal])
+        return sorted(rule_ids)
+
+    def apply(self, text, step_log=None):
+        """
+        Applies the indexed rules to text, producing the same result as apply_rule_set.
+        If step_log is a list, a (before, after) pair is appended for every rule that modifies the text.
+        """
+        rules = self.rules
+        next_rule_id = 0
+
+        while True:
+            present_chars = None
+            for rule_id in self.candidates(text):
+                if rule_id < next_rule_id:
+                    continue
+
+                rule_pattern, replace_with, is_regex, trigger_chars = rules[rule_id]
+                if trigger_chars is not None:
+                    if present_chars is None:
+                        present_chars = set(text)
+                    if trigger_chars.isdisjoint(present_chars):
+                        continue
+
+                if is_regex:
+                    new_text = rule_pattern.sub(replace_with, text)
+                else:
+                    new_text = text.replace(rule_pattern, replace_with)
+
+                if new_text != text:
+                    if step_log is not None:
+                        step_log.append((text, new_text))
+                    # Requirements of the remaining rules must be re-evaluated against the new text
+                    text = new_text
+                    next_rule_id = rule_id + 1
+                    break
+            else:
+                return text
+
+    def apply_lines(self, lines, step_logs=None):
+        """
+        Applies the indexed rules to every line, producing the same lines as apply() would one by one.
+
+        The lines are joined with BATCH_SENTINEL and every rule whose literals occur anywhere in the
+        joined text runs once over all of them. Rules that cannot be rewritten to stay inside a line
+        (see _batch_pattern) are applied line by line instead. If step_logs is a list of lists, one per
+        line, a (before, after) pair is appended to the list of every line a rule modifies.
+        """
+        if not lines:
+            return []
+
+        text = BATCH_SENTINEL.join(lines)
+        if text.count(BATCH_SENTINEL) != len(lines) - 1:
+            # A line already contains the separator, so the joined text cannot be split back safely
+            if step_logs is None:
+                return [self.apply(line) for line in lines]
+            return [self.apply(line, line_steps) for line, line_steps in zip(lines, step_logs)]
+
+        self.compile_batch_patterns()
+
+        line_count = len(lines)
+        present_chars = None
+        spaceless_text = None
+        for rule_id, (rule_pattern, replace_with, is_regex, trigger_chars) in enumerate(self.rules):
+            required_literal, spaceless_literal = self.rule_literals[rule_id]
+            if required_literal and required_literal not in text:
+                continue
+            if spaceless_literal:
+                if spaceless_text is None:
+                    spaceless_text = text.replace(" ", "")
+                if spaceless_literal not in spaceless_text:
+                    continue
+            if trigger_chars is not None:
+                if present_chars is None:
+                    present_chars = set(text)
+                if trigger_chars.isdisjoint(present_chars):
+                    continue
+
+            batch_pattern = self.batch_patterns[rule_id]
+            if not is_regex:
+                new_text = text.replace(rule_pattern, replace_with)
+            elif batch_pattern is not None and (
+                self._literal_count(text, spaceless_text, rule_id) * BATCH_MIN_LINE_SHARE >= line_count
+            ):
+                new_text = batch_pattern.sub(replace_with, text, concurrent=BATCH_CONCURRENT)
+            else:
+                # Rare literals: probing only the lines that contain them beats scanning the whole text
+                new_text = self._apply_to_literal_lines(text, rule_id)
+
+            if new_text != text:
+                if step_logs is not None:
+                    changed_lines = zip(text.split(BATCH_SENTINEL), new_text.split(BATCH_SENTINEL))
+                    for line_steps, (before, after) in zip(step_logs, changed_lines):
+                        if before != after:
+                            line_steps.append((before, after))
+                text = new_text
+                present_chars = None
+                spaceless_text = None
+
+        return text.split(BATCH_SENTINEL)
+
+    def compile_patterns(self, batch=False):
+        """Compiles the rule patterns ahead of their first use, and the batch patterns of apply_lines if batch."""
+        for rule_pattern, _, _, _ in self.rules:
+            if isinstance(rule_pattern, LazyPattern):
+                rule_pattern.compile()
+        if batch:
+            self.compile_batch_patterns()
+
+    def compile_batch_patterns(self):
+        if self.batch_patterns is None:
+            self.batch_patterns = [
+                _batch_pattern(rule_pattern, replace_with) if is_regex else None
+                for rule_pattern, replace_with, is_regex, _ in self.rules
+            ]
+
+    def _literal_count(self, text, spaceless_text, rule_id):
+        """Returns how often the guard literal of a rule occurs in text, or len(text) if it has none."""
+        required_literal, spaceless_literal = self.rule_literals[rule_id]
+        if spaceless_literal:
+            return spaceless_text.count(spaceless_literal)
+        if required_literal:
+            return text.count(required_literal)
+        return len(text)
+
+    def _apply_to_literal_lines(self, text, rule_id):
+        """Applies a rule only to the lines of a joined text that contain its required literal."""
+        rule_pattern, replace_with, _, _ = self.rules[rule_id]
+        required_literal, spaceless_literal = self.rule_literals[rule_id]
+        if not required_literal:
+            return BATCH_SENTINEL.join(
+                rule_pattern.sub(replace_with, line, concurrent=BATCH_CONCURRENT)
+                if not spaceless_literal or spaceless_literal in line.replace(" ", "")
+                else line
+                for line in text.split(BATCH_SENTINEL)
+            )
+
+        pieces = []
+        copied_until = 0
+        position = text.find(required_literal)
+        while position != -1:
+            line_start = text.rfind(BATCH_SENTINEL, 0, position) + 1
+            line_end = text.find(BATCH_SENTINEL, position)
+            if line_end == -1:
+                line_end = len(text)
+            pieces.append(text[copied_until:line_start])
+            pieces.append(rule_pattern.sub(replace_with, text[line_start:line_end], concurrent=BATCH_CONCURRENT))
+            copied_until = line_end
+            position = text.find(required_literal, line_end)
+        pieces.append(text[copied_until:])
+        return "".join(pieces)
+
+
+def _class_end(pattern_text, start):
+    """Returns the index just past the character class starting at start, or None if it is not closed."""
+    position = start + 1
+    if pattern_text.startswith("^", position):
+        position += 1
+    if pattern_text.startswith("]", position):
+        position += 1
+    while position < len(pattern_text):
+        char = pattern_text[position]
+        if char == "\\":
+            position += 2
+        elif char == "]":
+            return position + 1
+        else:
+            position += 1
+    return None
+
+
+def _rewrite_for_batch(pattern_text):
+    """
+    Rewrites a pattern so that it matches inside one line of a BATCH_SENTINEL-joined text exactly where
+    the original matches inside the line on its own. Line anchors become sentinel lookarounds and every
+    item that could consume the sentinel (".", negated classes, \\S, \\W, \\D, \\p{..}) is guarded.
+    Returns None for constructs that cannot be rewritten.
+    """
+    guard = lambda item: f"(?:{BATCH_CHAR_GUARD}{item})"
+    rewritten = []
+    position = 0
+    while position < len(pattern_text):
+        char = pattern_text[position]
+        if char == "\\":
+            escape = pattern_text[position + 1 : position + 2]
+            end = position + 2
+            if escape in ("p", "P", "N", "x") and pattern_text.startswith("{", end):
+                end = pattern_text.find("}", end) + 1
+                if end == 0:
+                    return None
+            elif escape in ("p", "P"):
+                end += 1
+
+            if escape == "A":
+                rewritten.append(BATCH_LINE_START)
+            elif escape in ("Z", "z"):
+                rewritten.append(BATCH_TEXT_END)
+            elif escape in ("S", "W", "D", "p", "P"):
+                rewritten.append(guard(pattern_text[position:end]))
+            elif escape in ("G", "X", "K", "m", "M", ""):
+                return None
+            else:
+                rewritten.append(pattern_text[position:end])
+            position = end
+        elif char == "[":
+            end = _class_end(pattern_text, position)
+            if end is None:
+                return None
+            char_class = pattern_text[position:end]
+            if "[:" in char_class:
+                return None
+            if char_class.startswith("[^") or any(f"\\{escape}" in char_class for escape in "SWDpP"):
+                char_class = guard(char_class)
+            rewritten.append(char_class)
+            position = end
+        elif char == "(" and pattern_text.startswith("(?#", position):
+            return None
+        else:
+            if char == ".":
+                rewritten.append(guard(char))
+            elif char == "^":
+                rewritten.append(BATCH_LINE_START)
+            elif char == "$":
+                rewritten.append(BATCH_LINE_END)
+            else:
+                rewritten.append(char)
+            position += 1
+    return "".join(rewritten)
+
+
+def _item_may_match_sentinel(op, av):
+    """Returns whether a single-character item of a parsed pattern can consume BATCH_SENTINEL."""
+    if op is sre_constants.LITERAL:
+        return av == BATCH_SENTINEL_CODE
+    if op is sre_constants.NOT_LITERAL:
+        return av != BATCH_SENTINEL_CODE
+    if op is sre_constants.CATEGORY:
+        return av not in SENTINEL_FREE_CATEGORIES
+    if op is sre_constants.IN:
+        negated = False
+        member = False
+        for item_op, item_av in av:
+            if item_op is sre_constants.NEGATE:
+                negated = True
+            elif item_op is sre_constants.RANGE:
+                member = member or item_av[0] <= BATCH_SENTINEL_CODE <= item_av[1]
+            elif item_op in (sre_constants.LITERAL, sre_constants.CATEGORY):
+                member = member or _item_may_match_sentinel(item_op, item_av)
+            else:
+                return True
+        return member != negated
+    return True
+
+
+def _is_batch_safe(subpattern):
+    """Checks that no item of a parsed pattern can consume BATCH_SENTINEL or depends on line anchors."""
+    guarded = False
+    for op, av in subpattern:
+        is_guard = (
+            op is sre_constants.ASSERT_NOT
+            and av[0] == 1
+            and list(av[1]) == [(sre_constants.LITERAL, BATCH_SENTINEL_CODE)]
+        )
+        was_guarded, guarded = guarded, is_guard
+        if is_guard:
+            continue
+
+        if op in (sre_constants.LITERAL, sre_constants.NOT_LITERAL, sre_constants.CATEGORY, sre_constants.IN, sre_constants.ANY):
+            if not was_guarded and (op is sre_constants.ANY or _item_may_match_sentinel(op, av)):
+                return False
+        elif op is sre_constants.AT:
+            if av not in (sre_constants.AT_BOUNDARY, sre_constants.AT_NON_BOUNDARY):
+                return False
+        elif op is sre_constants.SUBPATTERN:
+            if not _is_batch_safe(av[3]):
+                return False
+        elif op in REPEAT_OPCODES:
+            if not _is_batch_safe(av[2]):
+                return False
+        elif op is sre_constants.ATOMIC_GROUP:
+            if not _is_batch_safe(av):
+                return False
+        elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            if not _is_batch_safe(av[1]):
+                return False
+        elif op is sre_constants.BRANCH:
+            if not all(_is_batch_safe(alternative) for alternative in av[1]):
+                return False
+        elif op is sre_constants.GROUPREF_EXISTS:
+            _, yes_branch, no_branch = av
+            if not _is_batch_safe(yes_branch) or (no_branch is not None and not _is_batch_safe(no_branch)):
+                return False
+        elif op is not sre_constants.GROUPREF:
+            return False
+    return True
+
+
+def _batch_pattern(pattern, replace_with):
+    """
+    Returns a variant of a regex rule for BATCH_SENTINEL-joined lines, or None if the rule must run
+    line by line (callable replacements, multiline or verbose patterns, unsupported constructs).
+    """
+    if callable(replace_with) or pattern.flags & (re.MULTILINE | re.VERBOSE):
+        return None
+
+    # Anchored rules are only tried at line starts, which is cheaper than probing every position
+    if pattern.pattern.startswith(("^", "\\A")):
+        return None
+
+    pattern_text = _rewrite_for_batch(pattern.pattern)
+    if pattern_text is None:
+        return None
+
+    # The standard library parser validates the rewritten pattern; properties are checked as "."
+    try:
+        parsed = sre_parse.parse(UNICODE_PROPERTY_RE.sub(".", pattern_text))
+    except Exception:
+        return None
+    if parsed.state.flags & (sre_constants.SRE_FLAG_MULTILINE | sre_constants.SRE_FLAG_VERBOSE):
+        return None
+    if not _is_batch_safe(parsed):
+        return None
+
+    try:
+        return re.compile(pattern_text, pattern.flags)
+    except Exception:
+        return None
+
+
+class TokenRuleIndex(RuleIndex):
+    """
+    Word-token dispatch index for dictionary-style rules such as r"\\bماله (من|تو)\\b".
+
+    A rule made only of whole words separated by single spaces matches exactly where the same words
+    appear as consecutive word tokens, so it is keyed by its word tuples in a hash map built once.
+    Each line is then tokenized in a single linear scan and looked up by (word, next word, ...) runs.
+    Rules that cannot be expressed as a token lookup fall back to the literal guards of RuleIndex.
+    """
+
+    def __init__(self, rule_list):
+        self.token_rule_ids = {}
+        super().__init__(rule_list)
+        self.token_run_lengths = sorted({len(words) for words in self.token_rule_ids})
+
+    def _index_rule(self, rule_id, rule_pattern, is_regex, required_literal, spaceless_literal):
+        word_choices = _token_rule_words(rule_pattern) if is_regex else None
+        if word_choices is None:
+            super()._index_rule(rule_id, rule_pattern, is_regex, required_literal, spaceless_literal)
+            return
+
+        for words in itertools.product(*word_choices):
+            self.token_rule_ids.setdefault(words, []).append(rule_id)
+
+    def candidates(self, text):
+        rule_ids = set(super().candidates(text))
+        token_rule_ids = self.token_rule_ids
+        if not token_rule_ids:
+            return sorted(rule_ids)
+
+        tokens = [(match.group(), match.start(), match.end()) for match in WORD_TOKEN_RE.finditer(text)]
+        longest_run = self.token_run_lengths[-1]
+        for first in range(len(tokens)):
+            words = []
+            for position in range(first, min(first + longest_run, len(tokens))):
+                word, start, _ = tokens[position]
+                if words and text[tokens[position - 1][2] : start] != " ":
+                    break
+                words.append(word)
+                found = token_rule_ids.get(tuple(words))
+                if found:
+                    rule_ids.update(found)
+        return sorted(rule_ids)
+
+
+def _token_rule_words(pattern):
+    """
+    Returns the per-position word alternatives of a r"\\bword (alt|alt) word\\b" rule,
+    or None if the pattern is not a plain sequence of whole words.
+    """
+    if pattern.flags & re.IGNORECASE or not TOKEN_RULE_SHAPE_RE.fullmatch(pattern.pattern):
+        return None
+    return [part.strip("()").split("|") for part in pattern.pattern[2:-2].split(" ")]
+
+
+class LazyRuleIndex:
+    """
+    Builds a rule index the first time a stage uses it, so a run only analyzes and compiles the
+    rule lists of the options it enables. Methods of the built index are cached on the proxy.
+    """
+
+    def __init__(self, index_class, rule_list):
+        self._index_class = index_class
+        self._rule_list = rule_list
+        self._index = None
+        self._lock = threading.Lock()
+
+    def build(self):
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    self._index = self._index_class(self._rule_list)
+        return self._index
+
+    def __getattr__(self, name):
+        value = getattr(self.build(), name)
+        if callable(value):
+            setattr(self, name, value)
+        return value
+
+
+# Dispatch indexes for every ordered rule list used by the line stages, built on first use
+UNNEEDED_SPACES_INDEX = LazyRuleIndex(
+    RuleIndex, [(pattern, replacement, True) for pattern, replacement, _ in unneeded_rules]
+)
+ABBREVIATION_INDEX = LazyRuleIndex(RuleIndex, abbreviation_rules)
+COMMA_INDEX = LazyRuleIndex(RuleIndex, comma_rules_list)
+EXCLAMATION_INDEX = LazyRuleIndex(RuleIndex, exclamation_rules_list)
+PARENTHESES_INDEX = LazyRuleIndex(RuleIndex, parentheses_rules_list)
+QUESTION_MARK_INDEX = LazyRuleIndex(RuleIndex, question_mark_rules_list)
+DOUBLE_QUOTES_INDEX = LazyRuleIndex(RuleIndex, double_quotes_rules_list)
+DASH_INDEX = LazyRuleIndex(RuleIndex, dash_rules_list)
+COMMENTS_INDEX = LazyRuleIndex(RuleIndex, comments_rules_list)
+DIALOG_HYPHEN_INDEX = LazyRuleIndex(RuleIndex, dialog_hyphen_fix_list)
+MISPLACED_CHARS_INDEX = LazyRuleIndex(RuleIndex, misplaced_chars_rules)
+HEXRE_INDEX = LazyRuleIndex(TokenRuleIndex, hexre_rules_list)
+SPACE_TO_INVISIBLE_SPACE_INDEX = LazyRuleIndex(RuleIndex, space_to_invisible_space_rules)
+
+# Rule indexes of each option, in the order the line stages use them
+OPTION_RULE_INDEXES = {
+    "fix_misplaced_chars": (MISPLACED_CHARS_INDEX,),
+    "fix_abbreviations": (ABBREVIATION_INDEX,),
+    "comma_fixes": (COMMA_INDEX,),
+    "exclamation_fixes": (EXCLAMATION_INDEX,),
+    "parentheses_fixes": (PARENTHESES_INDEX,),
+    "question_mark_fixes": (QUESTION_MARK_INDEX,),
+    "double_quotes_fixes": (DOUBLE_QUOTES_INDEX,),
+    "dash_fixes": (DASH_INDEX,),
+    "comments_fixes": (COMMENTS_INDEX,),
+    "dialog_hyphen_fix": (DIALOG_HYPHEN_INDEX,),
+    "remove_unneeded_spaces": (UNNEEDED_SPACES_INDEX,),
+    "space_to_invisible_space": (SPACE_TO_INVISIBLE_SPACE_INDEX,),
+    "hexre_fixes": (HEXRE_INDEX,),
+}
+
+
+def prewarm_rules(options):
+    """Builds the rule indexes of the options enabled in options and compiles their patterns."""
+    batch = bool(options.get("batched_stage_execution", 0))
+    for option_key, indexes in OPTION_RULE_INDEXES.items():
+        if options.get(option_key, 1):
+            for index in indexes:
+                index.build().compile_patterns(batch)
+
+
+def start_rule_prewarm(options):
+    """Runs prewarm_rules on a background thread, e.g. while the GUI waits for the user; returns the thread."""
+    thread = threading.Thread(target=prewarm_rules, args=(dict(options),), daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,147 @@
+import os
+import time
+import sqlite3
+import datetime
+import threading
+
+# File states recorded in the ledger
+STATE_PENDING = "pending"
+STATE_IN_PROGRESS = "in_progress"
+STATE_DONE = "done"
+STATE_FAILED = "failed"
+
+# State changes are committed together once this many are queued or this many seconds have passed
+LEDGER_BATCH_SIZE = 256
+LEDGER_BATCH_SECONDS = 2.0
+
+LEDGER_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    root TEXT NOT NULL,
+    options_digest TEXT NOT NULL,
+    status TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    finished_at TEXT
+);
+CREATE TABLE IF NOT EXISTS files (
+    run_id INTEGER NOT NULL,
+    file_path TEXT NOT NULL,
+    state TEXT NOT NULL,
+    input_digest TEXT,
+    output_path TEXT,
+    error TEXT,
+    updated_at TEXT,
+    PRIMARY KEY (run_id, file_path)
+);
+CREATE INDEX IF NOT EXISTS files_state ON files (run_id, state);
+"""
+
+
+def _now():
+    return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+class RunLedger:
+    """
+    SQLite job ledger of batch runs: every file of a run with its state, input digest, output path
+    and error. A run stays "running" until finish() is called, so a run that died can be resumed:
+    its completed files are skipped and the rest are processed again. State changes are queued and
+    committed in batches, so the ledger costs one transaction per LEDGER_BATCH_SIZE files.
+    """
+
+    def __init__(self, ledger_path):
+        os.makedirs(os.path.dirname(ledger_path), exist_ok=True)
+        # The writer stage of the pipelined mode records saved files from its own thread
+        self._connection = sqlite3.connect(ledger_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(LEDGER_SCHEMA)
+        self._lock = threading.Lock()
+        self._pending_updates = []
+        self._last_commit = time.monotonic()
+        self.run_id = None
+
+    def start_run(self, root, options_digest, file_paths, resume=False):
+        """
+        Starts a run over file_paths, or with resume continues the last unfinished run of the same root
+        and options. Returns (run_id, resumed, completed file paths to skip).
+        """
+        with self._lock, self._connection:
+            row = None
+            if resume:
+                row = self._connection.execute(
+                    "SELECT id FROM runs WHERE root = ? AND options_digest = ? AND status = 'running' "
+                    "ORDER BY id DESC LIMIT 1",
+                    (root, options_digest),
+                ).fetchone()
+            if row is not None:
+                self.run_id = row[0]
+                completed = {
+                    file_path
+                    for (file_path,) in self._connection.execute(
+                        "SELECT file_path FROM files WHERE run_id = ? AND state = ?", (self.run_id, STATE_DONE)
+                    )
+                }
+            else:
+                self.run_id = self._connection.execute(
+                    "INSERT INTO runs (root, options_digest, status, started_at) VALUES (?, ?, 'running', ?)",
+                    (root, options_digest, _now()),
+                ).lastrowid
+                completed = set()
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO files (run_id, file_path, state, updated_at) VALUES (?, ?, ?, ?)",
+                [(self.run_id, file_path, STATE_PENDING, _now()) for file_path in file_paths],
+            )
+        return self.run_id, row is not None, completed
+
+    def mark_started(self, file_path):
+        self._queue((STATE_IN_PROGRESS, None, None, None, file_path))
+
+    def record(self, file_path, result):
+        """Queues the outcome of a file, as kept in SubtitleProcessor.file_results."""
+        state = STATE_DONE if result.get("status") == "succeeded" else STATE_FAILED
+        self._queue((state, result.get("input_digest"), result.get("output"), result.get("error"), file_path))
+
+    def _queue(self, update):
+        with self._lock:
+            self._pending_updates.append(update)
+            if (
+                len(self._pending_updates) >= LEDGER_BATCH_SIZE
+                or time.monotonic() - self._last_commit >= LEDGER_BATCH_SECONDS
+            ):
+                self._commit()
+
+    def _commit(self):
+        if self._pending_updates:
+            updated_at = _now()
+            with self._connection:
+                self._connection.executemany(
+                    "UPDATE files SET state = ?, input_digest = COALESCE(?, input_digest), output_path = ?, "
+                    "error = ?, updated_at = ? WHERE run_id = ? AND file_path = ?",
+                    [update[:4] + (updated_at, self.run_id, update[4]) for update in self._pending_updates],
+                )
+            self._pending_updates = []
+        self._last_commit = time.monotonic()
+
+    def finish(self):
+        """Marks the run as completed; it will not be resumed."""
+        with self._lock:
+            self._commit()
+            with self._connection:
+                self._connection.execute(
+                    "UPDATE runs SET status = 'completed', finished_at = ? WHERE id = ?", (_now(), self.run_id)
+                )
+
+    def close(self):
+        """Commits the queued state changes and closes the ledger; an unfinished run stays resumable."""
+        with self._lock:
+            self._commit()
+            self._connection.close()
+
+    def failed_files(self, run_id=None):
+        """Returns (file_path, error) of the failed files of a run, by default the current one."""
+        with self._lock:
+            return self._connection.execute(
+                "SELECT file_path, error FROM files WHERE run_id = ? AND state = ? ORDER BY file_path",
+                (run_id or self.run_id, STATE_FAILED),
+            ).fetchall()
@@ -0,0 +1,111 @@
+import os
+from re import _parser as sre_parse
+
+import pytest
+
+import rule_engine
+from core import *
+from rule_engine import _batch_pattern, _is_batch_safe, _rewrite_for_batch
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _corpus_lines():
+    with open(os.path.join(FIXTURES, "corpus.srt"), encoding="utf-8", newline="") as f:
+        return f.readlines()
+
+
+def _rule_lines(rule_list):
+    """The corpus lines plus lines carrying the literal of each rule, so that rare rules fire as well."""
+    lines = _corpus_lines()
+    for rule_pattern, _, is_regex in rule_list:
+        literal = rule_pattern if not is_regex else analyze_rule_pattern(rule_pattern)[0]
+        if literal:
+            lines.append(f"ببین {literal} !\n")
+    return lines
+
+
+@pytest.mark.parametrize("option_key", sorted(OPTION_RULE_INDEXES))
+@pytest.mark.parametrize("min_line_share", [rule_engine.BATCH_MIN_LINE_SHARE, 10**9])
+def test_apply_lines_matches_apply(monkeypatch, option_key, min_line_share):
+    # A huge line share makes every batchable rule run over the whole joined text
+    monkeypatch.setattr(rule_engine, "BATCH_MIN_LINE_SHARE", min_line_share)
+    for index in OPTION_RULE_INDEXES[option_key]:
+        built = index.build()
+        lines = _rule_lines(index._rule_list)
+        step_logs = [[] for _ in lines]
+        expected_steps = [[] for _ in lines]
+        expected = [built.apply(line, steps) for line, steps in zip(lines, expected_steps)]
+        assert built.apply_lines(lines, step_logs) == expected
+        assert step_logs == expected_steps
+
+
+@pytest.mark.parametrize("option_key", sorted(OPTION_RULE_INDEXES))
+def test_batch_patterns_stay_inside_lines(option_key):
+    for index in OPTION_RULE_INDEXES[option_key]:
+        built = index.build()
+        built.compile_batch_patterns()
+        lines = _rule_lines(index._rule_list)
+        joined = BATCH_SENTINEL.join(lines)
+        for (rule_pattern, replace_with, _, _), batch_pattern in zip(built.rules, built.batch_patterns):
+            if batch_pattern is not None:
+                expected = [rule_pattern.sub(replace_with, line) for line in lines]
+                assert batch_pattern.sub(replace_with, joined).split(BATCH_SENTINEL) == expected, rule_pattern.pattern
+
+
+@pytest.mark.parametrize(
+    "pattern_text, lines",
+    [
+        (r"a.b", ["xa", "bx", "axb"]),
+        (r"a[^c]b", ["a", "b", "adb"]),
+        (r"a\Sb", ["a", "b x", "a-b"]),
+        (r"\s+$", ["a  \n", "b \n", "c"]),
+        (r"(?:x|y\W)z", ["y", "z", "y!z"]),
+    ],
+)
+def test_rewritten_patterns_match_per_line(pattern_text, lines):
+    pattern = re.compile(pattern_text)
+    batch_pattern = _batch_pattern(pattern, "_")
+    assert batch_pattern is not None
+    assert not _is_batch_safe(sre_parse.parse(pattern_text))
+    joined = BATCH_SENTINEL.join(lines)
+    assert batch_pattern.sub("_", joined).split(BATCH_SENTINEL) == [pattern.sub("_", line) for line in lines]
+
+
+@pytest.mark.parametrize("pattern_text", [r"a(?#comment)b", r"\Gab", r"a[[:alpha:]]b", r"a\Kb"])
+def test_unsupported_constructs_are_not_rewritten(pattern_text):
+    assert _rewrite_for_batch(pattern_text) is None
+
+
+def test_unsafe_items_are_detected():
+    assert not _is_batch_safe(sre_parse.parse(r"a.b"))
+    assert not _is_batch_safe(sre_parse.parse(r"a[^c]b"))
+    assert _is_batch_safe(sre_parse.parse(_rewrite_for_batch(r"a[^c]b")))
+    assert _is_batch_safe(sre_parse.parse(r"\bab\w+"))
+
+
+@pytest.mark.parametrize("detailed_logs_enabled", [1, 0])
+def test_batched_stages_match_reference_loop(detailed_logs_enabled):
+    lines = _corpus_lines()
+    options = dict(
+        DEFAULT_CONFIG,
+        line_cache_entries=0,
+        detailed_subtitle_logs=detailed_logs_enabled,
+        bypass_list="Really",
+        remove_list="example.com",
+        replace_list="رضا",
+    )
+    processor = SubtitleProcessor(FIXTURES, options)
+    rule_lists = processor._compile_rule_lists()
+
+    reference = SubtitleDocument(list(lines))
+    line_record = LineRecord([])
+    processor._process_lines(enumerate(lines, start=1), reference, line_record, *rule_lists)
+
+    batched = SubtitleDocument(list(lines))
+    batched_logs = []
+    changed = processor._process_lines_batched(batched, batched_logs, detailed_logs_enabled, *rule_lists)
+
+    assert batched.lines == reference.lines
+    assert batched_logs == line_record.logs
+    assert changed == line_record.changed
@@ -0,0 +1,35 @@
+import os
+
+import pytest
+
+from encoding_detector import detect_encoding
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+@pytest.mark.parametrize(
+    "file_name, expected",
+    [
+        # Latin lines with a few Persian words must not be read as cp1252 ("ÓáÇã" instead of "سلام")
+        ("mixed_script.cp1256.srt", "cp1256"),
+        ("persian.cp1256.srt", "cp1256"),
+        ("german.cp1252.srt", "cp1252"),
+        ("french.cp1252.srt", "cp1252"),
+    ],
+)
+def test_single_byte_encoding(file_name, expected):
+    with open(os.path.join(FIXTURES, file_name), "rb") as f:
+        data = f.read()
+    assert detect_encoding(data) == expected
+
+
+def test_mixed_script_decodes_persian_words():
+    with open(os.path.join(FIXTURES, "mixed_script.cp1256.srt"), "rb") as f:
+        data = f.read()
+    text = data.decode(detect_encoding(data))
+    assert "سلام" in text and "علي" in text
+
+
+def test_utf8_is_preferred():
+    data = "Grüße aus München\nسلام\n".encode("utf-8")
+    assert detect_encoding(data) == "utf-8"
@@ -0,0 +1,110 @@
+import os
+import random
+
+import pytest
+
+from core import *
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+WORDS = [
+    "example.com",
+    "Subtitle by",
+    "Really",
+    "the end",
+    "سلام",
+    "علی",
+    "کجا",
+    "ميري",
+    "آهنگ",
+    "ترجمه",
+    "خواهم",
+    "رضا",
+    "Mr. Smith",
+    "KISS",
+    "straße",
+    "istanbul",
+    "موسیقی",
+    "- آره",
+]
+
+# Spellings that only the flexible patterns see as the words above
+VARIANT_LINES = [
+    "Visit EXAMPLE . COM now\n",
+    "s u b t i t l e    B Y me\n",
+    "س‌ل‌ا‌م دوست\n",
+    "عـلـي اومد\n",
+    "كجا؟\n",
+    "ميرى برو\n",
+    "اهنگ جدید\n",
+    "ترجمـه_از تیم\n",
+    "می خواهـم\n",
+    "MR SMITH\n",
+    "KISS me\n",
+    "STRASSE straſe STRAẞE\n",
+    "İstanbul ıstanbul\n",
+    "the–end\n",
+    "آره - آره\n",
+]
+
+
+def _corpus_lines():
+    with open(os.path.join(FIXTURES, "corpus.srt"), encoding="utf-8", newline="") as f:
+        return f.readlines()
+
+
+def _word_list(words):
+    return FlexibleWordList([(word, build_flexible_regex(word)) for word in words if build_flexible_regex(word)])
+
+
+def _plain_first_match(word_regexes, text):
+    return next((word for word, regex in word_regexes if regex.search(text)), None)
+
+
+def _plain_remove_matches(word_regexes, text):
+    steps = []
+    for word, regex in word_regexes:
+        after = regex.sub("", text)
+        if after != text:
+            steps.append((word, text, after))
+            text = after
+    return text, steps
+
+
+def _assert_matches_plain_loop(word_list, lines):
+    for line in lines:
+        assert word_list.first_match(line) == _plain_first_match(word_list, line), line
+        steps = []
+        assert (word_list.remove_matches(line, steps), steps) == _plain_remove_matches(word_list, line), line
+
+
+def test_short_lists_run_every_regex():
+    word_list = _word_list(WORDS[: FLEXIBLE_MATCHER_MIN_WORDS - 1])
+    assert word_list.finder is None
+    _assert_matches_plain_loop(word_list, _corpus_lines() + VARIANT_LINES)
+
+
+def test_automaton_matches_plain_loop():
+    word_list = _word_list(WORDS)
+    assert word_list.finder is not None
+    _assert_matches_plain_loop(word_list, _corpus_lines() + VARIANT_LINES)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_automaton_matches_plain_loop_on_random_text(seed):
+    rng = random.Random(seed)
+    alphabet = (
+        list("abcsSkKſßẞσςΣµμİıiIﬀ")
+        + ["K", "ϐ", "β"]
+        + list("یيىکكاآأإهةمنت")
+        + list(" .‌ـً​‪_-–—\t\n\x1c\xa0　")
+    )
+
+    def random_text(length):
+        return "".join(rng.choice(alphabet) for _ in range(length))
+
+    for _ in range(100):
+        words = [random_text(rng.randint(1, 4)).strip() for _ in range(rng.randint(16, 40))]
+        word_list = _word_list([word for word in words if word])
+        if word_list.finder is not None:
+            _assert_matches_plain_loop(word_list, [random_text(rng.randint(0, 30)) for _ in range(20)])
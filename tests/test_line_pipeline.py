@@ -0,0 +1,70 @@
+import os
+
+import pytest
+
+from core import *
+from core import _stop_at_timecode_or_index
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+LINE_OPTIONS = (
+    "remove_alignment_tags",
+    "trim_spaces",
+    "fix_misplaced_chars",
+    "fix_abbreviations",
+    "comma_fixes",
+    "exclamation_fixes",
+    "parentheses_fixes",
+    "question_mark_fixes",
+    "double_quotes_fixes",
+    "dash_fixes",
+    "comments_fixes",
+    "dialog_hyphen_fix",
+    "remove_standalone_dots",
+    "remove_unneeded_spaces",
+    "persian_question_mark_and_comma",
+    "arabic_char_to_persian",
+    "arabic_num_to_persian",
+    "english_num_to_persian",
+    "space_to_invisible_space",
+    "hexre_fixes",
+    "post_trim_spaces",
+    "remove_empty_tags",
+)
+
+RULE_LISTS = {
+    "bypass_list": "Really",
+    "remove_list": "example.com\nSubtitle by",
+    "replace_list": "رضا\nthe",
+}
+
+
+def _run_loop(options, use_pipeline):
+    with open(os.path.join(FIXTURES, "corpus.srt"), encoding="utf-8", newline="") as f:
+        lines = f.readlines()
+    processor = SubtitleProcessor(FIXTURES, dict(DEFAULT_CONFIG, line_cache_entries=0, **options))
+    document = SubtitleDocument(lines)
+    line_record = LineRecord([])
+    loop = processor._run_line_pipeline if use_pipeline else processor._process_lines
+    loop(enumerate(lines, start=1), document, line_record, *processor._compile_rule_lists())
+    return document.lines, line_record.logs, line_record.changed
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"detailed_subtitle_logs": 0}, dict(RULE_LISTS), dict(RULE_LISTS, detailed_subtitle_logs=0)]
+    + [{option: 0} for option in LINE_OPTIONS],
+)
+def test_pipeline_matches_reference_loop(options):
+    assert _run_loop(options, True) == _run_loop(options, False)
+
+
+def test_pipeline_only_has_enabled_stages():
+    options = dict.fromkeys(LINE_OPTIONS + ("bypass_enabled", "remove_enabled", "replace_enabled"), 0)
+    assert build_line_pipeline(options) == ((SIG_ALWAYS, _stop_at_timecode_or_index),)
+
+
+def test_pipelines_are_cached_by_options():
+    options = dict(DEFAULT_CONFIG, dash_fixes=0)
+    assert cached_line_pipeline(options) is cached_line_pipeline(dict(options))
+    assert cached_line_pipeline(options) is not cached_line_pipeline(dict(options, dash_fixes=1))
@@ -0,0 +1,48 @@
+import glob
+import gzip
+import os
+
+from utils import LogSink
+
+
+def _rotated_files(log_file):
+    base, ext = os.path.splitext(log_file)
+    return sorted(glob.glob(f"{base}-*{ext}.gz"))
+
+
+def test_rotates_past_the_limit_of_the_write(tmp_path):
+    sink = LogSink()
+    log_file = str(tmp_path / "Logs" / "process-logs.txt")
+    lines = [f"[2026-01-01 00:00:00] سطر {number}\n" for number in range(50)]
+    sink.write_lines(log_file, lines, rotate_bytes=200)
+    sink.flush()
+
+    rotated = _rotated_files(log_file)
+    assert rotated
+    content = "".join(gzip.open(path, "rt", encoding="utf-8").read() for path in rotated)
+    if os.path.exists(log_file):
+        content += open(log_file, encoding="utf-8").read()
+    assert content == "".join(lines)
+
+
+def test_limits_are_per_write(tmp_path):
+    sink = LogSink()
+    rotated_log = str(tmp_path / "a" / "general-logs.txt")
+    kept_log = str(tmp_path / "b" / "general-logs.txt")
+    for number in range(100):
+        sink.write(rotated_log, f"line {number}\n", rotate_bytes=100)
+        sink.write(kept_log, f"line {number}\n")
+    sink.flush()
+
+    assert _rotated_files(rotated_log)
+    assert not _rotated_files(kept_log)
+    assert len(open(kept_log, encoding="utf-8").readlines()) == 100
+
+
+def test_existing_file_size_counts(tmp_path):
+    log_file = tmp_path / "process-logs.txt"
+    log_file.write_text("x" * 1000 + "\n", encoding="utf-8")
+    sink = LogSink()
+    sink.write(str(log_file), "one more line\n", rotate_bytes=1010)
+    sink.flush()
+    assert len(_rotated_files(str(log_file))) == 1
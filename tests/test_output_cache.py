@@ -0,0 +1,80 @@
+import os
+import shutil
+
+import pytest
+
+import core
+from core import *
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+VTT_TEXT = (
+    "WEBVTT\n\n"
+    "00:00:01.000 --> 00:00:02.500\nسلام دنیا\n\n"
+    "00:00:03.000 --> 00:00:04.000\n- آره\n- نه\n"
+)
+
+
+def _run(folder, cache_dir, **options):
+    os.makedirs(folder)
+    for fixture_name in ("corpus.srt", "persian.cp1256.srt", "german.cp1252.srt"):
+        shutil.copy(os.path.join(FIXTURES, fixture_name), os.path.join(folder, fixture_name))
+    with open(os.path.join(folder, "clip.vtt"), "w", encoding="utf-8") as f:
+        f.write(VTT_TEXT)
+    options = dict(DEFAULT_CONFIG, line_cache_entries=0, output_cache=1, output_cache_dir=str(cache_dir), **options)
+    processor = SubtitleProcessor(str(folder), options)
+    processor.run()
+
+    outputs = {}
+    for name in sorted(os.listdir(os.path.join(folder, "Outputs"))):
+        with open(os.path.join(folder, "Outputs", name), "rb") as f:
+            outputs[name] = f.read()
+    logs = {}
+    for root, _, files in os.walk(os.path.join(folder, "Logs")):
+        for name in files:
+            with open(os.path.join(root, name), encoding="utf-8") as f:
+                # Drop the timestamps, which differ between the runs, and the summary of the cache
+                logs[name] = [line.split("] ", 1)[-1] for line in f if "Output cache:" not in line]
+    return processor, outputs, logs
+
+
+@pytest.mark.parametrize(
+    "mode_options",
+    [{}, {"pipelined_io": 1}, {"parallel_mode": 1, "parallel_backend": "thread", "parallel_workers": 2}],
+)
+def test_cached_run_skips_reading(tmp_path, monkeypatch, mode_options):
+    cache_dir = tmp_path / "cache"
+    first, first_outputs, first_logs = _run(tmp_path / "first", cache_dir, **mode_options)
+    assert first.output_cache_hits == 0
+
+    calls = []
+    for name in ("convert_to_srt_lines", "detect_cached_encoding", "decode_lines"):
+        def counted(*args, name=name, function=getattr(core, name)):
+            calls.append(name)
+            return function(*args)
+
+        monkeypatch.setattr(core, name, counted)
+    second, second_outputs, second_logs = _run(tmp_path / "second", cache_dir, **mode_options)
+
+    assert calls == []
+    assert second.output_cache_hits == 4
+    assert second.successful_count == first.successful_count
+    assert second.total_lines_processed == first.total_lines_processed
+    assert second_outputs == first_outputs
+    assert second_logs == first_logs
+    # The converted SRT file is only written when the input is actually converted
+    assert os.path.exists(tmp_path / "first" / "clip.srt")
+    assert not os.path.exists(tmp_path / "second" / "clip.srt")
+
+
+def test_failed_restore_reads_the_file(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    first, first_outputs, first_logs = _run(tmp_path / "first", cache_dir)
+    # A cached output can disappear after _read_file found it, e.g. when another run trims the cache
+    monkeypatch.setattr(SubtitleProcessor, "_restore_cached_output", lambda self, *args: False)
+    second, second_outputs, second_logs = _run(tmp_path / "second", cache_dir)
+
+    assert second.output_cache_hits == 0
+    assert (second.successful_count, second.failed_count) == (first.successful_count, first.failed_count)
+    assert second_outputs == first_outputs
+    assert second_logs == first_logs
@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+from core import *
+from rule_engine import _token_rule_words
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _corpus_lines():
+    with open(os.path.join(FIXTURES, "corpus.srt"), encoding="utf-8", newline="") as f:
+        return f.readlines()
+
+
+def _probe_lines(rule_list):
+    """Lines built from the literals of the rules, so that every guarded rule gets a line to fire on."""
+    probes = []
+    for rule_pattern, _, is_regex in rule_list:
+        if not is_regex:
+            probes.append(f"x {rule_pattern} y\n")
+            continue
+        word_choices = _token_rule_words(rule_pattern)
+        if word_choices is not None:
+            probes.append(" ".join(words[0] for words in word_choices) + " و\n")
+            continue
+        required_literal, spaceless_literal, _ = analyze_rule_pattern(rule_pattern)
+        for literal in (required_literal, spaceless_literal):
+            if literal:
+                probes.append(f"ببین {literal} !\n")
+    return probes
+
+
+def _plain_steps(text, rule_list):
+    """The per-pattern reference loop of apply_rule_set, recording every rule that changes the text."""
+    steps = []
+    for rule in rule_list:
+        new_text = apply_rule_set(text, [rule])
+        if new_text != text:
+            steps.append((text, new_text))
+            text = new_text
+    return text, steps
+
+
+@pytest.mark.parametrize("option_key", sorted(OPTION_RULE_INDEXES))
+def test_index_matches_plain_rule_loop(option_key):
+    for index in OPTION_RULE_INDEXES[option_key]:
+        rule_list = index._rule_list
+        built = index.build()
+        for line in _corpus_lines() + _probe_lines(rule_list):
+            steps = []
+            assert (built.apply(line, steps), steps) == _plain_steps(line, rule_list), line
+
+
+def test_token_index_dispatches_by_words():
+    index = HEXRE_INDEX.build()
+    assert index.token_rule_ids
+    for words, rule_ids in index.token_rule_ids.items():
+        line = "ببین " + " ".join(words) + " و\n"
+        assert set(rule_ids) <= set(index.candidates(line))
@@ -0,0 +1,37 @@
+import os
+import shutil
+
+import pytest
+
+from core import *
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _run(folder, fixture_name, **options):
+    os.makedirs(folder)
+    shutil.copy(os.path.join(FIXTURES, fixture_name), os.path.join(folder, "input.srt"))
+    processor = SubtitleProcessor(str(folder), dict(DEFAULT_CONFIG, line_cache_entries=0, **options))
+    processor.run()
+
+    logs = {}
+    for root, _, files in os.walk(os.path.join(folder, "Logs")):
+        for name in files:
+            with open(os.path.join(root, name), encoding="utf-8") as f:
+                # Drop the timestamps, which differ between the runs
+                logs[name] = [line.split("] ", 1)[-1] for line in f]
+    return processor, logs
+
+
+@pytest.mark.parametrize("fixture_name", ["corpus.srt", "persian.cp1256.srt", "german.cp1252.srt"])
+@pytest.mark.parametrize("encode_utf8", [1, 0])
+def test_streaming_logs_match_buffered(tmp_path, fixture_name, encode_utf8):
+    # Without UTF-8 output, the RTL marks cannot be encoded in the single-byte code pages and the files fail
+    buffered, buffered_logs = _run(tmp_path / "buffered", fixture_name, encode_utf8=encode_utf8)
+    streamed, streamed_logs = _run(
+        tmp_path / "streamed", fixture_name, encode_utf8=encode_utf8, streaming_mode=1, streaming_window_lines=3
+    )
+
+    assert (streamed.successful_count, streamed.failed_count) == (buffered.successful_count, buffered.failed_count)
+    assert streamed_logs == buffered_logs
+    assert os.path.exists(tmp_path / "streamed" / "Outputs" / "input_Edited.srt") == bool(buffered.successful_count)
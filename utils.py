@@ -4,6 +4,10 @@ import threading
 import json
 import datetime
 import platform
+import queue
+import gzip
+import shutil
+import atexit
 
 
 # --- Single Instance Logic START with Timeout ---
@@ -57,6 +61,155 @@ class AppLock:
 # --- Single Instance Logic END with Timeout ---
 
 
+_timestamp_cache = (None, "")
+
+
+def log_timestamp():
+    """Returns the current log timestamp; it is only formatted again when the second changes."""
+    global _timestamp_cache
+    now = int(time.time())
+    cached_second, cached_text = _timestamp_cache
+    if now != cached_second:
+        cached_text = datetime.datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S")
+        _timestamp_cache = (now, cached_text)
+    return cached_text
+
+
+def log_rotate_bytes(options):
+    """Returns the size at which the general and process logs are rotated, from "log_rotate_mb"; 0 disables it."""
+    return int(float(options.get("log_rotate_mb", 0)) * 1024 * 1024)
+
+
+class LogSink:
+    """
+    Appends log lines to files from a single background writer thread.
+    Files stay open with buffered handles while log lines keep coming, and are closed once the sink
+    has been idle for a moment, on flush() and at exit. Lines written with a rotate_bytes limit (general
+    and process logs) make their file be compressed to a .gz next to it once it grows past the limit;
+    0 disables rotation. The sizes are counted as lines are written, so the buffers are never flushed
+    early to measure them.
+    """
+
+    IDLE_SECONDS = 0.5
+    MAX_OPEN_FILES = 32
+    # Number of log lines joined into one chunk for the writer thread
+    CHUNK_ENTRIES = 1000
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        # Also called in forked worker processes, which do not inherit the writer thread
+        self._queue = queue.Queue()
+        self._handles = {}
+        self._sizes = {}
+        self._thread = None
+        self._thread_lock = threading.Lock()
+
+    def _start(self):
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def write(self, log_file, text, error_label="Logging failed", rotate_bytes=0):
+        """Queues text (one or more complete lines) to be appended to log_file, rotating it past rotate_bytes."""
+        self._start()
+        self._queue.put((log_file, text, error_label, rotate_bytes))
+
+    def write_lines(self, log_file, lines, error_label="Logging failed", rotate_bytes=0):
+        """Queues an iterable of complete lines in chunks, so large logs are never joined at once."""
+        chunk = []
+        for line in lines:
+            chunk.append(line)
+            if len(chunk) >= self.CHUNK_ENTRIES:
+                self.write(log_file, "".join(chunk), error_label, rotate_bytes)
+                chunk = []
+        if chunk:
+            self.write(log_file, "".join(chunk), error_label, rotate_bytes)
+
+    def write_entries(self, log_file, entries, error_label="Logging failed", rotate_bytes=0):
+        """Queues (timestamp, message) pairs, e.g. a TimestampedLogBuffer, as formatted log lines."""
+        self.write_lines(
+            log_file, (f"[{timestamp}] {message}\n" for timestamp, message in entries), error_label, rotate_bytes
+        )
+
+    def flush(self):
+        """Blocks until every queued line is written, then closes the open files."""
+        if self._thread is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def _run(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=self.IDLE_SECONDS)
+            except queue.Empty:
+                self._close_handles()
+                continue
+            if isinstance(item, threading.Event):
+                self._close_handles()
+                item.set()
+                continue
+
+            log_file, text, error_label, rotate_bytes = item
+            try:
+                handle = self._handle(log_file)
+                handle.write(text)
+                if rotate_bytes:
+                    # Size on disk once the buffer is written: UTF-8 bytes, with newlines translated
+                    size = len(text) if text.isascii() else len(text.encode("utf-8"))
+                    if os.linesep != "\n":
+                        size += text.count("\n") * (len(os.linesep) - 1)
+                    size = self._sizes[log_file] = self._sizes[log_file] + size
+                    if size >= rotate_bytes:
+                        self._rotate(log_file)
+            except Exception as e:
+                print(f"{error_label}: {e}")
+
+    def _handle(self, log_file):
+        handle = self._handles.get(log_file)
+        if handle is None:
+            if len(self._handles) >= self.MAX_OPEN_FILES:
+                self._close_handles()
+            os.makedirs(os.path.dirname(log_file), exist_ok=True)
+            handle = self._handles[log_file] = open(log_file, "a", encoding="utf-8")
+            self._sizes[log_file] = os.fstat(handle.fileno()).st_size
+        return handle
+
+    def _close_handles(self):
+        handles, self._handles = self._handles, {}
+        self._sizes = {}
+        for log_file, handle in handles.items():
+            try:
+                handle.close()
+            except Exception as e:
+                print(f"Logging failed: {e}")
+
+    def _rotate(self, log_file):
+        self._handles.pop(log_file).close()
+        del self._sizes[log_file]
+        base, ext = os.path.splitext(log_file)
+        stamp = datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
+        rotated_file = f"{base}-{stamp}{ext}.gz"
+        counter = 1
+        while os.path.exists(rotated_file):
+            counter += 1
+            rotated_file = f"{base}-{stamp}-{counter}{ext}.gz"
+        with open(log_file, "rb") as source, gzip.open(rotated_file, "wb") as target:
+            shutil.copyfileobj(source, target)
+        os.remove(log_file)
+
+
+# Shared sink for every log file the application writes
+LOG_SINK = LogSink()
+atexit.register(LOG_SINK.flush)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=LOG_SINK._reset)
+
+
 class Logger:
     @staticmethod
     def get_system_info():
@@ -69,55 +222,31 @@ class Logger:
         return info
 
     @staticmethod
-    def log(message, folder_path, enabled):
+    def log(message, folder_path, enabled, rotate_bytes=0):
         if not enabled and "disabled" not in message.lower():
             return
 
         if not folder_path or not os.path.isdir(folder_path):
             return
 
-        log_dir = os.path.join(folder_path, "Logs")
-        os.makedirs(log_dir, exist_ok=True)
-        log_file = os.path.join(log_dir, "general-logs.txt")
-
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        try:
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(f"[{timestamp}] {message}\n")
-        except Exception as e:
-            print(f"Logging failed: {e}")
+        log_file = os.path.join(folder_path, "Logs", "general-logs.txt")
+        LOG_SINK.write(log_file, f"[{log_timestamp()}] {message}\n", "Logging failed", rotate_bytes)
 
     @staticmethod
-    def log_process(message, folder_path):
+    def log_process(message, folder_path, rotate_bytes=0):
         if not folder_path or not os.path.isdir(folder_path):
             return
 
-        log_dir = os.path.join(folder_path, "Logs")
-        os.makedirs(log_dir, exist_ok=True)
-        log_file = os.path.join(log_dir, "process-logs.txt")
-
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        try:
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(f"[{timestamp}] {message}\n")
-        except Exception as e:
-            print(f"Process logging failed: {e}")
+        log_file = os.path.join(folder_path, "Logs", "process-logs.txt")
+        LOG_SINK.write(log_file, f"[{log_timestamp()}] {message}\n", "Process logging failed", rotate_bytes)
 
     @staticmethod
     def log_subtitle_change(folder_path, filename, message):
         if not folder_path or not os.path.isdir(folder_path):
             return
 
-        log_dir = os.path.join(folder_path, "Logs", "Subtitle-Logs")
-        os.makedirs(log_dir, exist_ok=True)
-        log_file = os.path.join(log_dir, f"{filename}_changelogs.txt")
-
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        try:
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(f"[{timestamp}] {message}\n")
-        except Exception as e:
-            print(f"Subtitle detailed logging failed: {e}")
+        log_file = os.path.join(folder_path, "Logs", "Subtitle-Logs", f"{filename}_changelogs.txt")
+        LOG_SINK.write(log_file, f"[{log_timestamp()}] {message}\n", "Subtitle detailed logging failed")
 
 
 class ConfigManager: